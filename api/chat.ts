@@ -1,5 +1,7 @@
 import { GoogleGenerativeAI } from '@google/generative-ai';
 import { kv } from '@vercel/kv';
+import searchIndexData from '../src/data/searchIndex.json';
+import { loadSearchIndex, formatPassages, type SearchIndexData } from '../src/utils/searchIndex';
 
 export const config = {
     runtime: 'edge', // Use Edge runtime for better performance
@@ -7,6 +9,22 @@ export const config = {
 
 const API_KEY = process.env.GEMINI_API_KEY;
 
+// =============================================================================
+// RETRIEVAL: BM25 index over collected intel (built by the scraper pipeline)
+// =============================================================================
+// Loaded once per isolate; each question pulls only the top-k matching
+// passages into the prompt instead of whole data files.
+const SEARCH_TOP_K = 5;
+const searchIndex = loadSearchIndex(searchIndexData as SearchIndexData);
+
+function buildGroundedMessage(message: string): string {
+    const hits = searchIndex.search(message, SEARCH_TOP_K);
+    if (hits.length === 0) {
+        return message;
+    }
+    return `Relevant collected intel (cite by number when used):\n\n${formatPassages(hits)}\n\nQuestion: ${message}`;
+}
+
 // =============================================================================
 // SECURITY: Rate Limiting (Vercel KV - Persistent Redis)
 // =============================================================================
@@ -140,7 +158,7 @@ export default async function handler(req: Request) {
             },
         });
 
-        const result = await chat.sendMessage(message);
+        const result = await chat.sendMessage(buildGroundedMessage(message));
         const response = await result.response;
         const text = response.text();
 
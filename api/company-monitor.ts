@@ -1,63 +1,38 @@
 import { XMLParser } from 'fast-xml-parser';
+import snapshotData from '../src/data/companyMonitor.json';
+import type { CompanyMonitorData, HealthResult, NewsArticle } from '../src/hooks/useCompanyMonitor';
+import { entityMatcher } from '../src/utils/entityMatcher';
 
 export const config = {
     runtime: 'edge',
 };
 
-// ── Company registry (mirrors data/index.ts + grainTechEntities.ts) ──
-// We keep a lightweight copy here because Edge functions can't import React modules.
-const COMPANIES: { name: string; url: string; searchTerms?: string }[] = [
-    { name: 'Cgrain', url: 'https://www.cgrain.ai', searchTerms: 'Cgrain grain' },
-    { name: 'FOSS', url: 'https://www.fossanalytics.com', searchTerms: 'FOSS EyeFoss grain' },
-    { name: 'Videometer', url: 'https://videometer.com', searchTerms: 'Videometer seed grain' },
-    { name: 'Zeutec', url: 'https://spectraalyzer.com', searchTerms: 'Zeutec SpectraAlyzer grain' },
-    { name: 'QualySense', url: 'https://www.qualysense.com', searchTerms: 'QualySense grain' },
-    { name: 'ZoomAgri', url: 'https://zoomagri.com', searchTerms: 'ZoomAgri grain' },
-    { name: 'GoMicro', url: 'https://www.gomicro.co', searchTerms: 'GoMicro grain' },
-    { name: 'Cropify', url: 'https://www.cropify.io', searchTerms: 'Cropify grain grading' },
-    { name: 'Deimos Laboratory', url: 'https://deimos.com.au', searchTerms: 'Deimos Laboratory grain' },
-    { name: 'Ground Truth Ag', url: 'https://groundtruth.ag', searchTerms: 'Ground Truth Ag grain' },
-    { name: 'Vibe Imaging Analytics', url: 'https://www.vibeia.com', searchTerms: 'Vibe Imaging grain' },
-    { name: 'SuperGeo AI', url: 'https://sga.ai', searchTerms: 'SuperGeo AI grain grading' },
-    { name: 'Grain Discovery', url: 'https://www.graindiscovery.com', searchTerms: 'Grain Discovery quality' },
-    { name: 'Inarix', url: 'https://www.inarix.com', searchTerms: 'Inarix PocketLab grain' },
-    { name: 'AgSure', url: 'https://www.agsure.in', searchTerms: 'AgSure grain analyzer India' },
-    { name: 'Nebulaa', url: 'https://neo.nebulaa.in', searchTerms: 'Nebulaa MATT grain analyzer' },
-    { name: 'GrainSense', url: 'https://grainsense.com', searchTerms: 'GrainSense NIR grain' },
-    { name: 'Keyetech', url: 'https://en.keyetech.com', searchTerms: 'Keyetech grain analyzer' },
-    { name: 'EasyODM', url: 'https://easyodm.tech', searchTerms: 'EasyODM grain analysis' },
-    { name: 'Upjao', url: 'https://upjao.ai', searchTerms: 'Upjao grain quality AI' },
-    { name: 'Grainkart', url: 'https://www.grainscope.ai', searchTerms: 'GrainScope AI grain' },
-    { name: 'Platypus Vision', url: 'https://www.platypusvision.com', searchTerms: 'Platypus Vision grain' },
-];
-
-// ── Types ──
-interface HealthResult {
-    status: number | null;
-    responseMs: number;
-    online: boolean;
-}
-
-interface NewsArticle {
-    title: string;
-    url: string;
-    date: string;
-    source: string;
-}
-
-interface CompanyMonitorResponse {
-    updatedAt: string;
-    health: Record<string, HealthResult>;
-    news: Record<string, { articles: NewsArticle[] }>;
-}
+// ── Snapshot ──
+// Written by the scraper's monitor stage (python -m src.company_monitor):
+// site health probes with p50/p95 latency history and the latest headlines
+// for every company in scripts/scraper/config/entities.yaml. Serving it
+// statically keeps this endpoint from fanning out to 40+ external requests
+// per visitor.
+const snapshot = snapshotData as CompanyMonitorData;
+const body = JSON.stringify(snapshot);
+
+// ── Live fallback ──
+// Until the first snapshot has been committed (fresh deploy), probe live as
+// this endpoint used to, with the same company list and tagging.
+const COMPANIES: { id: string; name: string; url: string; searchTerms?: string }[] = entityMatcher.companies
+    .filter((company) => company.url)
+    .map((company) => ({
+        id: company.id,
+        name: company.name,
+        url: company.url as string,
+        searchTerms: company.search_terms,
+    }));
 
-// ── XML Parser ──
 const parser = new XMLParser({
     ignoreAttributes: false,
     attributeNamePrefix: '@_',
 });
 
-// ── Health Check ──
 async function checkHealth(url: string): Promise<HealthResult> {
     const start = Date.now();
     try {
@@ -86,8 +61,7 @@ async function checkHealth(url: string): Promise<HealthResult> {
     }
 }
 
-// ── Google News RSS Search ──
-async function fetchCompanyNews(searchTerms: string): Promise<NewsArticle[]> {
+async function fetchCompanyNews(companyId: string, searchTerms: string): Promise<NewsArticle[]> {
     try {
         const controller = new AbortController();
         const timeout = setTimeout(() => controller.abort(), 8000);
@@ -114,7 +88,12 @@ async function fetchCompanyNews(searchTerms: string): Promise<NewsArticle[]> {
                 ? [channel.item]
                 : [];
 
-        return items.slice(0, 3).map((item: Record<string, string>) => ({
+        // Prefer headlines that actually name the company or one of its products
+        const mentioning = items.filter((item: Record<string, string>) =>
+            entityMatcher.companyIds(item.title || '').includes(companyId)
+        );
+
+        return (mentioning.length > 0 ? mentioning : items).slice(0, 3).map((item: Record<string, string>) => ({
             title: (item.title || '').replace(/ - [^-]+$/, ''), // Strip " - Source Name" suffix
             url: item.link || '',
             date: item.pubDate
@@ -127,51 +106,52 @@ async function fetchCompanyNews(searchTerms: string): Promise<NewsArticle[]> {
     }
 }
 
-// ── Main Handler ──
-export default async function handler() {
-    try {
-        // Run health checks and news fetches in parallel
-        const [healthResults, newsResults] = await Promise.all([
-            // Health checks for all companies
-            Promise.allSettled(
-                COMPANIES.map(async (company) => ({
-                    name: company.name,
-                    result: await checkHealth(company.url),
-                }))
-            ),
-            // News fetches for all companies
-            Promise.allSettled(
-                COMPANIES.map(async (company) => ({
-                    name: company.name,
-                    articles: await fetchCompanyNews(
-                        company.searchTerms || company.name
-                    ),
-                }))
-            ),
-        ]);
-
-        // Build response
-        const response: CompanyMonitorResponse = {
-            updatedAt: new Date().toISOString(),
-            health: {},
-            news: {},
-        };
-
-        for (const result of healthResults) {
-            if (result.status === 'fulfilled') {
-                response.health[result.value.name] = result.value.result;
-            }
+async function probeLive(): Promise<CompanyMonitorData> {
+    const [healthResults, newsResults] = await Promise.all([
+        Promise.allSettled(COMPANIES.map(async (company) => ({
+            name: company.name,
+            result: await checkHealth(company.url),
+        }))),
+        Promise.allSettled(COMPANIES.map(async (company) => ({
+            name: company.name,
+            articles: await fetchCompanyNews(company.id, company.searchTerms || company.name),
+        }))),
+    ]);
+
+    const response: CompanyMonitorData = {
+        updatedAt: new Date().toISOString(),
+        health: {},
+        news: {},
+    };
+    for (const result of healthResults) {
+        if (result.status === 'fulfilled') {
+            response.health[result.value.name] = result.value.result;
         }
-
-        for (const result of newsResults) {
-            if (result.status === 'fulfilled') {
-                response.news[result.value.name] = {
-                    articles: result.value.articles,
-                };
-            }
+    }
+    for (const result of newsResults) {
+        if (result.status === 'fulfilled') {
+            response.news[result.value.name] = { articles: result.value.articles };
         }
+    }
+    return response;
+}
+
+// ── Main Handler ──
+export default async function handler() {
+    if (snapshot.updatedAt) {
+        return new Response(body, {
+            status: 200,
+            headers: {
+                'Content-Type': 'application/json',
+                // The snapshot only changes on deploy: cache at the CDN for 1 hour, serve stale for a day while revalidating
+                'Cache-Control': 's-maxage=3600, stale-while-revalidate=86400',
+                'Access-Control-Allow-Origin': '*',
+            },
+        });
+    }
 
-        return new Response(JSON.stringify(response), {
+    try {
+        return new Response(JSON.stringify(await probeLive()), {
             status: 200,
             headers: {
                 'Content-Type': 'application/json',
@@ -1,4 +1,5 @@
 import type { VercelRequest, VercelResponse } from '@vercel/node';
+import { entityMatcher } from '../../src/utils/entityMatcher';
 
 interface RSSItem {
     title: string;
@@ -15,6 +16,7 @@ interface NewsItem {
     summary: string;
     url: string;
     category: string;
+    companyTags: string[];
 }
 
 // Grain-focused RSS feeds
@@ -100,6 +102,8 @@ export default async function handler(
                 summary: item.description || '',
                 url: item.link,
                 category: feed.category,
+                // Same tagging as curatedNews.json (scripts/scraper/config/entities.yaml)
+                companyTags: entityMatcher.companyIds(`${item.title} ${item.description || ''}`),
             }));
         });
 
@@ -0,0 +1,260 @@
+"""
+Backfill Agent - Walk paginated feed archives back to a target date.
+
+The nightly scout reads only the first page of each feed. WordPress feeds
+(most of ours) also serve older entries at ?paged=2, 3, ...; backfill walks
+those pages until it reaches a page whose entries are all older than the
+target date, so a new source or a missed stretch of nights can be filled in.
+
+Sources are walked in parallel. Within a source, pages are fetched in
+windows of up to `per_host` concurrent requests, and a shared per-host
+semaphore keeps sources on the same host within that limit too. After each
+window, the new articles go into the trend aggregates (the same
+incremental, link-deduplicated store the nightly run updates). The
+source's next page is checkpointed in data/state/backfill.json, so an
+interrupted backfill resumes where it stopped.
+
+The counts land in src/data/trendCubes.json and the export in
+src/data/trendAggregates.json. The nightly job builds on the committed
+cubes, so a backfill reaches CI once both files are committed and pushed;
+pull first so the run starts from the latest nightly cubes.
+
+A source stops at the first page that is missing (404 or error), empty,
+identical to the previous page (the feed ignores `paged`), or entirely
+older than the target date.
+
+Usage:
+    python -m src.agents.backfill --since 2025-01-01
+    python -m src.agents.backfill --since 2025-06-01 --sources "GrainsWest Magazine" --per-host 2
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from src.state import load_state, save_state
+from src.sources.fetcher import Fetcher
+from src.sources.host_health import HostHealth
+from src.agents.scout import collect_sources, load_sources_config, parse_feed
+from src.trend_aggregates import TrendAggregator, write_trends
+from src.transform_to_curated import score_articles
+
+logger = logging.getLogger(__name__)
+
+STATE_FILE = 'backfill.json'
+
+# Feeds that don't paginate (Google Alerts, News searches)
+DEFAULT_SKIP_HOSTS = ['www.google.com', 'news.google.com']
+
+
+def page_url(url: str, page: int) -> str:
+    """The feed URL for archive page `page` (1 is the feed itself)."""
+    if page <= 1:
+        return url
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k != 'paged']
+    query.append(('paged', str(page)))
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def _published(article: Dict[str, Any]) -> datetime:
+    return datetime.fromisoformat(article['published']).replace(tzinfo=None)
+
+
+class Backfill:
+    """Parallel, checkpointed walk of paginated feed archives."""
+
+    def __init__(
+        self,
+        since: datetime,
+        fetcher: Fetcher,
+        aggregator: TrendAggregator,
+        workers: int = 4,
+        per_host: int = 2,
+        max_pages: int = 100,
+        skip_hosts: Optional[List[str]] = None,
+    ):
+        self.since = since
+        self.fetcher = fetcher
+        self.aggregator = aggregator
+        self.workers = workers
+        self.per_host = per_host
+        self.max_pages = max_pages
+        self.skip_hosts = set(DEFAULT_SKIP_HOSTS if skip_hosts is None else skip_hosts)
+
+        self._lock = threading.Lock()
+        self._host_slots: Dict[str, threading.Semaphore] = {}
+
+        # Checkpoints are kept per target date: a deeper backfill starts over
+        self.state = load_state(STATE_FILE, {'runs': {}})
+        self.progress: Dict[str, Dict[str, Any]] = (
+            self.state.setdefault('runs', {}).setdefault(since.date().isoformat(), {})
+        )
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], since: datetime, fetcher: Fetcher,
+                    aggregator: TrendAggregator, **overrides: Any) -> 'Backfill':
+        """Build from the `backfill` section of sources.yaml; keyword overrides win."""
+        backfill_config = config.get('backfill', {}) or {}
+        options = {
+            'workers': backfill_config.get('workers', 4),
+            'per_host': backfill_config.get('per_host', 2),
+            'max_pages': backfill_config.get('max_pages', 100),
+            'skip_hosts': backfill_config.get('skip_hosts'),
+        }
+        options.update({k: v for k, v in overrides.items() if v is not None})
+        return cls(since, fetcher, aggregator, **options)
+
+    def eligible(self, source: Dict[str, Any]) -> bool:
+        return source['type'] == 'rss' and urlsplit(source['url']).netloc not in self.skip_hosts
+
+    def _fetch_page(self, url: str) -> Optional[Tuple[bytes, Dict[str, str]]]:
+        host = urlsplit(url).netloc
+        with self._lock:
+            slots = self._host_slots.setdefault(host, threading.Semaphore(self.per_host))
+        with slots:
+            result = self.fetcher.fetch(url)
+        return (result.content, result.headers) if result else None
+
+    def _checkpoint(self, source: Dict[str, Any], next_page: int, done: bool, articles: List[Dict[str, Any]]) -> None:
+        """Store a window's articles and the source's progress together."""
+        with self._lock:
+            entry = self.progress.setdefault(source['url'], {'name': source['name'], 'articles': 0})
+            entry.update(next_page=next_page, done=done, updated_at=datetime.now().isoformat(timespec='seconds'))
+            entry['articles'] += len(articles)
+            # Only what the nightly run would count: articles with relevance > 0
+            relevant = score_articles(articles)
+            if relevant:
+                self.aggregator.add(relevant)
+                self.aggregator.save()
+            save_state(STATE_FILE, self.state)
+
+    def walk(self, source: Dict[str, Any]) -> int:
+        """Backfill one source. Returns the number of in-range articles found."""
+        entry = self.progress.get(source['url'], {})
+        if entry.get('done'):
+            logger.info(f"  ✓ {source['name']}: already backfilled to {self.since.date()}")
+            return 0
+
+        page = entry.get('next_page', 1)
+        found = 0
+        previous_links: Optional[set] = None
+        pool = ThreadPoolExecutor(max_workers=self.per_host)
+
+        try:
+            while page <= self.max_pages:
+                window = list(range(page, min(page + self.per_host, self.max_pages + 1)))
+                pages = list(pool.map(lambda n: self._fetch_page(page_url(source['url'], n)), window))
+
+                in_range: List[Dict[str, Any]] = []
+                done = False
+                for n, fetched in zip(window, pages):
+                    articles = parse_feed(fetched[0], fetched[1], source['name'], source['category']) if fetched else []
+                    links = {a['link'] for a in articles}
+                    if not articles or links == previous_links:
+                        done = True
+                        break
+                    previous_links = links
+                    page = n + 1
+
+                    recent = [a for a in articles if _published(a) >= self.since]
+                    in_range.extend(recent)
+                    if not recent:
+                        done = True
+                        break
+
+                found += len(in_range)
+                self._checkpoint(source, page, done or page > self.max_pages, in_range)
+                if done:
+                    break
+        finally:
+            pool.shutdown(wait=True)
+
+        logger.info(f"  -> {source['name']}: {found} articles back to {self.since.date()} ({page - 1} pages)")
+        return found
+
+    def run(self, sources: List[Dict[str, Any]]) -> Dict[str, Any]:
+        sources = [s for s in sources if self.eligible(s)]
+        logger.info(f"⏪ Backfilling {len(sources)} feeds to {self.since.date()} "
+                    f"({self.workers} sources at a time, {self.per_host} pages per host)")
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            counts = dict(zip((s['name'] for s in sources), pool.map(self.walk, sources)))
+
+        return {
+            'since': self.since.date().isoformat(),
+            'sources': counts,
+            'articles': sum(counts.values()),
+            'incomplete': [e['name'] for e in self.progress.values() if not e.get('done')],
+        }
+
+
+def run_backfill(
+    since: datetime,
+    source_names: Optional[List[str]] = None,
+    restart: bool = False,
+    **overrides: Any,
+) -> Dict[str, Any]:
+    """Backfill the configured feeds and rewrite the trend export."""
+    config = load_sources_config()
+    health = HostHealth.from_config(config)
+    aggregator = TrendAggregator.from_config(config)
+    if since.date() < aggregator.today - timedelta(weeks=aggregator.retention_weeks):
+        logger.warning(f"⚠️ {since.date()} is older than trends.retention_weeks ({aggregator.retention_weeks}); "
+                       f"weeks past the window are pruned on save")
+    backfill = Backfill.from_config(config, since, Fetcher(health=health), aggregator, **overrides)
+    if restart:
+        backfill.progress.clear()
+
+    sources = collect_sources(config)
+    if source_names:
+        sources = [s for s in sources if s['name'] in source_names]
+
+    summary = backfill.run(sources)
+    health.save()
+
+    trends_config = config.get('trends', {}) or {}
+    write_trends(aggregator.export(
+        weeks=trends_config.get('export_weeks', 52),
+        top_n=trends_config.get('top_n', 30),
+    ))
+
+    logger.info(f"⏪ Backfill done: {summary['articles']} articles from {len(summary['sources'])} feeds")
+    if summary['incomplete']:
+        logger.info(f"   Incomplete (re-run to resume): {', '.join(summary['incomplete'])}")
+    logger.info(f"   Commit and push {aggregator.cubes_path.name} and trendAggregates.json so the nightly run keeps it")
+    return summary
+
+
+def main():
+    import argparse
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    arg_parser = argparse.ArgumentParser(description='Backfill paginated feed archives into the trend aggregates.')
+    arg_parser.add_argument('--since', required=True, type=datetime.fromisoformat,
+                            help='Target date (YYYY-MM-DD): walk back until pages are older than this.')
+    arg_parser.add_argument('--sources', nargs='+', default=None, metavar='NAME',
+                            help='Only these sources (by name).')
+    arg_parser.add_argument('--workers', type=int, default=None, help='Sources walked in parallel.')
+    arg_parser.add_argument('--per-host', type=int, default=None, help='Concurrent page requests per host.')
+    arg_parser.add_argument('--max-pages', type=int, default=None, help='Page limit per source.')
+    arg_parser.add_argument('--restart', action='store_true',
+                            help='Ignore checkpoints for this target date and start from page 1.')
+    args = arg_parser.parse_args()
+
+    run_backfill(
+        since=args.since,
+        source_names=args.sources,
+        restart=args.restart,
+        workers=args.workers,
+        per_host=args.per_host,
+        max_pages=args.max_pages,
+    )
+
+
+if __name__ == '__main__':
+    main()
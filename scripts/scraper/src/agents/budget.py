@@ -0,0 +1,108 @@
+"""
+Run Budget - Deadline-driven work scheduling for the Scout agent.
+
+Work is grouped into tiers ordered by value. Each tier needs a little more
+headroom before the deadline than the tier above it, so as time runs out the
+cheapest-to-lose work (enrichment, then alert searches, then ordinary feeds)
+is skipped first. A fixed reserve is always left for curation and output.
+"""
+
+import logging
+import math
+import time
+from typing import Callable, Dict, Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+TIER_HIGH_PRIORITY_FEEDS = 'high_priority_feeds'
+TIER_COMPANY_FEEDS = 'company_feeds'
+TIER_FEEDS = 'feeds'
+TIER_ALERT_SEARCHES = 'alert_searches'
+TIER_ENRICHMENT = 'enrichment'
+
+# Highest value first
+TIER_ORDER = [
+    TIER_HIGH_PRIORITY_FEEDS,
+    TIER_COMPANY_FEEDS,
+    TIER_FEEDS,
+    TIER_ALERT_SEARCHES,
+    TIER_ENRICHMENT,
+]
+
+# Seconds of headroom (on top of the reserve) a tier needs to start new work
+DEFAULT_HEADROOM_SECONDS = {
+    TIER_HIGH_PRIORITY_FEEDS: 0,
+    TIER_COMPANY_FEEDS: 30,
+    TIER_FEEDS: 60,
+    TIER_ALERT_SEARCHES: 120,
+    TIER_ENRICHMENT: 180,
+}
+
+
+def source_tier(source: Dict[str, Any]) -> str:
+    """Budget tier for a feed/scrape source entry."""
+    if source.get('priority') == 'high':
+        return TIER_HIGH_PRIORITY_FEEDS
+    if source.get('group') in ('company', 'company_feeds') or source.get('category') == 'company':
+        return TIER_COMPANY_FEEDS
+    return TIER_FEEDS
+
+
+class RunBudget:
+    """Tracks time left before the run deadline and records skipped work."""
+
+    def __init__(
+        self,
+        deadline_seconds: Optional[float] = None,
+        reserve_seconds: float = 180,
+        headroom_seconds: Optional[Dict[str, float]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.deadline_seconds = deadline_seconds
+        self.reserve_seconds = reserve_seconds
+        self.headroom = {**DEFAULT_HEADROOM_SECONDS, **(headroom_seconds or {})}
+        self.clock = clock
+        self.started = clock()
+        self.skipped: Dict[str, List[str]] = {}
+        self._exhausted_logged = set()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], deadline_minutes: Optional[float] = None) -> 'RunBudget':
+        """Build from the `budget` section of sources.yaml (CLI value wins)."""
+        budget_config = config.get('budget', {}) or {}
+        minutes = deadline_minutes if deadline_minutes is not None else budget_config.get('deadline_minutes')
+        return cls(
+            deadline_seconds=minutes * 60 if minutes else None,
+            reserve_seconds=budget_config.get('reserve_minutes', 3) * 60,
+            headroom_seconds=budget_config.get('headroom_seconds'),
+        )
+
+    def elapsed(self) -> float:
+        return self.clock() - self.started
+
+    def remaining(self) -> float:
+        """Seconds left before the deadline (infinite without a deadline)."""
+        if not self.deadline_seconds:
+            return math.inf
+        return self.deadline_seconds - self.elapsed()
+
+    def allows(self, tier: str) -> bool:
+        """True if there is still time to start new work in this tier."""
+        allowed = self.remaining() > self.reserve_seconds + self.headroom.get(tier, 0)
+        if not allowed and tier not in self._exhausted_logged:
+            self._exhausted_logged.add(tier)
+            logger.warning(f"⏱️ Budget: {self.remaining():.0f}s left, skipping remaining {tier} work")
+        return allowed
+
+    def skip(self, tier: str, name: str) -> None:
+        """Record a unit of work dropped for lack of time."""
+        self.skipped.setdefault(tier, []).append(name)
+
+    def summary(self) -> Dict[str, Any]:
+        """Budget outcome for the run report."""
+        return {
+            'deadline_seconds': self.deadline_seconds,
+            'elapsed_seconds': round(self.elapsed(), 1),
+            'skipped': {tier: names for tier, names in self.skipped.items()},
+            'complete': not self.skipped,
+        }
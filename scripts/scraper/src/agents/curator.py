@@ -1,33 +1,38 @@
 """
 Curator Agent - AI-powered article relevance scoring and curation.
 
-Uses Gemini to score articles for grain industry relevance and generate summaries.
+Uses Gemini to score articles for grain industry relevance. Summaries come
+from the local extractive summarizer (src/summarizer.py) unless
+`summarizer: gemini` asks Gemini for them too.
 """
 
 import json
 import logging
 import os
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
+from src.entities import PRIORITY_POINTS, get_matcher
+from src.lazy import lazy_import
+from src.summarizer import ExtractiveSummarizer
+
+# The SDK is only imported when an article is actually scored with Gemini
+genai = lazy_import('google.generativeai')
+
 logger = logging.getLogger(__name__)
 
-# Relevance keywords for scoring (fallback if Gemini unavailable)
+GEMINI_MODEL = 'gemini-2.0-flash'
+
+# Relevance keywords for scoring (fallback if Gemini unavailable).
+# Tracked company and product names come from the entity registry
+# (config/entities.yaml) and score by their priority.
 HIGH_VALUE_KEYWORDS = [
     # Core grain-tech terms
     'grain grading', 'grain quality', 'grain inspection', 'wheat testing',
     'barley testing', 'NIR analysis', 'machine vision grain', 'kernel analysis',
     'grain sorting', 'cereal inspection', 'grain analyzer', 'seed analysis',
-    # Tracked company names
-    'Cgrain', 'FOSS', 'GrainSense', 'Videometer', 'Zeutec', 'ZoomAgri',
-    'QualySense', 'GoMicro', 'AgSure', 'Nebulaa', 'SuperGeo', 'Inarix',
-    'Vibe Imaging', 'EasyODM', 'Cropify', 'Deimos Laboratory',
-    'Ground Truth Ag', 'Upjao', 'Grainkart', 'Keyetech',
-    'Grain Discovery', 'Platypus Vision', 'Shandong Hongsheng',
-    # Tracked product names
-    'EyeFoss', 'SeedLab', 'SeedSorter', 'SpectraAlyzer', 'MATT Grain',
-    'QSorter', 'GrainScope', 'Indyn', 'PocketLab', 'QM3i',
 ]
 
 MEDIUM_VALUE_KEYWORDS = [
@@ -51,6 +56,9 @@ def calculate_keyword_score(text: str) -> int:
     text_lower = text.lower()
     score = 0
     
+    for entity in get_matcher().match(text):
+        score += PRIORITY_POINTS.get(entity['priority'], 0)
+    
     for keyword in HIGH_VALUE_KEYWORDS:
         if keyword.lower() in text_lower:
             score += 20
@@ -66,18 +74,34 @@ def calculate_keyword_score(text: str) -> int:
     return min(score, 100)  # Cap at 100
 
 
-def score_with_gemini(article: Dict[str, Any], api_key: str) -> Optional[Dict[str, Any]]:
+@lru_cache(maxsize=1)
+def get_summarizer() -> ExtractiveSummarizer:
+    """Extractive summarizer biased towards the relevance keywords."""
+    keywords = {k: 1 for k in LOW_VALUE_KEYWORDS}
+    keywords.update({k: 2 for k in MEDIUM_VALUE_KEYWORDS})
+    keywords.update({k: 3 for k in HIGH_VALUE_KEYWORDS})
+    return ExtractiveSummarizer(keywords)
+
+
+@lru_cache(maxsize=4)
+def get_gemini_model(api_key: str, model_name: str = GEMINI_MODEL):
+    """Configured Gemini model, created once and reused for every article."""
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel(model_name)
+
+
+def score_with_gemini(article: Dict[str, Any], api_key: str, summarize: bool = True) -> Optional[Dict[str, Any]]:
     """
-    Use Gemini to score article relevance and generate summary.
+    Use Gemini to score article relevance and, if `summarize`, generate a summary.
     
-    Returns dict with 'score' (0-100) and 'summary' (string).
+    Returns dict with 'score' (0-100) and 'summary' (string, None when not requested).
     """
     try:
-        import google.generativeai as genai
-        genai.configure(api_key=api_key)
-        
-        model = genai.GenerativeModel('gemini-2.0-flash')
+        model = get_gemini_model(api_key)
         
+        # Without a summary to write, the response is a few tokens long
+        summary_field = (',\n  "summary": "<1-2 sentence summary focusing on grain industry relevance>"'
+                         if summarize else '')
         prompt = f"""You are a grain industry analyst. Score this article for relevance to the grain quality/grading technology industry.
 
 Article Title: {article.get('title', '')}
@@ -87,8 +111,7 @@ Source: {article.get('source', '')}
 Respond in JSON format only:
 {{
   "relevance_score": <0-100 integer>,
-  "reason": "<brief reason for score>",
-  "summary": "<1-2 sentence summary focusing on grain industry relevance>"
+  "reason": "<brief reason for score>"{summary_field}
 }}
 
 Scoring guide:
@@ -110,7 +133,7 @@ Scoring guide:
         result = json.loads(result_text)
         return {
             'score': int(result.get('relevance_score', 0)),
-            'summary': result.get('summary', article.get('summary', '')[:200]),
+            'summary': result.get('summary') if summarize else None,
             'reason': result.get('reason', '')
         }
         
@@ -123,7 +146,8 @@ def curate_articles(
     articles: List[Dict[str, Any]],
     min_score: int = 60,
     max_articles: int = 15,
-    use_ai: bool = True
+    use_ai: bool = True,
+    summarizer: str = 'local'
 ) -> List[Dict[str, Any]]:
     """
     Score and filter articles for grain industry relevance.
@@ -133,6 +157,7 @@ def curate_articles(
         min_score: Minimum relevance score to include
         max_articles: Maximum number of articles to return
         use_ai: Whether to use Gemini for scoring (requires GEMINI_API_KEY)
+        summarizer: 'local' (extractive, offline) or 'gemini' (asked while scoring)
         
     Returns:
         List of curated articles with scores
@@ -145,10 +170,11 @@ def curate_articles(
         
         # Try Gemini first if enabled
         if use_ai and api_key:
-            ai_result = score_with_gemini(article, api_key)
+            ai_result = score_with_gemini(article, api_key, summarize=summarizer == 'gemini')
             if ai_result:
                 article['relevance_score'] = ai_result['score']
-                article['curated_summary'] = ai_result['summary']
+                if ai_result['summary']:
+                    article['curated_summary'] = ai_result['summary']
                 scored_articles.append(article)
                 continue
         
@@ -163,7 +189,13 @@ def curate_articles(
     
     logger.info(f"Curated {len(filtered)}/{len(articles)} articles (min_score={min_score})")
     
-    return filtered[:max_articles]
+    # Everything Gemini didn't summarize gets an extractive summary, in one batch
+    curated = filtered[:max_articles]
+    pending = [a for a in curated if not a.get('curated_summary')]
+    for article, summary in zip(pending, get_summarizer().summarize_articles(pending)):
+        article['curated_summary'] = summary
+    
+    return curated
 
 
 def run_curator(input_path: Path, output_path: Path, config: Dict[str, Any] = None) -> Dict[str, Any]:
@@ -181,6 +213,7 @@ def run_curator(input_path: Path, output_path: Path, config: Dict[str, Any] = No
     config = config or {}
     min_score = config.get('min_relevance_score', 60)
     max_articles = config.get('max_articles', 15)
+    summarizer = config.get('summarizer', 'local')
     
     # Load raw articles
     with open(input_path, 'r', encoding='utf-8') as f:
@@ -190,7 +223,7 @@ def run_curator(input_path: Path, output_path: Path, config: Dict[str, Any] = No
     logger.info(f"Loaded {len(articles)} raw articles for curation")
     
     # Curate
-    curated = curate_articles(articles, min_score=min_score, max_articles=max_articles)
+    curated = curate_articles(articles, min_score=min_score, max_articles=max_articles, summarizer=summarizer)
     
     # Build output
     output = {
@@ -199,6 +232,7 @@ def run_curator(input_path: Path, output_path: Path, config: Dict[str, Any] = No
         'curation_config': {
             'min_score': min_score,
             'max_articles': max_articles,
+            'summarizer': summarizer,
             'ai_enabled': bool(os.environ.get('GEMINI_API_KEY'))
         },
         'articles': curated
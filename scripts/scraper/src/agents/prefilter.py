@@ -0,0 +1,118 @@
+"""
+Result Pre-filter - Decide which search results are worth enriching.
+
+Runs between the alert searches and enrichment. Each result's title and
+snippet are scored with the same keyword logic the later stages use, and
+only results that could survive curation get their page downloaded:
+
+    score >= threshold            enrich (relevant)
+    ambiguous_min <= score < ...  enrich (ambiguous: the page may tip it)
+    snippet too short to judge    enrich (ambiguous)
+    otherwise                     keep the snippet, skip the download
+
+The scorer is pluggable: a built-in name from SCORERS or a
+"package.module:function" path taking a result dict and returning a number.
+"""
+
+import importlib
+import logging
+from typing import Callable, Dict, Any, List, Tuple
+
+from src.agents.curator import calculate_keyword_score
+from src.transform_to_curated import calculate_relevance, clean_html
+
+logger = logging.getLogger(__name__)
+
+Scorer = Callable[[Dict[str, Any]], float]
+
+DECISION_RELEVANT = 'relevant'
+DECISION_AMBIGUOUS = 'ambiguous'
+DECISION_SKIP = 'skip'
+
+
+def _curator_score(result: Dict[str, Any]) -> float:
+    return calculate_keyword_score(clean_html(f"{result.get('title', '')} {result.get('summary', '')}"))
+
+
+SCORERS: Dict[str, Scorer] = {
+    'transform': calculate_relevance,
+    'curator': _curator_score,
+}
+
+
+def load_scorer(name: str) -> Scorer:
+    """Resolve a built-in scorer name or a 'module:function' path."""
+    if name in SCORERS:
+        return SCORERS[name]
+    if ':' not in name:
+        raise ValueError(f"Unknown prefilter scorer '{name}', expected one of {sorted(SCORERS)} or 'module:function'")
+    module_name, func_name = name.split(':', 1)
+    return getattr(importlib.import_module(module_name), func_name)
+
+
+class Prefilter:
+    """Splits search results into enrichment targets and snippet-only results."""
+
+    def __init__(
+        self,
+        scorer: Scorer = calculate_relevance,
+        threshold: float = 20,
+        ambiguous_min: float = 5,
+        min_snippet_chars: int = 80,
+        enabled: bool = True,
+    ):
+        self.scorer = scorer
+        self.threshold = threshold
+        self.ambiguous_min = ambiguous_min
+        self.min_snippet_chars = min_snippet_chars
+        self.enabled = enabled
+        self.counts = {DECISION_RELEVANT: 0, DECISION_AMBIGUOUS: 0, DECISION_SKIP: 0}
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'Prefilter':
+        """Build a pre-filter from the `prefilter` section of sources.yaml."""
+        prefilter_config = config.get('prefilter', {}) or {}
+        return cls(
+            scorer=load_scorer(prefilter_config.get('scorer', 'transform')),
+            threshold=prefilter_config.get('threshold', 20),
+            ambiguous_min=prefilter_config.get('ambiguous_min', 5),
+            min_snippet_chars=prefilter_config.get('min_snippet_chars', 80),
+            enabled=prefilter_config.get('enabled', True),
+        )
+
+    def decide(self, result: Dict[str, Any]) -> Tuple[str, float]:
+        """Decision and score for one result."""
+        score = self.scorer(result)
+        if score >= self.threshold:
+            return DECISION_RELEVANT, score
+        if score >= self.ambiguous_min:
+            return DECISION_AMBIGUOUS, score
+        if len(clean_html(result.get('summary', '')).strip()) < self.min_snippet_chars:
+            return DECISION_AMBIGUOUS, score
+        return DECISION_SKIP, score
+
+    def split(self, results: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """(results to enrich, results kept as search snippets)."""
+        if not self.enabled:
+            return list(results), []
+
+        enrich, skipped = [], []
+        for result in results:
+            decision, score = self.decide(result)
+            self.counts[decision] += 1
+            result['prefilter_score'] = score
+            (skipped if decision == DECISION_SKIP else enrich).append(result)
+
+        logger.info(
+            f"  -> Pre-filter: {self.counts[DECISION_RELEVANT]} relevant, "
+            f"{self.counts[DECISION_AMBIGUOUS]} ambiguous, {self.counts[DECISION_SKIP]} skipped"
+        )
+        return enrich, skipped
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            'enabled': self.enabled,
+            'threshold': self.threshold,
+            'ambiguous_min': self.ambiguous_min,
+            **self.counts,
+        }
@@ -0,0 +1,319 @@
+"""
+Query Planner - Merge compatible alert queries into fewer searches.
+
+Alert queries use Google-style boolean syntax: quoted phrases, bare terms,
+OR (binding tighter than AND), explicit or implicit AND, parentheses,
+-exclusions and site: filters. The planner parses each query and
+
+  * collapses queries that are identical after normalization, and
+  * merges queries that share a site: target into one search,
+    site:X ((topic 1) OR (topic 2) ...), within the engine's query
+    length limit and a member cap.
+
+A merged search asks for enough results to cover all of its members.
+route_results() then hands every result back to the alert(s) whose topic
+it matches (by evaluating the parsed expression against the title and
+snippet), so attribution stays per alert_id. Every member keeps up to the
+result count it asked for on its own; identical queries share the whole
+result list.
+"""
+
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Tuple
+
+from src.sources.csv_ingest import AlertQuery
+
+logger = logging.getLogger(__name__)
+
+TOKEN_RE = re.compile(r'"[^"]*"|\(|\)|[^\s()"]+')
+
+OP_AND = 'and'
+OP_OR = 'or'
+OP_NOT = 'not'
+OP_TERM = 'term'
+OP_PHRASE = 'phrase'
+OP_SITE = 'site'
+
+
+@dataclass
+class Expr:
+    """Node of a parsed boolean query."""
+    op: str
+    children: List['Expr'] = field(default_factory=list)
+    text: str = ''
+
+    def render(self, nested: bool = False) -> str:
+        if self.op == OP_PHRASE:
+            return f'"{self.text}"'
+        if self.op == OP_TERM:
+            return self.text
+        if self.op == OP_SITE:
+            return f'site:{self.text}'
+        if self.op == OP_NOT:
+            return '-' + self.children[0].render(nested=True)
+        if len(self.children) == 1:
+            return self.children[0].render(nested)
+        if self.op == OP_OR:
+            body = ' OR '.join(child.render(nested=True) for child in self.children)
+        else:
+            body = ' '.join(child.render(nested=True) for child in self.children)
+        return f'({body})' if nested else body
+
+    def terms(self) -> List['Expr']:
+        """Leaf terms and phrases (excluding site: filters and exclusions)."""
+        if self.op in (OP_TERM, OP_PHRASE):
+            return [self]
+        if self.op in (OP_SITE, OP_NOT):
+            return []
+        return [leaf for child in self.children for leaf in child.terms()]
+
+
+class QuerySyntaxError(ValueError):
+    """Raised when a query cannot be parsed."""
+
+
+def parse_query(query: str) -> Expr:
+    """Parse a boolean query into an expression tree."""
+    tokens = TOKEN_RE.findall(query)
+    pos = 0
+
+    def peek() -> Optional[str]:
+        return tokens[pos] if pos < len(tokens) else None
+
+    def parse_and() -> Expr:
+        nonlocal pos
+        children = []
+        while peek() not in (None, ')'):
+            if peek() == 'AND':
+                pos += 1
+                continue
+            children.append(parse_or())
+        if not children:
+            raise QuerySyntaxError(f"Empty expression in query: {query}")
+        return Expr(OP_AND, children)
+
+    def parse_or() -> Expr:
+        nonlocal pos
+        children = [parse_atom()]
+        while peek() == 'OR':
+            pos += 1
+            children.append(parse_atom())
+        return children[0] if len(children) == 1 else Expr(OP_OR, children)
+
+    def parse_atom() -> Expr:
+        nonlocal pos
+        token = peek()
+        if token is None:
+            raise QuerySyntaxError(f"Unexpected end of query: {query}")
+        pos += 1
+        if token == '(':
+            expr = parse_and()
+            if peek() != ')':
+                raise QuerySyntaxError(f"Unbalanced parentheses in query: {query}")
+            pos += 1
+            return expr
+        if token.startswith('"'):
+            return Expr(OP_PHRASE, text=token.strip('"'))
+        if token.lower().startswith('site:'):
+            return Expr(OP_SITE, text=token[5:].lower())
+        if token.startswith('-') and len(token) > 1:
+            inner = Expr(OP_PHRASE, text=token[1:].strip('"')) if token[1] == '"' else Expr(OP_TERM, text=token[1:])
+            return Expr(OP_NOT, [inner])
+        return Expr(OP_TERM, text=token)
+
+    expr = parse_and()
+    if pos != len(tokens):
+        raise QuerySyntaxError(f"Unbalanced parentheses in query: {query}")
+    return expr
+
+
+def _term_pattern(term: str) -> re.Pattern:
+    return re.compile(r'(?<!\w)' + re.escape(term.lower()) + r'(?!\w)')
+
+
+def evaluate(expr: Expr, text: str) -> bool:
+    """Does lowercased `text` satisfy the expression? site: filters always pass."""
+    if expr.op in (OP_TERM, OP_PHRASE):
+        return bool(_term_pattern(expr.text).search(text))
+    if expr.op == OP_SITE:
+        return True
+    if expr.op == OP_NOT:
+        return not evaluate(expr.children[0], text)
+    if expr.op == OP_OR:
+        return any(evaluate(child, text) for child in expr.children)
+    return all(evaluate(child, text) for child in expr.children)
+
+
+@dataclass
+class Member:
+    """An alert query inside a planned search, with the topic used for routing."""
+    alert: AlertQuery
+    topic: Expr
+
+
+@dataclass
+class PlannedSearch:
+    """One search round-trip and the alert queries it answers."""
+    query: str
+    members: List[Member]
+    num_results: int
+    per_alert: int  # Results each member asked for on its own
+
+    @property
+    def alert_ids(self) -> List[str]:
+        return [m.alert.alert_id or m.alert.title for m in self.members]
+
+
+def _split_site(expr: Expr) -> Tuple[Optional[str], Expr]:
+    """(site, topic) when the query is a single site: filter ANDed with a topic."""
+    if expr.op != OP_AND:
+        return None, expr
+    sites = [child for child in expr.children if child.op == OP_SITE]
+    if len(sites) != 1:
+        return None, expr
+    rest = [child for child in expr.children if child.op != OP_SITE]
+    if not rest:
+        return None, expr
+    topic = rest[0] if len(rest) == 1 else Expr(OP_AND, rest)
+    return sites[0].text, topic
+
+
+def plan_queries(
+    queries: List[AlertQuery],
+    num_results: int = 5,
+    max_query_chars: int = 500,
+    max_members: int = 4,
+    max_results_per_search: int = 20,
+) -> List[PlannedSearch]:
+    """
+    Turn alert queries into the smallest set of searches that covers them.
+
+    Plans keep the order of their first member so high-value sections still
+    run first. Queries that fail to parse are searched on their own.
+    """
+    plans: List[PlannedSearch] = []
+    # rendered query -> (plan, topic its members are routed on)
+    by_text: Dict[str, Tuple[PlannedSearch, Expr]] = {}
+    # site -> plan currently accepting members
+    open_site_plans: Dict[str, PlannedSearch] = {}
+    site_topics: Dict[int, List[Expr]] = {}
+
+    for q in queries:
+        try:
+            expr = parse_query(q.query)
+        except QuerySyntaxError as e:
+            logger.warning(f"Query planner: {e}; searching it verbatim")
+            plans.append(PlannedSearch(q.query, [Member(q, Expr(OP_AND))], num_results, num_results))
+            continue
+
+        text = expr.render()
+        if text in by_text:
+            # Same search: share the first copy's topic (and so all of its results)
+            plan, topic = by_text[text]
+            plan.members.append(Member(q, topic))
+            continue
+
+        site, topic = _split_site(expr)
+        plan = open_site_plans.get(site) if site else None
+        if plan is not None and len(plan.members) < max_members:
+            topics = site_topics[id(plan)] + [topic]
+            merged = Expr(OP_AND, [Expr(OP_SITE, text=site), Expr(OP_OR, topics)]).render()
+            if len(merged) <= max_query_chars:
+                site_topics[id(plan)] = topics
+                plan.query = merged
+                plan.members.append(Member(q, topic))
+                plan.num_results = min(num_results * len(site_topics[id(plan)]), max_results_per_search)
+                by_text[text] = (plan, topic)
+                continue
+
+        member_topic = topic if site else expr
+        plan = PlannedSearch(text, [Member(q, member_topic)], num_results, num_results)
+        plans.append(plan)
+        by_text[text] = (plan, member_topic)
+        if site:
+            open_site_plans[site] = plan
+            site_topics[id(plan)] = [topic]
+
+    merged_away = len(queries) - len(plans)
+    if merged_away:
+        logger.info(f"Query planner: {len(queries)} alert queries -> {len(plans)} searches")
+    return plans
+
+
+def route_results(plan: PlannedSearch, results: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Assign a planned search's results to its member alerts.
+
+    A result goes to every member whose topic its title and snippet satisfy;
+    failing that, to the members sharing the most terms with it; failing
+    that (the engine matched on page text we don't have), to all members.
+    Each member keeps at most the result count it asked for on its own.
+    """
+    routed: Dict[str, List[Dict[str, Any]]] = {key: [] for key in plan.alert_ids}
+    if len(plan.members) == 1:
+        routed[plan.alert_ids[0]] = [dict(r) for r in results]
+        return routed
+
+    per_member = plan.per_alert
+    for result in results:
+        text = f"{result.get('title', '')} {result.get('summary', '')}".lower()
+        owners = [key for key, m in zip(plan.alert_ids, plan.members) if evaluate(m.topic, text)]
+        if not owners:
+            overlap = [sum(1 for t in m.topic.terms() if _term_pattern(t.text).search(text)) for m in plan.members]
+            best = max(overlap)
+            owners = [key for key, n in zip(plan.alert_ids, overlap) if n == best]
+
+        for key in owners:
+            if len(routed[key]) < per_member:
+                routed[key].append(dict(result))
+
+    return routed
+
+
+class QueryPlanner:
+    """Plans alert searches from sources.yaml settings and counts what it saved."""
+
+    def __init__(
+        self,
+        max_query_chars: int = 500,
+        max_members: int = 4,
+        max_results_per_search: int = 20,
+        enabled: bool = True,
+    ):
+        self.max_query_chars = max_query_chars
+        self.max_members = max_members
+        self.max_results_per_search = max_results_per_search
+        self.enabled = enabled
+        self.stats = {'queries': 0, 'searches': 0}
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'QueryPlanner':
+        """Build a planner from the `query_planner` section of sources.yaml."""
+        planner_config = config.get('query_planner', {}) or {}
+        return cls(
+            max_query_chars=planner_config.get('max_query_chars', 500),
+            max_members=planner_config.get('max_members', 4),
+            max_results_per_search=planner_config.get('max_results_per_search', 20),
+            enabled=planner_config.get('enabled', True),
+        )
+
+    def plan(self, queries: List[AlertQuery], num_results: int = 5) -> List[PlannedSearch]:
+        if self.enabled:
+            plans = plan_queries(
+                queries, num_results=num_results, max_query_chars=self.max_query_chars,
+                max_members=self.max_members, max_results_per_search=self.max_results_per_search,
+            )
+        else:
+            plans = [PlannedSearch(q.query, [Member(q, Expr(OP_AND))], num_results, num_results) for q in queries]
+        self.stats['queries'] += len(queries)
+        self.stats['searches'] += len(plans)
+        return plans
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            'enabled': self.enabled,
+            **self.stats,
+            'searches_saved': self.stats['queries'] - self.stats['searches'],
+        }
@@ -0,0 +1,250 @@
+"""
+Poll Scheduler - Adaptive per-source fetch planning.
+
+Remembers how often each feed actually publishes new items and uses that
+rate, weighted by the source's `priority`, to decide when the feed is next
+worth fetching. Sources that are not due are skipped; a periodic full sweep
+fetches everything as a safety net.
+
+Because the scout's outputs are rebuilt from each run's articles, a skipped
+source would drop out of them until its next fetch. SourceArticles keeps
+every source's last successful fetch so skipped or failed sources still
+contribute their articles that are within the age window.
+
+State is kept in data/state/poll_schedule.json and
+data/state/source_articles.json. Without the stored articles a skipped
+source has nothing to contribute, so losing that file (e.g. an evicted CI
+cache) forces a full sweep.
+"""
+
+import hashlib
+import logging
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, Optional
+
+from src.state import load_state, save_state, state_path
+
+logger = logging.getLogger(__name__)
+
+STATE_FILE = 'poll_schedule.json'
+ARTICLES_STATE_FILE = 'source_articles.json'
+
+# Multiplier applied to the rate-derived interval.
+# High-priority sources are polled twice as eagerly as medium ones.
+PRIORITY_WEIGHTS = {
+    'high': 0.5,
+    'medium': 1.0,
+    'low': 2.0,
+}
+
+# Weight given to the newest observation in the new-items-per-day average
+RATE_SMOOTHING = 0.3
+
+# Remember this many recent item links per source to detect new items
+MAX_SEEN_LINKS = 200
+
+
+def _link_key(article: Dict[str, Any]) -> str:
+    """Short stable key for an article, used to spot items seen before."""
+    raw = article.get('link') or article.get('title', '')
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:16]
+
+
+class PollScheduler:
+    """Decides which sources are due and learns from every fetch."""
+
+    def __init__(
+        self,
+        min_interval_hours: float = 6,
+        max_interval_hours: float = 72,
+        full_sweep_days: float = 7,
+        due_slack_hours: float = 2,
+        force_full_sweep: bool = False,
+        enabled: bool = True,
+        now: Optional[datetime] = None,
+    ):
+        self.min_interval = timedelta(hours=min_interval_hours)
+        self.max_interval = timedelta(hours=max_interval_hours)
+        self.full_sweep_every = timedelta(days=full_sweep_days)
+        self.due_slack = timedelta(hours=due_slack_hours)
+        self.enabled = enabled
+        self.now = now or datetime.now()
+
+        self.state = load_state(STATE_FILE, {'sources': {}, 'last_full_sweep': None})
+        self.state.setdefault('sources', {})
+
+        last_sweep = self.state.get('last_full_sweep')
+        sweep_due = last_sweep is None or self.now - datetime.fromisoformat(last_sweep) >= self.full_sweep_every
+        self.full_sweep = force_full_sweep or sweep_due or not enabled
+
+        self.skipped: List[str] = []
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], force_full_sweep: bool = False) -> 'PollScheduler':
+        """Build a scheduler from the `scheduler` section of sources.yaml."""
+        sched_config = config.get('scheduler', {}) or {}
+        return cls(
+            min_interval_hours=sched_config.get('min_interval_hours', 6),
+            max_interval_hours=sched_config.get('max_interval_hours', 72),
+            full_sweep_days=sched_config.get('full_sweep_days', 7),
+            due_slack_hours=sched_config.get('due_slack_hours', 2),
+            force_full_sweep=force_full_sweep,
+            enabled=sched_config.get('enabled', True),
+        )
+
+    def _stats(self, source: Dict[str, Any]) -> Dict[str, Any]:
+        return self.state['sources'].setdefault(source['url'], {
+            'name': source.get('name', ''),
+            'fetches': 0,
+            'rate_per_day': None,
+            'last_fetch': None,
+            'last_change': None,
+            'seen': [],
+        })
+
+    def interval_for(self, source: Dict[str, Any]) -> timedelta:
+        """
+        Polling interval for a source.
+
+        Aim to fetch roughly once per expected new item, scaled by priority
+        and clamped to [min_interval, max_interval].
+        """
+        stats = self.state['sources'].get(source['url'])
+        weight = PRIORITY_WEIGHTS.get(source.get('priority', 'medium'), 1.0)
+
+        rate = stats.get('rate_per_day') if stats else None
+        if not rate:
+            # Nothing published recently: back off to the slowest cadence
+            interval = self.max_interval if stats and stats.get('fetches') else self.min_interval
+        else:
+            interval = timedelta(days=1.0 / rate)
+
+        interval = interval * weight
+        return max(self.min_interval, min(interval, self.max_interval))
+
+    def next_due(self, source: Dict[str, Any]) -> datetime:
+        """When the source should next be fetched."""
+        stats = self.state['sources'].get(source['url'])
+        if not stats or not stats.get('last_fetch'):
+            return self.now
+        return datetime.fromisoformat(stats['last_fetch']) + self.interval_for(source)
+
+    def is_due(self, source: Dict[str, Any]) -> bool:
+        """True if the source should be fetched in this run."""
+        if self.full_sweep:
+            return True
+
+        due = self.next_due(source) - self.due_slack <= self.now
+        if not due:
+            self.skipped.append(source.get('name', source['url']))
+            logger.info(f"  ⏭️ Skipping {source.get('name')} (next due {self.next_due(source):%Y-%m-%d %H:%M})")
+        return due
+
+    def record(self, source: Dict[str, Any], articles: List[Dict[str, Any]]) -> int:
+        """
+        Record a successful fetch and update the source's publish rate.
+
+        Failed fetches must not be recorded: they would count as a quiet
+        poll and back the source off as if it had stopped publishing.
+
+        Returns:
+            Number of items not seen in previous fetches.
+        """
+        stats = self._stats(source)
+        seen = set(stats.get('seen', []))
+        keys = [_link_key(a) for a in articles]
+        new_keys = [k for k in keys if k not in seen]
+
+        if stats.get('last_fetch'):
+            elapsed_days = (self.now - datetime.fromisoformat(stats['last_fetch'])).total_seconds() / 86400
+            elapsed_days = max(elapsed_days, 1 / 24)
+            observed = len(new_keys) / elapsed_days
+            previous = stats.get('rate_per_day')
+            if previous is None:
+                stats['rate_per_day'] = observed
+            else:
+                stats['rate_per_day'] = RATE_SMOOTHING * observed + (1 - RATE_SMOOTHING) * previous
+        elif new_keys:
+            # First observation: assume the visible window is about a week
+            stats['rate_per_day'] = len(new_keys) / 7
+
+        if new_keys:
+            stats['last_change'] = self.now.isoformat()
+
+        stats['name'] = source.get('name', stats.get('name', ''))
+        stats['fetches'] = stats.get('fetches', 0) + 1
+        stats['last_fetch'] = self.now.isoformat()
+        stats['seen'] = (new_keys + [k for k in stats.get('seen', []) if k not in new_keys])[:MAX_SEEN_LINKS]
+
+        return len(new_keys)
+
+    def save(self) -> None:
+        """Persist the schedule state."""
+        if self.full_sweep:
+            self.state['last_full_sweep'] = self.now.isoformat()
+        save_state(STATE_FILE, self.state)
+
+    def summary(self) -> Dict[str, Any]:
+        """Short description of this run's scheduling decisions for the report."""
+        return {
+            'full_sweep': self.full_sweep,
+            'skipped_sources': list(self.skipped),
+        }
+
+
+def _published_at(article: Dict[str, Any]) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(article['published']).replace(tzinfo=None)
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class SourceArticles:
+    """Each source's last successfully fetched articles, replayed when it is skipped."""
+
+    def __init__(self, max_age_days: float = 14, now: Optional[datetime] = None):
+        self.max_age = timedelta(days=max_age_days)
+        self.now = now or datetime.now()
+        self.missing = not state_path(ARTICLES_STATE_FILE).exists()
+        self.state = load_state(ARTICLES_STATE_FILE, {'sources': {}})
+        self.state.setdefault('sources', {})
+        self.carried: Dict[str, int] = {}
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'SourceArticles':
+        """Use the top-level `max_age_days` of sources.yaml as the window."""
+        return cls(max_age_days=config.get('max_age_days', 14))
+
+    def remember(self, source: Dict[str, Any], articles: List[Dict[str, Any]]) -> None:
+        """Store the result of a successful fetch."""
+        self.state['sources'][source['url']] = {
+            'fetched_at': self.now.isoformat(),
+            'articles': [{k: v for k, v in a.items() if k != 'attributions'} for a in articles],
+        }
+
+    def _in_window(self, entry: Dict[str, Any]) -> List[Dict[str, Any]]:
+        # Articles without a usable date count as published when fetched
+        cutoff = self.now - self.max_age
+        fetched_at = datetime.fromisoformat(entry['fetched_at'])
+        return [a for a in entry['articles'] if (_published_at(a) or fetched_at) >= cutoff]
+
+    def recall(self, source: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Articles from the source's last successful fetch that are still within the window."""
+        entry = self.state['sources'].get(source['url'])
+        articles = [dict(a) for a in self._in_window(entry)] if entry else []
+        if articles:
+            self.carried[source.get('name', source['url'])] = len(articles)
+        return articles
+
+    def save(self) -> None:
+        """Persist, dropping sources whose stored articles have all aged out."""
+        self.state['sources'] = {url: entry for url, entry in self.state['sources'].items()
+                                 if self._in_window(entry)}
+        save_state(ARTICLES_STATE_FILE, self.state)
+
+    def summary(self) -> Dict[str, Any]:
+        """Articles carried over from earlier runs, per source."""
+        return {
+            'carried_sources': len(self.carried),
+            'carried_articles': sum(self.carried.values()),
+        }
@@ -6,23 +6,48 @@ from a curated SOURCE_MAP and outputting it to data/raw_intel.json.
 
 Usage:
     python -m src.agents.scout
+    python -m src.agents.scout --full-sweep   # ignore the poll schedule
+    python -m src.agents.scout --shard 0/4 --output raw_intel.shard0.json
+    python -m src.agents.scout --merge-shards raw_intel.shard*.json
+    python -m src.agents.scout --archive capture     # keep every raw response
+    python -m src.agents.scout --archive replay --output raw_intel.replay.json
 """
 
 import json
 import logging
-import feedparser
-import requests
 import time
-from bs4 import BeautifulSoup
+import xml.etree.ElementTree as ET
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-from dateutil import parser as date_parser
+from typing import List, Dict, Any, Optional, Tuple
 
 # Import new scraper modules
-from src.sources.csv_ingest import load_alerts_csv
+from src.sources.csv_ingest import AlertQuery, load_alerts_csv
 from src.sources.search_scraper import SearchScraper
-from src.sources.web_scraper import WebScraper
+from src.sources.search_cache import SearchCache, STATUS_MISS, STATUS_STALE
+from src.sources.web_scraper import WebScraper, parse_article_page
+from src.sources.parse_pool import ParsePool, fetch_and_parse
+from src.sources.fetcher import Fetcher, ResponseStream
+from src.sources.archive import ResponseArchive
+from src.sources.feed_stream import iter_feed_entries
+from src.sources.site_scraper import SiteScraperSpec, scrape_site
+from src.sources.urls import canonicalize_url, merge_duplicate_articles
+from src.sources.host_health import HostHealth
+from src.agents.scheduler import PollScheduler, SourceArticles
+from src.agents.prefilter import Prefilter
+from src.agents.query_planner import PlannedSearch, QueryPlanner, route_results
+from src.agents.shards import (
+    QueryCheckpoint, SHARD_KEYS, merge_shard_reports, parse_shard_spec, prune_checkpoints, shard_queries,
+)
+from src.agents.budget import (
+    RunBudget, TIER_ORDER, TIER_ALERT_SEARCHES, TIER_ENRICHMENT, source_tier,
+)
+from src.lazy import lazy_import
+
+# Imported on first use: runs that never parse a feed skip their start-up cost
+feedparser = lazy_import('feedparser')
+requests = lazy_import('requests')
+date_parser = lazy_import('dateutil.parser')
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -31,7 +56,7 @@ logger = logging.getLogger(__name__)
 # ============================================================================
 # SOURCE_MAP: Grain Industry Sources
 # ============================================================================
-# Each category maps to a list of sources with their URL and type (rss/scrape).
+# Each category maps to a list of sources with their URL and type (rss).
 
 SOURCE_MAP = {
     'grain_industry': [
@@ -63,25 +88,112 @@ SOURCE_MAP = {
             'type': 'rss'
         },
     ],
-    'company': [
-        {
-            'name': 'Protein Industries Canada',
-            'url': 'https://www.proteinindustriescanada.ca/news-releases',
-            'type': 'scrape'
-        },
-        {
-            'name': 'Ground Truth Ag',
-            'url': 'https://groundtruth.ag/',
-            'type': 'scrape'
-        },
-    ],
+    # Scraped company sites are declared under `site_scrapers` in sources.yaml
+    'company': [],
     'regulatory': [
         # Government and regulatory sources
     ],
 }
 
 
-def fetch_rss_feed(url: str, source_name: str, category: str, max_age_days: int = 7) -> List[Dict[str, Any]]:
+def _parse_published(value: Optional[str]) -> datetime:
+    """Parse a feed date, defaulting to now when missing or unparseable."""
+    if not value:
+        return datetime.now()
+    try:
+        return date_parser.parse(value)
+    except Exception:
+        return datetime.now()
+
+
+def _feed_article(title: str, link: str, summary: str, published: datetime,
+                  source_name: str, category: str) -> Dict[str, Any]:
+    # Clean up title (remove newlines for arXiv)
+    title = ' '.join((title or 'Untitled').split())
+    return {
+        'title': title,
+        'link': link or '',
+        'summary': summary[:500] if summary else '',  # Truncate long summaries
+        'published': published.isoformat(),
+        'source': source_name,
+        'category': category,
+    }
+
+
+def _parse_feed_incrementally(
+    stream: ResponseStream,
+    source_name: str,
+    category: str,
+    cutoff_date: datetime,
+    max_items: int,
+    max_old_streak: int = 3,
+) -> List[Dict[str, Any]]:
+    """
+    Stream entries out of the feed, stopping at the item cap or once
+    `max_old_streak` consecutive entries are older than the cutoff
+    (feeds list newest first; the streak tolerates pinned posts).
+    """
+    articles = []
+    old_streak = 0
+
+    for entry in iter_feed_entries(stream):
+        published = _parse_published(entry['published'])
+        if published.replace(tzinfo=None) < cutoff_date:
+            old_streak += 1
+            if old_streak >= max_old_streak:
+                break
+            continue
+        old_streak = 0
+
+        articles.append(_feed_article(entry['title'], entry['link'], entry['summary'],
+                                      published, source_name, category))
+        if len(articles) >= max_items:
+            break
+
+    stream.close()
+    return articles
+
+
+def parse_feed(
+    content: bytes,
+    headers: Dict[str, str],
+    source_name: str,
+    category: str,
+    cutoff_date: Optional[datetime] = None,
+) -> List[Dict[str, Any]]:
+    """Parse a whole feed document with feedparser, dropping entries older than `cutoff_date`."""
+    feed = feedparser.parse(content, response_headers=headers)
+
+    if feed.bozo:
+        logger.warning(f"Feed parsing issue for {source_name}: {feed.bozo_exception}")
+
+    articles = []
+    for entry in feed.entries:
+        # Parse publication date
+        published = _parse_published(entry.get('published') or entry.get('updated'))
+
+        # Filter by age
+        if cutoff_date and published.replace(tzinfo=None) < cutoff_date:
+            continue
+
+        # Extract summary (handle arXiv abstracts)
+        summary = entry.get('summary') or entry.get('description') or ''
+
+        articles.append(_feed_article(entry.get('title', 'Untitled'), entry.get('link', ''),
+                                      summary, published, source_name, category))
+    return articles
+
+
+def fetch_rss_feed(
+    url: str,
+    source_name: str,
+    category: str,
+    max_age_days: int = 7,
+    fetcher: Optional[Fetcher] = None,
+    incremental: bool = False,
+    max_items: int = 50,
+    max_bytes: int = 2_000_000,
+) -> Optional[List[Dict[str, Any]]]:
     """
     Fetch and parse an RSS feed.
 
@@ -90,226 +202,438 @@ def fetch_rss_feed(url: str, source_name: str, category: str, max_age_days: int
         source_name: Human-readable name of the source.
         category: The category tag for these items (e.g., 'vertical_grain').
         max_age_days: Only include items published within this many days.
+        fetcher: Shared Fetcher (timeouts and host health). A plain one is
+            created if omitted.
+        incremental: Parse entry by entry from the network stream with
+            bounded memory instead of materializing the whole feed.
+        max_items: Per-feed item cap (incremental mode).
+        max_bytes: Response size ceiling (incremental mode).
 
     Returns:
-        List of article dictionaries.
+        List of article dictionaries, or None if the feed could not be
+        fetched or parsed.
     """
     articles = []
     cutoff_date = datetime.now() - timedelta(days=max_age_days)
+    fetcher = fetcher or Fetcher()
 
     try:
         logger.info(f"Fetching RSS: {source_name} ({url})")
-        feed = feedparser.parse(url)
-
-        if feed.bozo:
-            logger.warning(f"Feed parsing issue for {source_name}: {feed.bozo_exception}")
-
-        for entry in feed.entries:
-            # Parse publication date
-            published = None
-            if hasattr(entry, 'published'):
-                try:
-                    published = date_parser.parse(entry.published)
-                except Exception:
-                    published = datetime.now()
-            elif hasattr(entry, 'updated'):
-                try:
-                    published = date_parser.parse(entry.updated)
-                except Exception:
-                    published = datetime.now()
-            else:
-                published = datetime.now()
-
-            # Filter by age
-            if published.replace(tzinfo=None) < cutoff_date:
-                continue
-
-            # Extract summary (handle arXiv abstracts)
-            summary = ''
-            if hasattr(entry, 'summary'):
-                summary = entry.summary
-            elif hasattr(entry, 'description'):
-                summary = entry.description
-
-            # Clean up title (remove newlines for arXiv)
-            title = entry.get('title', 'Untitled')
-            title = ' '.join(title.split())
-
-            articles.append({
-                'title': title,
-                'link': entry.get('link', ''),
-                'summary': summary[:500] if summary else '',  # Truncate long summaries
-                'published': published.isoformat(),
-                'source': source_name,
-                'category': category,
-            })
 
+        content, headers = None, {}
+        if incremental:
+            stream = fetcher.stream(url, max_bytes=max_bytes)
+            if stream is None:
+                return None
+            try:
+                articles = _parse_feed_incrementally(stream, source_name, category, cutoff_date, max_items)
+                logger.info(f"  -> Found {len(articles)} recent items from {source_name}")
+                return articles
+            except ET.ParseError as e:
+                # Not well-formed XML (e.g. HTML entities): let feedparser cope
+                logger.warning(f"Incremental parse failed for {source_name} ({e}), falling back to feedparser")
+                content, headers = stream.read_all(), stream.headers
+        else:
+            # Download through the Fetcher so the request has a timeout;
+            # feedparser on its own would wait forever on a hung host.
+            result = fetcher.fetch(url)
+            if result is None:
+                return None
+            content, headers = result.content, result.headers
+
+        articles = parse_feed(content, headers, source_name, category, cutoff_date)
         logger.info(f"  -> Found {len(articles)} recent items from {source_name}")
 
     except requests.exceptions.RequestException as e:
         logger.error(f"Network error fetching {source_name}: {e}")
+        return None
     except Exception as e:
         logger.error(f"Error fetching {source_name}: {e}")
+        return None
 
     return articles
 
 
-def scrape_protein_industries_canada() -> List[Dict[str, Any]]:
-    """
-    Scrape news releases from Protein Industries Canada.
-    """
-    articles = []
-    url = 'https://www.proteinindustriescanada.ca/news-releases'
-
+def load_sources_config(config_path: Optional[Path] = None) -> Dict[str, Any]:
+    """Load sources configuration from YAML file (config/sources.yaml unless `config_path` is given)."""
+    # Assuming this script is running from scripts/scraper/src/agents/scout.py
+    # and config is at scripts/scraper/config/sources.yaml
+    config_path = config_path or Path(__file__).resolve().parents[2] / 'config' / 'sources.yaml'
+    
+    if not config_path.exists():
+        logger.warning(f"Config file not found: {config_path}")
+        return {}
+    
     try:
-        logger.info(f"Scraping: Protein Industries Canada ({url})")
-        response = requests.get(url, timeout=15, headers={'User-Agent': 'Mozilla/5.0'})
-        response.raise_for_status()
+        import yaml
+        with open(config_path, 'r', encoding='utf-8') as f:
+            return yaml.safe_load(f) or {}
+    except Exception as e:
+        logger.error(f"Error loading config: {e}")
+        return {}
 
-        soup = BeautifulSoup(response.text, 'html.parser')
 
-        # Find news items (adjust selectors based on actual site structure)
-        news_items = soup.select('article.news-item, div.news-release, a.news-link')[:5]
+# Config feed groups: (config key, default category, source name prefix)
+CONFIG_FEED_GROUPS = [
+    ('company_feeds', 'company', ''),
+    ('google_alerts', 'technology', 'Google Alert: '),
+    ('rss_feeds', 'headline', ''),
+]
 
-        for item in news_items:
-            title_elem = item.select_one('h2, h3, .title')
-            link_elem = item if item.name == 'a' else item.select_one('a')
 
-            if title_elem and link_elem:
-                articles.append({
-                    'title': title_elem.get_text(strip=True),
-                    'link': link_elem.get('href', ''),
-                    'summary': '',
-                    'published': datetime.now().isoformat(),
-                    'source': 'Protein Industries Canada',
-                    'category': 'vertical_grain',
-                })
+def collect_sources(config: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Flatten SOURCE_MAP and the feed groups in sources.yaml into one list.
 
-        logger.info(f"  -> Found {len(articles)} items from Protein Industries Canada")
+    Each entry carries its name, url, type, category, priority and the
+    `group` it is counted under in the report.
+    """
+    sources = []
+
+    for category, entries in SOURCE_MAP.items():
+        for source in entries:
+            sources.append({
+                'name': source['name'],
+                'url': source['url'],
+                'type': source['type'],
+                'category': category,
+                'priority': source.get('priority', 'medium'),
+                'group': category,
+            })
 
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Network error scraping Protein Industries Canada: {e}")
-    except Exception as e:
-        logger.error(f"Error scraping Protein Industries Canada: {e}")
+    for group, default_category, prefix in CONFIG_FEED_GROUPS:
+        for feed in config.get(group, []) or []:
+            if not feed.get('url'):
+                continue
+            sources.append({
+                'name': f"{prefix}{feed.get('name', 'Unknown Feed')}",
+                'url': feed['url'],
+                'type': 'rss',
+                'category': feed.get('category', default_category),
+                'priority': feed.get('priority', 'medium'),
+                'group': group,
+            })
 
-    return articles
+    for entry in config.get('site_scrapers', []) or []:
+        spec = SiteScraperSpec.from_config(entry)
+        sources.append({
+            'name': spec.name,
+            'url': spec.url,
+            'type': 'scrape',
+            'category': spec.category,
+            'priority': entry.get('priority', 'medium'),
+            'group': entry.get('group', 'company'),
+            'spec': spec,
+        })
 
+    return sources
 
-def scrape_ground_truth_ag() -> List[Dict[str, Any]]:
-    """
-    Scrape the latest news from Ground Truth Ag.
-    """
-    articles = []
-    url = 'https://groundtruth.ag/'
 
-    try:
-        logger.info(f"Scraping: Ground Truth Ag ({url})")
-        response = requests.get(url, timeout=15, headers={'User-Agent': 'Mozilla/5.0'})
-        response.raise_for_status()
+def coalesce_sources(sources: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Merge source entries that point at the same canonical URL.
 
-        soup = BeautifulSoup(response.text, 'html.parser')
+    The first entry (highest value after tier sorting) is kept and fetched;
+    every entry that asked for the URL is listed in its `attributions`.
+    """
+    by_url: Dict[str, Dict[str, Any]] = {}
+    result = []
+
+    for source in sources:
+        attribution = {'source': source['name'], 'category': source['category']}
+        key = canonicalize_url(source['url'])
+        if key in by_url:
+            primary = by_url[key]
+            primary['attributions'].append(attribution)
+            logger.info(f"  🔗 {source['name']} shares a URL with {primary['name']}; fetching once")
+            continue
+
+        source = {**source, 'attributions': [attribution]}
+        by_url[key] = source
+        result.append(source)
+
+    return result
+
+
+def fetch_source(
+    source: Dict[str, Any],
+    fetcher: Optional[Fetcher] = None,
+    feed_options: Optional[Dict[str, Any]] = None,
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Fetch a single source entry using the fetcher for its type.
 
-        # Look for news or blog sections (adjust selectors)
-        news_items = soup.select('article, .news-item, .blog-post, section.content a')[:3]
+    Returns None when the fetch failed, so callers can tell a failure from
+    a source with nothing new.
 
-        for item in news_items:
-            title_elem = item.select_one('h1, h2, h3, .title')
-            link_elem = item if item.name == 'a' else item.select_one('a')
+    Args:
+        feed_options: The `feeds` section of sources.yaml (incremental
+            parsing, item cap, byte ceiling).
+    """
+    if source['type'] == 'rss':
+        feed_options = feed_options or {}
+        return fetch_rss_feed(
+            url=source['url'],
+            source_name=source['name'],
+            category=source['category'],
+            fetcher=fetcher,
+            incremental=feed_options.get('incremental', False),
+            max_items=feed_options.get('max_items', 50),
+            max_bytes=feed_options.get('max_bytes', 2_000_000),
+        )
+
+    if source['type'] == 'scrape':
+        return scrape_site(source['spec'], fetcher)
+
+    logger.warning(f"Unknown source type '{source['type']}' for: {source['name']}")
+    return None
+
+
+def run_alert_searches(
+    queries: List[AlertQuery],
+    search_engine: SearchScraper,
+    budget: RunBudget,
+    max_results: int = 5,
+    checkpoint: Optional[QueryCheckpoint] = None,
+    planner: Optional[QueryPlanner] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Run the alert-query searches, stopping when the budget runs low.
 
-            if title_elem:
-                link = ''
-                if link_elem:
-                    link = link_elem.get('href', '')
-                    if link and not link.startswith('http'):
-                        link = f"https://groundtruth.ag{link}"
+    The planner merges compatible queries (duplicates, shared site: targets)
+    into fewer searches; each merged search's results are routed back to
+    the alert queries they match, so attribution stays per query.
 
-                articles.append({
-                    'title': title_elem.get_text(strip=True),
-                    'link': link,
-                    'summary': '',
-                    'published': datetime.now().isoformat(),
-                    'source': 'Ground Truth Ag',
-                    'category': 'vertical_grain',
-                })
+    With a checkpoint, queries finished by an earlier attempt are replayed
+    from disk and every newly finished query is recorded straight away.
 
-        logger.info(f"  -> Found {len(articles)} items from Ground Truth Ag")
+    Searches answered from a stale cache entry are revalidated after every
+    other search has run, while the budget still allows; results that are
+    new since the cached page are added.
 
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Network error scraping Ground Truth Ag: {e}")
-    except Exception as e:
-        logger.error(f"Error scraping Ground Truth Ag: {e}")
-
-    return articles
+    Returns:
+        Search results tagged with their originating query.
+    """
+    planner = planner or QueryPlanner(enabled=False)
+    plans = planner.plan(queries, num_results=max_results)
+    results = []
+    stale: List[Tuple[PlannedSearch, Dict[str, List[Dict[str, Any]]]]] = []
+
+    def tag(res: Dict[str, Any], q: AlertQuery) -> Dict[str, Any]:
+        res['source'] = f"Scraper: {q.title}" # Attribution
+        res['category'] = q.section # Use section as category group
+        return res
+
+    def tagged(plan: PlannedSearch, page: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        routed = route_results(plan, page)
+        return {key: [tag(res, m.alert) for res in routed[key]]
+                for key, m in zip(plan.alert_ids, plan.members)}
+
+    for i, plan in enumerate(plans):
+        done = {key: checkpoint.get(key) for key in plan.alert_ids} if checkpoint else {}
+        if done and all(found is not None for found in done.values()):
+            for found in done.values():
+                results.extend(found)
+            continue
+
+        if not budget.allows(TIER_ALERT_SEARCHES):
+            for skipped in plans[i:]:
+                for key in skipped.alert_ids:
+                    budget.skip(TIER_ALERT_SEARCHES, key)
+            break
+
+        # Progress log every 5 searches
+        if i % 5 == 0:
+            logger.info(f"  -> Processing search {i+1}/{len(plans)}: {', '.join(plan.alert_ids)}")
+
+        routed = tagged(plan, search_engine.search(plan.query, num_results=plan.num_results))
+        status = search_engine.last_status
+
+        for key, query_results in routed.items():
+            if done.get(key) is not None:
+                # Finished by an earlier attempt before queries were merged
+                query_results = routed[key] = done[key]
+            elif checkpoint:
+                checkpoint.record(key, query_results)
+            results.extend(query_results)
+
+        if status == STATUS_STALE:
+            stale.append((plan, routed))
+        if status == STATUS_MISS and not search_engine.fetcher.offline:
+            # Polite delay between queries (search_scraper handles internal delay too, but extra safety)
+            time.sleep(1)
+
+    for plan, served in stale:
+        if not budget.allows(TIER_ALERT_SEARCHES):
+            break
+        fresh = tagged(plan, search_engine.search(plan.query, num_results=plan.num_results, refresh=True))
+        for key, query_results in fresh.items():
+            served_links = {res.get('link') for res in served[key]}
+            new_results = [res for res in query_results if res.get('link') not in served_links]
+            if checkpoint and new_results:
+                checkpoint.record(key, served[key] + new_results)
+            results.extend(new_results)
+        time.sleep(1)
+
+    if stale:
+        logger.info(f"  -> Revalidated stale cached searches ({len(stale)} served stale)")
+
+    return results
+
+
+def enrich_results(
+    results: List[Dict[str, Any]],
+    web_fetcher: WebScraper,
+    budget: RunBudget,
+    fetch_workers: int = 8,
+    parse_workers: Optional[int] = None,
+    max_pending_parses: int = 32,
+) -> int:
+    """
+    Replace search snippets with the page's own summary where it is longer.
 
+    Pages are downloaded on I/O threads and parsed in a process pool.
+    Enrichment is the lowest-value tier and is the first to be dropped
+    when the run deadline approaches.
 
-def load_sources_config() -> Dict[str, Any]:
-    """Load sources configuration from YAML file."""
-    # Assuming this script is running from scripts/scraper/src/agents/scout.py
-    # and config is at scripts/scraper/config/sources.yaml
-    config_path = Path(__file__).resolve().parents[2] / 'config' / 'sources.yaml'
-    
-    if not config_path.exists():
-        logger.warning(f"Config file not found: {config_path}")
-        return {}
-    
-    try:
-        import yaml
-        with open(config_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f) or {}
-    except Exception as e:
-        logger.error(f"Error loading config: {e}")
-        return {}
+    Returns:
+        Number of results enriched.
+    """
+    targets = [res for res in results if res.get('link')]
+
+    def fetch(res: Dict[str, Any]):
+        if not budget.allows(TIER_ENRICHMENT):
+            budget.skip(TIER_ENRICHMENT, res['link'])
+            return None
+        return web_fetcher.fetch(res['link'], requested_by=res.get('source'))
+
+    with ParsePool(workers=parse_workers, max_pending=max_pending_parses) as pool:
+        pages = fetch_and_parse(targets, fetch, parse_article_page, pool, io_workers=fetch_workers)
+
+    enriched = 0
+    for res, full_content in zip(targets, pages):
+        # Start with existing summary in case fetch fails
+        if full_content and full_content.get('summary'):
+            # Update summary with scraped content if it's better/longer
+            if len(full_content['summary']) > len(res['summary']):
+                res['summary'] = full_content['summary']
+                enriched += 1
+
+    return enriched
+
+
+def run_scout(
+    full_sweep: bool = False,
+    deadline_minutes: Optional[float] = None,
+    shard: Optional[Tuple[int, int]] = None,
+    shard_by: str = 'alert_id',
+    run_id: Optional[str] = None,
+    resume: bool = False,
+    archive_mode: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Execute the Scout agent: fetch all due sources and aggregate results.
 
+    Work runs in order of value (high-priority feeds, company feeds, other
+    feeds, alert searches, enrichment) so a run that hits its deadline still
+    produces a usable partial report.
 
-def run_scout() -> Dict[str, Any]:
-    """
-    Execute the Scout agent: fetch all sources and aggregate results.
+    Args:
+        full_sweep: Fetch every source regardless of its poll schedule.
+        deadline_minutes: Overall time budget (overrides `budget.deadline_minutes`).
+        shard: (index, count) to run only this shard's alert queries.
+            Feeds are fetched by shard 0 only.
+        shard_by: Shard key, 'alert_id' or 'section'.
+        run_id: Identifies the run for query checkpoints (default: today's
+            date). Passing one explicitly resumes that run.
+        resume: Replay queries the run's checkpoint already finished instead
+            of searching them again (implied by an explicit run_id).
+        archive_mode: 'capture' to archive every raw response, 'replay' to
+            re-run parsing from the archive with no network access
+            (overrides `archive.mode`). A replay sweeps every source,
+            bypasses the search cache and query checkpoints, and leaves
+            run-to-run state untouched.
 
     Returns:
         Dictionary with raw intelligence data.
     """
     all_articles = []
     category_counts = {}
+    search_duplicates = 0
 
     logger.info("=" * 60)
     logger.info("🔍 SCOUT AGENT: Starting Intelligence Gathering")
     logger.info("=" * 60)
 
-    # Process each category in SOURCE_MAP
-    for category, sources in SOURCE_MAP.items():
-        category_counts[category] = 0
-
-        for source in sources:
-            if source['type'] == 'rss':
-                articles = fetch_rss_feed(
-                    url=source['url'],
-                    source_name=source['name'],
-                    category=category
-                )
-                all_articles.extend(articles)
-                category_counts[category] += len(articles)
-
-            elif source['type'] == 'scrape':
-                # Handle specific scrapers
-                if 'proteinindustriescanada' in source['url']:
-                    articles = scrape_protein_industries_canada()
-                elif 'groundtruth' in source['url']:
-                    articles = scrape_ground_truth_ag()
-                else:
-                    logger.warning(f"No scraper implemented for: {source['name']}")
-                    articles = []
-
-                all_articles.extend(articles)
-                category_counts[category] += len(articles)
+    logger.info("loading sources config...")
+    config = load_sources_config()
+    budget = RunBudget.from_config(config, deadline_minutes=deadline_minutes)
+    archive = ResponseArchive.from_config(config, mode=archive_mode, run_id=run_id)
+    replaying = bool(archive and archive.replaying)
+    last_fetched = SourceArticles.from_config(config)
+    # Skipped sources are filled in from their last fetch, so fetch everything when that is gone
+    scheduler = PollScheduler.from_config(config, force_full_sweep=full_sweep or replaying or last_fetched.missing)
+    health = HostHealth.from_config(config)
+    fetcher = Fetcher(health=health, archive=archive)
+    prefilter = Prefilter.from_config(config)
+    # A replay must re-parse the archived pages, not serve cached results
+    search_cache = SearchCache(enabled=False) if replaying else SearchCache.from_config(config)
+    planner = QueryPlanner.from_config(config)
+
+    if archive:
+        logger.info(f"📼 Response archive: {archive.mode} ({archive.root})")
+    if budget.deadline_seconds:
+        logger.info(f"⏱️ Run deadline: {budget.deadline_seconds / 60:.0f} min")
+    if scheduler.full_sweep:
+        logger.info("📅 Full sweep: fetching every source")
 
     # =========================================================================
-    # GOOGLE ALERTS: Load from sources.yaml config
+    # FEEDS: SOURCE_MAP plus the feed groups from sources.yaml, by value tier
     # =========================================================================
+    shard_index, shard_count = shard or (0, 1)
+    resume = resume or run_id is not None
+    run_id = run_id or datetime.now().strftime('%Y-%m-%d')
+
+    sources = collect_sources(config) if shard_index == 0 else []
+    sources.sort(key=lambda src: TIER_ORDER.index(source_tier(src)))
+    sources = coalesce_sources(sources)
+
+    current_tier = None
+    for source in sources:
+        tier = source_tier(source)
+        if tier != current_tier:
+            current_tier = tier
+            logger.info("-" * 60)
+            logger.info(f"📡 {tier}")
+            logger.info("-" * 60)
+
+        group = source['group']
+        category_counts.setdefault(group, 0)
+
+        articles = None
+        if not budget.allows(tier):
+            budget.skip(tier, source['name'])
+        elif scheduler.is_due(source):
+            articles = fetch_source(source, fetcher, config.get('feeds'))
+
+        if articles is None:
+            # Skipped or failed: reuse the last successful fetch so its
+            # stories stay in the outputs rebuilt from this run
+            articles = [] if replaying else last_fetched.recall(source)
+        else:
+            scheduler.record(source, articles)
+            last_fetched.remember(source, articles)
+
+        # Fan the result out to every source/category that asked for this URL
+        for article in articles:
+            article['attributions'] = list(source['attributions'])
+
+        all_articles.extend(articles)
+        category_counts[group] += len(articles)
+
     # =========================================================================
     # CSV SCRAPER: Load from google_alerts_all_utf8.csv
     # =========================================================================
-    logger.info("loading sources config...")
-    config = load_sources_config()
     scraper_config = config.get('scraper', {})
     csv_path_str = scraper_config.get('csv_source_path')
     
@@ -325,138 +649,81 @@ def run_scout() -> Dict[str, Any]:
         csv_path = scraper_root / csv_path_str
         
         queries = load_alerts_csv(csv_path)
+        if shard_count > 1:
+            queries = shard_queries(queries, shard_index, shard_count, by=shard_by)
+            logger.info(f"Shard {shard_index}/{shard_count} (by {shard_by}): {len(queries)} queries")
         
         if queries:
-            search_engine = SearchScraper()
-            web_fetcher = WebScraper()
-            category_counts['csv_scraper'] = 0
+            search_engine = SearchScraper(delay=0 if replaying else 2, fetcher=fetcher, cache=search_cache)
+            web_fetcher = WebScraper(fetcher=fetcher)
             
-            # Rate limiting / Batching could be added here
             max_results = scraper_config.get('max_search_results', 5)
             scrape_full = scraper_config.get('scrape_full_content', True)
             
             logger.info(f"Processing {len(queries)} queries from CSV...")
-            
-            for i, q in enumerate(queries):
-                # Progress log every 5 queries
-                if i % 5 == 0:
-                    logger.info(f"  -> Processing query {i+1}/{len(queries)}: {q.title}")
-                
-                # Search
-                results = search_engine.search(q.query, num_results=max_results)
-                
-                for res in results:
-                    # Enrich with full content if requested
-                    if scrape_full and res.get('link'):
-                        # Basic content fetch to get better summary
-                        # Start with existing summary in case fetch fails
-                        full_content = web_fetcher.scrape_url(res['link'])
-                        if full_content and full_content.get('summary'):
-                            # Update summary with scraped content if it's better/longer
-                            if len(full_content['summary']) > len(res['summary']):
-                                res['summary'] = full_content['summary']
-                                # Could also update title if needed, but search result title is usually good
-                    
-                    # Add metadata
-                    res['source'] = f"Scraper: {q.title}" # Attribution
-                    res['category'] = q.section # Use section as category group
-                    
-                    all_articles.append(res)
-                    category_counts['csv_scraper'] += 1
-                
-                # Polite delay between queries (search_scraper handles internal delay too, but extra safety)
-                time.sleep(1)
+            checkpoint = None
+            if not replaying:
+                prune_checkpoints(scraper_config.get('checkpoint_keep_days', 7))
+                checkpoint = QueryCheckpoint(run_id, shard_index, shard_count, resume=resume)
+            results = run_alert_searches(queries, search_engine, budget,
+                                         max_results=max_results, checkpoint=checkpoint,
+                                         planner=planner)
+
+            # Overlapping queries return the same pages: enrich each target once
+            found = len(results)
+            results = merge_duplicate_articles(results)
+            search_duplicates = found - len(results)
+            logger.info(f"  -> {len(results)} unique results from {found} hits across queries")
+
+            # Enrichment runs after every search so it is the first thing dropped on a tight deadline
+            if scrape_full and results:
+                # Only download pages whose snippet could survive curation
+                targets, _snippet_only = prefilter.split(results)
+                logger.info(f"Enriching {len(targets)}/{len(results)} search results...")
+                enriched = enrich_results(
+                    targets, web_fetcher, budget,
+                    fetch_workers=scraper_config.get('fetch_workers', 8),
+                    parse_workers=scraper_config.get('parse_workers'),
+                    max_pending_parses=scraper_config.get('max_pending_parses', 32),
+                )
+                logger.info(f"  -> Enriched {enriched} results with page summaries")
+
+            all_articles.extend(results)
+            category_counts['csv_scraper'] = len(results)
 
             logger.info(f"  -> Total from CSV Search Scraper: {category_counts['csv_scraper']} items")
         else:
             logger.warning("No queries found in CSV.")
-            
-    # =========================================================================
-    # COMPANY FEEDS: Direct RSS from tracked grain-tech companies
-    # =========================================================================
-    company_feeds = config.get('company_feeds', [])
-    
-    if company_feeds:
-        logger.info("-" * 60)
-        logger.info("🏢 COMPANY FEEDS: Fetching from tracked companies")
-        logger.info("-" * 60)
-        category_counts['company_feeds'] = 0
-        
-        for feed in company_feeds:
-            feed_name = feed.get('name', 'Unknown Company')
-            feed_url = feed.get('url', '')
-            feed_category = feed.get('category', 'company')
-            
-            if feed_url:
-                articles = fetch_rss_feed(
-                    url=feed_url,
-                    source_name=feed_name,
-                    category=feed_category
-                )
-                all_articles.extend(articles)
-                category_counts['company_feeds'] += len(articles)
-        
-        logger.info(f"  -> Total from Company Feeds: {category_counts['company_feeds']} items")
 
-    # =========================================================================
-    # GOOGLE ALERTS: Grain-tech specific search alerts
-    # =========================================================================
-    google_alerts = config.get('google_alerts', [])
-    
-    if google_alerts:
-        logger.info("-" * 60)
-        logger.info("🔔 GOOGLE ALERTS: Fetching grain-tech alerts")
-        logger.info("-" * 60)
-        category_counts['google_alerts'] = 0
-        
-        for alert in google_alerts:
-            alert_name = alert.get('name', 'Unknown Alert')
-            alert_url = alert.get('url', '')
-            alert_category = alert.get('category', 'technology')
-            
-            if alert_url:
-                articles = fetch_rss_feed(
-                    url=alert_url,
-                    source_name=f"Google Alert: {alert_name}",
-                    category=alert_category
-                )
-                all_articles.extend(articles)
-                category_counts['google_alerts'] += len(articles)
-        
-        logger.info(f"  -> Total from Google Alerts: {category_counts['google_alerts']} items")
+    if not replaying:
+        scheduler.save()
+        last_fetched.save()
+        health.save()
+        search_cache.save()
 
-    # =========================================================================
-    # ADDITIONAL RSS FEEDS: Load from sources.yaml config
-    # =========================================================================
-    rss_feeds = config.get('rss_feeds', [])
-    
-    if rss_feeds:
-        logger.info("-" * 60)
-        logger.info("📡 ADDITIONAL RSS: Fetching configured feeds")
-        logger.info("-" * 60)
-        category_counts['rss_feeds'] = 0
-        
-        for feed in rss_feeds:
-            feed_name = feed.get('name', 'Unknown Feed')
-            feed_url = feed.get('url', '')
-            feed_category = feed.get('category', 'headline')
-            
-            if feed_url:
-                articles = fetch_rss_feed(
-                    url=feed_url,
-                    source_name=feed_name,
-                    category=feed_category
-                )
-                all_articles.extend(articles)
-                category_counts['rss_feeds'] += len(articles)
-        
-        logger.info(f"  -> Total from RSS Feeds: {category_counts['rss_feeds']} items")
+    # Same article reported by several sources or queries: keep one copy
+    collected = len(all_articles)
+    all_articles = merge_duplicate_articles(all_articles)
+    duplicates_merged = collected - len(all_articles)
 
     # Build the report
     report = {
         'generated_at': datetime.now().isoformat(),
         'total_items': len(all_articles),
         'category_counts': category_counts,
+        'shard': {'index': shard_index, 'count': shard_count, 'by': shard_by, 'run_id': run_id},
+        'schedule': {**scheduler.summary(), **last_fetched.summary()},
+        'host_health': health.summary(),
+        'budget': budget.summary(),
+        'prefilter': prefilter.summary(),
+        'search_cache': search_cache.summary(),
+        'query_planner': planner.summary(),
+        'archive': archive.summary() if archive else {'mode': 'off'},
+        'coalescing': {
+            'duplicate_articles_merged': duplicates_merged,
+            'duplicate_search_results_merged': search_duplicates,
+            'requests_coalesced': fetcher.coalesced,
+        },
         'articles': all_articles,
     }
 
@@ -464,6 +731,17 @@ def run_scout() -> Dict[str, Any]:
     logger.info("📊 SCOUT REPORT:")
     for cat, count in category_counts.items():
         logger.info(f"   {cat}: {count} items")
+    if scheduler.skipped:
+        logger.info(f"   Skipped (not due): {len(scheduler.skipped)} sources")
+    if last_fetched.carried:
+        logger.info(f"   Carried over from earlier fetches: {sum(last_fetched.carried.values())} items "
+                    f"from {len(last_fetched.carried)} sources")
+    if duplicates_merged or fetcher.coalesced:
+        logger.info(f"   Coalesced: {duplicates_merged} duplicate articles, {fetcher.coalesced} repeat requests")
+    for tier, names in budget.skipped.items():
+        logger.info(f"   Skipped ({tier}, out of time): {len(names)}")
+    if health.skipped:
+        logger.info(f"   Skipped (circuit open): {', '.join(sorted(health.skipped))}")
     logger.info(f"   TOTAL: {len(all_articles)} items")
     logger.info("=" * 60)
 
@@ -491,8 +769,42 @@ def save_raw_intel(report: Dict[str, Any], output_path: Optional[Path] = None) -
 
 def main():
     """Main entry point for the Scout agent."""
-    report = run_scout()
-    save_raw_intel(report)
+    import argparse
+
+    arg_parser = argparse.ArgumentParser(description='Scout agent: collect raw grain-tech intel.')
+    arg_parser.add_argument('--full-sweep', action='store_true',
+                            help='Fetch every source, ignoring the adaptive poll schedule.')
+    arg_parser.add_argument('--deadline-minutes', type=float, default=None,
+                            help='Overall time budget; lower-value work is skipped as it nears.')
+    arg_parser.add_argument('--shard', default=None,
+                            help="Run only shard i of N alert queries, as 'i/N' (0-based).")
+    arg_parser.add_argument('--shard-by', choices=SHARD_KEYS, default='alert_id')
+    arg_parser.add_argument('--run-id', default=None,
+                            help='Checkpoint namespace for query runs (default: date); resumes that run.')
+    arg_parser.add_argument('--resume', action='store_true',
+                            help="Resume today's run from its query checkpoint instead of searching again.")
+    arg_parser.add_argument('--output', type=Path, default=None,
+                            help='Report path (default: src/data/raw_intel.json).')
+    arg_parser.add_argument('--archive', choices=['capture', 'replay'], default=None,
+                            help='Archive every raw response, or re-run parsing from the archive offline.')
+    arg_parser.add_argument('--merge-shards', type=Path, nargs='+', default=None, metavar='REPORT',
+                            help='Merge shard reports into one raw intel report and exit.')
+    args = arg_parser.parse_args()
+
+    if args.merge_shards:
+        save_raw_intel(merge_shard_reports(args.merge_shards), args.output)
+        return
+
+    report = run_scout(
+        full_sweep=args.full_sweep,
+        deadline_minutes=args.deadline_minutes,
+        shard=parse_shard_spec(args.shard) if args.shard else None,
+        shard_by=args.shard_by,
+        run_id=args.run_id,
+        resume=args.resume,
+        archive_mode=args.archive,
+    )
+    save_raw_intel(report, args.output)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,146 @@
+"""
+Query Shards - Split the alert-query set across runners and resume after crashes.
+
+Queries are assigned to shards deterministically (by a stable hash of
+alert_id or of section), so every runner in a CI matrix agrees on who owns
+what. Each finished query is appended to a per-shard JSONL checkpoint. A
+shard restarted with resume (--resume, or an explicit --run-id) replays
+those results instead of searching again; any other run starts a fresh
+checkpoint, so a same-day rerun searches again. Checkpoints older than
+keep_days are deleted. Shard reports are combined into one raw intel
+report with merge_shard_reports().
+"""
+
+import hashlib
+import json
+import logging
+import shutil
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+from src.sources.csv_ingest import AlertQuery
+from src.sources.urls import merge_duplicate_articles
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_ROOT = Path(__file__).resolve().parents[2] / 'data' / 'checkpoints' / 'queries'
+
+SHARD_KEYS = ('alert_id', 'section')
+
+
+def parse_shard_spec(spec: str) -> Tuple[int, int]:
+    """Parse 'i/N' (0-based shard index, shard count)."""
+    try:
+        index_str, count_str = spec.split('/')
+        index, count = int(index_str), int(count_str)
+    except ValueError:
+        raise ValueError(f"Shard must look like 'i/N', got '{spec}'")
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f"Shard index must be in [0, {count}), got {index}")
+    return index, count
+
+
+def shard_of(query: AlertQuery, count: int, by: str = 'alert_id') -> int:
+    """Stable shard number for a query (independent of PYTHONHASHSEED)."""
+    if by not in SHARD_KEYS:
+        raise ValueError(f"Unknown shard key '{by}', expected one of {SHARD_KEYS}")
+    key = getattr(query, by) or query.title
+    return int(hashlib.sha1(key.encode('utf-8')).hexdigest(), 16) % count
+
+
+def shard_queries(queries: List[AlertQuery], index: int, count: int, by: str = 'alert_id') -> List[AlertQuery]:
+    """Queries owned by shard `index` of `count`, in their original order."""
+    return [q for q in queries if shard_of(q, count, by) == index]
+
+
+def prune_checkpoints(keep_days: float = 7, root: Path = CHECKPOINT_ROOT) -> int:
+    """Delete run checkpoint directories not written to in `keep_days`. Returns how many."""
+    if not root.exists():
+        return 0
+    cutoff = time.time() - keep_days * 86400
+    removed = 0
+    for run_dir in root.iterdir():
+        if run_dir.is_dir() and run_dir.stat().st_mtime < cutoff:
+            shutil.rmtree(run_dir, ignore_errors=True)
+            removed += 1
+    if removed:
+        logger.info(f"🧹 Removed {removed} query checkpoints older than {keep_days:g} days")
+    return removed
+
+
+class QueryCheckpoint:
+    """
+    Append-only record of finished queries for one shard of one run.
+
+    With resume=False an existing checkpoint for the same run is discarded,
+    so only an explicit resume replays earlier results.
+    """
+
+    def __init__(self, run_id: str, index: int = 0, count: int = 1, root: Path = CHECKPOINT_ROOT,
+                 resume: bool = False):
+        self.path = root / run_id / f"shard-{index}-of-{count}.jsonl"
+        self.completed: Dict[str, List[Dict[str, Any]]] = {}
+        if resume:
+            self._load()
+        elif self.path.exists():
+            self.path.unlink()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash mid-write leaves a truncated last line
+                    continue
+                self.completed[entry['alert_id']] = entry['results']
+        logger.info(f"📂 Query checkpoint: {len(self.completed)} queries already done ({self.path})")
+
+    def get(self, alert_id: str) -> Optional[List[Dict[str, Any]]]:
+        return self.completed.get(alert_id)
+
+    def record(self, alert_id: str, results: List[Dict[str, Any]]) -> None:
+        """Persist a finished query immediately (one line per query)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({
+                'alert_id': alert_id,
+                'completed_at': datetime.now().isoformat(),
+                'results': results,
+            }, ensure_ascii=False) + '\n')
+        self.completed[alert_id] = results
+
+
+def merge_shard_reports(paths: List[Path]) -> Dict[str, Any]:
+    """Combine shard raw intel reports into a single report."""
+    articles: List[Dict[str, Any]] = []
+    category_counts: Dict[str, int] = {}
+    skipped: Dict[str, List[str]] = {}
+    shards = []
+
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            report = json.load(f)
+
+        articles.extend(report.get('articles', []))
+        for category, count in report.get('category_counts', {}).items():
+            category_counts[category] = category_counts.get(category, 0) + count
+        for tier, names in report.get('budget', {}).get('skipped', {}).items():
+            skipped.setdefault(tier, []).extend(names)
+        shards.append(report.get('shard', {'file': str(path)}))
+
+    merged = merge_duplicate_articles(articles)
+    logger.info(f"Merged {len(paths)} shard reports: {len(merged)} articles ({len(articles) - len(merged)} duplicates)")
+
+    return {
+        'generated_at': datetime.now().isoformat(),
+        'total_items': len(merged),
+        'category_counts': category_counts,
+        'shards': shards,
+        'budget': {'skipped': skipped, 'complete': not skipped},
+        'articles': merged,
+    }
@@ -0,0 +1,156 @@
+"""
+Synthetic Corpus - Deterministic fake articles for scaling benchmarks.
+
+Articles are assembled from the real scoring vocabularies (tracked
+company and product names, technology and grain-industry keywords,
+NEGATIVE_KEYWORDS noise) plus neutral filler, in roughly the proportions
+seen in raw_intel.json: most items are generic agriculture news, some
+mention a tracked company, some are off-topic noise. The same seed and
+size always produce the same corpus.
+
+Usage:
+    python -m src.benchmarks.corpus --size 10000 --output /tmp/corpus.json
+"""
+
+import argparse
+import json
+import random
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List, Dict, Any, Iterator
+
+from src.agents.curator import HIGH_VALUE_KEYWORDS, MEDIUM_VALUE_KEYWORDS, LOW_VALUE_KEYWORDS
+from src.entities import get_matcher
+from src.transform_to_curated import (
+    NEGATIVE_KEYWORDS,
+    TECH_KEYWORDS,
+    GRAIN_INDUSTRY_KEYWORDS,
+)
+
+FILLER_WORDS = [
+    'report', 'season', 'farmers', 'prices', 'growers', 'industry', 'market',
+    'update', 'new', 'launch', 'partnership', 'research', 'study', 'results',
+    'region', 'province', 'export', 'demand', 'supply', 'weather', 'yield',
+    'announced', 'today', 'week', 'year', 'outlook', 'analysis', 'data',
+    'platform', 'system', 'customers', 'pilot', 'trial', 'rollout', 'network',
+]
+
+SOURCES = [
+    'Grain Central', 'GrainsWest', 'World Grain', 'Future Farming',
+    'Canadian Grain Commission', 'Protein Industries Canada', 'Farm Forum',
+    'AgFunderNews', 'Successful Farming', 'Google Alert: grain grading',
+    'Google Alert: NIR analysis', 'arXiv cs.CV', 'Reuters Agriculture',
+]
+
+CATEGORIES = ['vertical_grain', 'company', 'technology', 'headline', 'research', 'scraped_web']
+
+# Share of articles drawn from each profile
+PROFILE_WEIGHTS = {
+    'generic': 0.55,
+    'company': 0.15,
+    'tech': 0.15,
+    'noise': 0.10,
+    'duplicate': 0.05,
+}
+
+EPOCH = datetime(2025, 1, 1)
+
+
+def _company_names() -> List[str]:
+    return [entity['name'] for entity in get_matcher().entities]
+
+
+def _sentence(rng: random.Random, terms: List[str], words: int) -> str:
+    """Filler words with the given terms dropped in at random positions."""
+    tokens = [rng.choice(FILLER_WORDS) for _ in range(words)]
+    for term in terms:
+        tokens.insert(rng.randrange(len(tokens) + 1), term)
+    return ' '.join(tokens)
+
+
+def iter_articles(size: int, seed: int = 0) -> Iterator[Dict[str, Any]]:
+    """
+    Yield `size` synthetic raw articles in the scout output format.
+
+    Generated lazily so million-item corpora can be streamed to disk.
+    """
+    rng = random.Random(seed)
+    companies = _company_names()
+    tech = TECH_KEYWORDS + HIGH_VALUE_KEYWORDS + MEDIUM_VALUE_KEYWORDS
+    grain = GRAIN_INDUSTRY_KEYWORDS + LOW_VALUE_KEYWORDS
+    profiles = list(PROFILE_WEIGHTS)
+    weights = list(PROFILE_WEIGHTS.values())
+    recent_titles: List[str] = []
+
+    for i in range(size):
+        profile = rng.choices(profiles, weights)[0]
+
+        if profile == 'duplicate' and recent_titles:
+            title = rng.choice(recent_titles)
+        else:
+            terms = rng.sample(grain, 1)
+            if profile == 'company':
+                terms.append(rng.choice(companies))
+            elif profile == 'tech':
+                terms.append(rng.choice(tech))
+            elif profile == 'noise':
+                terms.append(rng.choice(NEGATIVE_KEYWORDS))
+            title = _sentence(rng, terms, rng.randint(5, 10)).capitalize() + f" #{i}"
+
+        summary_terms = rng.sample(grain, 2)
+        if profile in ('company', 'tech'):
+            summary_terms.append(rng.choice(tech))
+        if profile == 'noise':
+            summary_terms.extend(rng.sample(NEGATIVE_KEYWORDS, 2))
+        summary = _sentence(rng, summary_terms, rng.randint(25, 70))
+        if rng.random() < 0.3:
+            summary = f"<p>{summary}</p><p>The post {title} appeared first on Example.</p>"
+
+        if profile == 'company' and rng.random() < 0.5:
+            source = rng.choice(companies)
+        else:
+            source = rng.choice(SOURCES)
+
+        recent_titles.append(title)
+        if len(recent_titles) > 50:
+            recent_titles.pop(0)
+
+        yield {
+            'title': title,
+            'link': f"https://example.com/{profile}/{i}",
+            'summary': summary[:500],
+            'published': (EPOCH + timedelta(minutes=rng.randrange(60 * 24 * 365))).isoformat(),
+            'source': source,
+            'category': 'company' if profile == 'company' else rng.choice(CATEGORIES),
+        }
+
+
+def generate_corpus(size: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """Build a synthetic corpus of `size` articles."""
+    return list(iter_articles(size, seed))
+
+
+def write_corpus(size: int, output_path: Path, seed: int = 0) -> None:
+    """Write a raw_intel.json-shaped report, streaming articles to disk."""
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write('{"generated_at": "%s", "total_items": %d, "articles": [\n' % (EPOCH.isoformat(), size))
+        for i, article in enumerate(iter_articles(size, seed)):
+            if i:
+                f.write(',\n')
+            f.write(json.dumps(article, ensure_ascii=False))
+        f.write('\n]}\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic raw intel corpus")
+    parser.add_argument('--size', type=int, default=10000, help="Number of articles")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed")
+    parser.add_argument('--output', type=Path, required=True, help="Output JSON path")
+    args = parser.parse_args()
+
+    write_corpus(args.size, args.output, args.seed)
+    print(f"Wrote {args.size} synthetic articles to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+"""
+Import-Time Benchmarks - Cold-start cost of each entry point.
+
+Every entry point is imported in a fresh interpreter under
+`python -X importtime`, so nothing is shared between measurements. The
+benchmark reports the cumulative import time of the entry module, the
+wall time of the whole process (interpreter start-up included), which of
+the heavy dependencies the import pulled in, and the slowest individual
+imports. Dependencies bound with src.lazy.lazy_import should not appear
+until they are first used.
+
+Usage:
+    python -m src.benchmarks.import_time
+    python -m src.benchmarks.import_time --modules src.pipeline src.agents.scout --repeat 5
+    python -m src.benchmarks.import_time --output imports.json
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import List, Dict, Any
+
+# scripts/scraper, so `src.*` resolves in the child interpreters
+SCRAPER_ROOT = Path(__file__).resolve().parents[2]
+
+ENTRY_POINTS = [
+    'src.pipeline',
+    'src.agents.scout',
+    'src.agents.curator',
+    'src.transform_to_curated',
+    'src.search_index',
+    'src.trend_aggregates',
+    'src.entities',
+]
+
+HEAVY_DEPENDENCIES = [
+    'feedparser', 'requests', 'bs4', 'soupsieve', 'dateutil', 'yaml', 'numpy', 'google.generativeai',
+]
+
+# "import time:   self [us] | cumulative | imported package"
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+
+def _run(statement: str) -> Dict[str, Any]:
+    """Run `statement` in a fresh interpreter with -X importtime."""
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE='1')
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        cwd=SCRAPER_ROOT, env=env, capture_output=True, text=True,
+    )
+    wall = time.perf_counter() - start
+    if proc.returncode != 0:
+        raise RuntimeError(f"`{statement}` failed:\n{proc.stderr.strip().splitlines()[-1]}")
+
+    imports = []
+    for line in proc.stderr.splitlines():
+        m = IMPORTTIME_LINE.match(line)
+        if m:
+            imports.append({'module': m.group(4), 'self_us': int(m.group(1)), 'cumulative_us': int(m.group(2))})
+    return {'wall_seconds': wall, 'imports': imports}
+
+
+def measure(module: str, repeat: int = 3, top: int = 5) -> Dict[str, Any]:
+    """Best-of-`repeat` cold import of one module."""
+    best = None
+    for _ in range(repeat):
+        run = _run(f'import {module}')
+        if best is None or run['wall_seconds'] < best['wall_seconds']:
+            best = run
+
+    entry = next((i for i in reversed(best['imports']) if i['module'] == module), None)
+    names = {i['module'] for i in best['imports']}
+    slowest = sorted(best['imports'], key=lambda i: i['self_us'], reverse=True)[:top]
+
+    return {
+        'module': module,
+        'import_ms': round(entry['cumulative_us'] / 1000, 1) if entry else None,
+        'wall_ms': round(best['wall_seconds'] * 1000, 1),
+        'modules_imported': len(names),
+        'heavy_loaded': [dep for dep in HEAVY_DEPENDENCIES if dep in names],
+        'slowest': [{'module': i['module'], 'self_ms': round(i['self_us'] / 1000, 1)} for i in slowest],
+    }
+
+
+def run_benchmarks(modules: List[str], repeat: int = 3, top: int = 5) -> Dict[str, Any]:
+    """Measure the bare interpreter, then every module; print a table as results come in."""
+    baseline = min(_run('pass')['wall_seconds'] for _ in range(repeat))
+    print(f"interpreter start-up: {baseline * 1000:.1f} ms\n")
+    print(f"{'module':<26} {'import ms':>10} {'wall ms':>9} {'modules':>8}  heavy deps loaded")
+
+    results: Dict[str, Any] = {'interpreter_ms': round(baseline * 1000, 1), 'modules': {}}
+    for module in modules:
+        row = measure(module, repeat, top)
+        results['modules'][module] = row
+        heavy = ', '.join(row['heavy_loaded']) or '-'
+        print(f"{module:<26} {row['import_ms'] or 0:>10.1f} {row['wall_ms']:>9.1f} {row['modules_imported']:>8}  {heavy}")
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold-start import time of the scraper entry points")
+    parser.add_argument('--modules', nargs='+', default=ENTRY_POINTS, help="Modules to import")
+    parser.add_argument('--repeat', type=int, default=3, help="Fresh interpreters per module (best is kept)")
+    parser.add_argument('--top', type=int, default=5, help="Slowest imports to record per module")
+    parser.add_argument('--output', type=Path, help="Also write results as JSON")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.modules, args.repeat, args.top)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+"""
+Scaling Benchmarks - Throughput, memory and growth rate of the scorers.
+
+Each stage runs over synthetic corpora of increasing size (see corpus.py).
+For every size the benchmark reports wall time, articles per second and
+peak traced memory; across sizes it fits log(time) against log(n) and
+reports the slope as the empirical complexity exponent (1.0 = linear,
+2.0 = quadratic). Timing and memory are measured in separate passes
+because tracemalloc slows allocation-heavy code considerably.
+
+Usage:
+    python -m src.benchmarks.scaling
+    python -m src.benchmarks.scaling --sizes 1000 10000 100000 1000000 --stages relevance tags
+    python -m src.benchmarks.scaling --output bench.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import math
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, List, Dict, Any, Optional
+
+from src.agents.curator import curate_articles, get_summarizer
+from src.benchmarks.corpus import generate_corpus
+from src.transform_to_curated import calculate_relevance, clean_html, find_company_tags, transform_articles
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+
+
+def _run_tags(articles: List[Dict[str, Any]]) -> None:
+    for article in articles:
+        find_company_tags(clean_html(f"{article['title']} {article['summary']}"))
+
+
+def _run_relevance(articles: List[Dict[str, Any]]) -> None:
+    for article in articles:
+        calculate_relevance(article)
+
+
+def _run_summarize(articles: List[Dict[str, Any]]) -> None:
+    get_summarizer().summarize_articles(articles)
+
+
+def _run_curate(articles: List[Dict[str, Any]]) -> None:
+    curate_articles(articles, use_ai=False)
+
+
+def _run_transform(articles: List[Dict[str, Any]]) -> None:
+    with tempfile.TemporaryDirectory() as tmp, contextlib.redirect_stdout(io.StringIO()):
+        transform_articles(articles, Path(tmp) / 'curatedNews.json')
+
+
+STAGES: Dict[str, Callable[[List[Dict[str, Any]]], None]] = {
+    'tags': _run_tags,
+    'relevance': _run_relevance,
+    'summarize': _run_summarize,
+    'curate': _run_curate,
+    'transform': _run_transform,
+}
+
+
+def complexity_slope(sizes: List[int], seconds: List[float]) -> Optional[float]:
+    """Least-squares slope of log(seconds) against log(size)."""
+    points = [(math.log(n), math.log(t)) for n, t in zip(sizes, seconds) if n > 0 and t > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    var = sum((x - mean_x) ** 2 for x, _ in points)
+    if var == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / var
+
+
+def measure(stage: str, size: int, seed: int = 0, repeat: int = 1) -> Dict[str, Any]:
+    """Time one stage on a corpus of `size` articles, then trace its memory."""
+    run = STAGES[stage]
+
+    # Fresh corpus per pass: some stages annotate articles in place
+    best = float('inf')
+    for _ in range(repeat):
+        articles = generate_corpus(size, seed)
+        start = time.perf_counter()
+        run(articles)
+        best = min(best, time.perf_counter() - start)
+
+    articles = generate_corpus(size, seed)
+    tracemalloc.start()
+    try:
+        run(articles)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'stage': stage,
+        'size': size,
+        'seconds': round(best, 4),
+        'items_per_second': round(size / best) if best > 0 else None,
+        'peak_memory_mb': round(peak / 1_000_000, 2),
+    }
+
+
+def run_benchmarks(stages: List[str], sizes: List[int], seed: int = 0, repeat: int = 1) -> Dict[str, Any]:
+    """Sweep every stage over every size; print a table as results come in."""
+    results: Dict[str, Any] = {}
+    print(f"{'stage':<10} {'size':>9} {'seconds':>9} {'items/s':>10} {'peak MB':>9}")
+
+    for stage in stages:
+        rows = []
+        for size in sizes:
+            row = measure(stage, size, seed, repeat)
+            rows.append(row)
+            print(f"{stage:<10} {size:>9} {row['seconds']:>9.3f} {row['items_per_second'] or 0:>10} {row['peak_memory_mb']:>9.2f}")
+
+        slope = complexity_slope([r['size'] for r in rows], [r['seconds'] for r in rows])
+        slope_text = f"{slope:.2f}" if slope is not None else 'n/a'
+        print(f"{stage:<10} complexity exponent ≈ {slope_text}\n")
+        results[stage] = {'runs': rows, 'complexity_exponent': round(slope, 3) if slope is not None else None}
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scaling benchmarks for the article scorers")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="Corpus sizes to sweep")
+    parser.add_argument('--stages', nargs='+', choices=list(STAGES), default=list(STAGES), help="Stages to run")
+    parser.add_argument('--seed', type=int, default=0, help="Corpus seed")
+    parser.add_argument('--repeat', type=int, default=1, help="Timing passes per size (best is kept)")
+    parser.add_argument('--output', type=Path, help="Also write results as JSON")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.stages, sorted(args.sizes), args.seed, args.repeat)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'seed': args.seed, 'sizes': sorted(args.sizes), 'stages': results}, f, indent=2)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,267 @@
+"""
+Company Monitor - Offline site health probes and company news snapshot.
+
+Probes every tracked company's website (entity registry `url`) and pulls
+its latest Google News headlines (`search_terms`), with bounded
+parallelism. Each probe is appended to a per-company latency history so
+the snapshot can report p50/p95 response times, uptime and when the
+site's status last changed, not just a single sample.
+
+The history lives in data/state/company_monitor.json; the snapshot
+(src/data/companyMonitor.json) keeps the shape /api/company-monitor has
+always returned, so the endpoint serves it as a static file behind CDN
+cache headers instead of fanning out to 40+ requests per visitor. The
+snapshot is only rewritten when a status or headline changed (or weekly,
+to refresh the latency figures), so quiet nights commit and deploy
+nothing.
+
+The repository ships an empty placeholder snapshot (`updatedAt` unset).
+Until the first nightly run, or a local `python -m src.company_monitor`,
+commits a real one, the endpoint still probes the sites live on each CDN
+cache miss.
+
+Usage:
+    python -m src.company_monitor
+"""
+
+import json
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+from urllib.parse import quote_plus
+
+from src.entities import get_matcher
+from src.lazy import lazy_import
+from src.state import load_state, save_state
+from src.transform_to_curated import PROJECT_ROOT, clean_html
+
+requests = lazy_import('requests')
+feedparser = lazy_import('feedparser')
+
+logger = logging.getLogger(__name__)
+
+STATE_FILE = 'company_monitor.json'
+MONITOR_PATH = PROJECT_ROOT / 'src' / 'data' / 'companyMonitor.json'
+
+USER_AGENT = 'GrainTech-Monitor/1.0'
+NEWS_URL = 'https://news.google.com/rss/search?q={query}&hl=en&gl=US&ceid=US:en'
+
+# Servers that refuse HEAD are retried with a GET
+HEAD_UNSUPPORTED = {403, 405, 501}
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile (pct in 0-100); None for an empty list."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))  # ceil
+    return ordered[int(rank) - 1]
+
+
+class CompanyProber:
+    """Site probes, news lookups and the latency history behind the snapshot."""
+
+    def __init__(
+        self,
+        workers: int = 8,
+        timeout: float = 5,
+        news_timeout: float = 8,
+        history_size: int = 48,
+        news_per_company: int = 3,
+        now: Optional[datetime] = None,
+    ):
+        self.workers = workers
+        self.timeout = timeout
+        self.news_timeout = news_timeout
+        self.history_size = history_size
+        self.news_per_company = news_per_company
+        self.now = now or datetime.now(timezone.utc)
+
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': USER_AGENT})
+
+        self.state = load_state(STATE_FILE, {'companies': {}})
+        self.companies: Dict[str, Dict[str, Any]] = self.state.setdefault('companies', {})
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'CompanyProber':
+        """Build a prober from the `company_monitor` section of sources.yaml."""
+        monitor_config = config.get('company_monitor', {}) or {}
+        return cls(
+            workers=monitor_config.get('workers', 8),
+            timeout=monitor_config.get('timeout_seconds', 5),
+            news_timeout=monitor_config.get('news_timeout_seconds', 8),
+            history_size=monitor_config.get('history_size', 48),
+            news_per_company=monitor_config.get('news_per_company', 3),
+        )
+
+    def probe_site(self, url: str) -> Dict[str, Any]:
+        """One health check: HTTP status, response time and whether it's up."""
+        start = time.monotonic()
+        try:
+            response = self.session.head(url, timeout=self.timeout, allow_redirects=True)
+            if response.status_code in HEAD_UNSUPPORTED:
+                response = self.session.get(url, timeout=self.timeout, allow_redirects=True, stream=True)
+                response.close()
+            status, online = response.status_code, response.ok
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"  Probe failed for {url}: {type(e).__name__}")
+            status, online = None, False
+        elapsed_ms = int((time.monotonic() - start) * 1000)
+        return {'status': status, 'responseMs': elapsed_ms, 'online': online}
+
+    def fetch_news(self, company: Dict[str, Any]) -> List[Dict[str, str]]:
+        """Latest headlines, preferring ones that name the company or its products."""
+        url = NEWS_URL.format(query=quote_plus(company.get('search_terms') or company['name']))
+        try:
+            response = self.session.get(url, timeout=self.news_timeout)
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"  News lookup failed for {company['name']}: {type(e).__name__}")
+            return []
+
+        entries = feedparser.parse(response.content).entries
+        matcher = get_matcher()
+        mentioning = [e for e in entries if company['id'] in matcher.company_ids(e.get('title', ''))]
+
+        articles = []
+        for entry in (mentioning or entries)[:self.news_per_company]:
+            title = clean_html(entry.get('title', ''))
+            source = (entry.get('source') or {}).get('title') or title.rpartition(' - ')[2]
+            published = entry.get('published_parsed')
+            articles.append({
+                'title': title.rsplit(' - ', 1)[0] if ' - ' in title else title,  # Strip " - Source Name"
+                'url': entry.get('link', ''),
+                'date': datetime(*published[:6]).date().isoformat() if published else '',
+                'source': source,
+            })
+        return articles
+
+    def record(self, company_id: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Append a probe to the history and return the company's health summary."""
+        entry = self.companies.setdefault(company_id, {'history': [], 'last_change': None})
+        history = entry['history']
+        checked_at = self.now.isoformat(timespec='seconds')
+
+        previous = history[-1] if history else None
+        if previous is None or previous[1] != result['status']:
+            entry['last_change'] = checked_at
+        history.append([checked_at, result['status'], result['responseMs'], result['online']])
+        del history[:-self.history_size]
+
+        latencies = [ms for _, _, ms, online in history if online]
+        p50, p95 = percentile(latencies, 50), percentile(latencies, 95)
+        return {
+            **result,
+            'p50Ms': p50,
+            'p95Ms': p95,
+            'uptime': round(sum(1 for *_, online in history if online) / len(history), 3),
+            'samples': len(history),
+            'lastChange': entry['last_change'],
+        }
+
+    def run(self, companies: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Probe every company concurrently and build the snapshot."""
+        companies = [c for c in companies if c.get('url')]
+        logger.info(f"🩺 Probing {len(companies)} company sites ({self.workers} workers)")
+
+        # Both maps are submitted up front so site probes and news lookups share the pool
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            probes = pool.map(lambda c: self.probe_site(c['url']), companies)
+            news = pool.map(self.fetch_news, companies)
+            results = list(zip(probes, news))
+
+        snapshot = {'updatedAt': self.now.isoformat(timespec='seconds'), 'health': {}, 'news': {}}
+        for company, (probe, articles) in zip(companies, results):
+            snapshot['health'][company['name']] = self.record(company['id'], probe)
+            snapshot['news'][company['name']] = {'articles': articles}
+
+        # Companies dropped from the registry stop accumulating history
+        tracked = {c['id'] for c in companies}
+        for company_id in list(self.companies):
+            if company_id not in tracked:
+                del self.companies[company_id]
+
+        return snapshot
+
+    def save(self) -> None:
+        save_state(STATE_FILE, self.state)
+
+    def summary(self, snapshot: Dict[str, Any]) -> Dict[str, Any]:
+        health = snapshot['health'].values()
+        return {
+            'companies': len(snapshot['health']),
+            'online': sum(1 for h in health if h['online']),
+            'articles': sum(len(n['articles']) for n in snapshot['news'].values()),
+        }
+
+
+def _material(snapshot: Dict[str, Any]) -> Dict[str, Any]:
+    """What a visitor notices: status, up/down, last status change and headlines (not per-probe timings)."""
+    return {
+        'health': {name: {key: health.get(key) for key in ('status', 'online', 'lastChange')}
+                   for name, health in snapshot.get('health', {}).items()},
+        'news': snapshot.get('news', {}),
+    }
+
+
+def snapshot_changed(snapshot: Dict[str, Any], path: Path = MONITOR_PATH, refresh_days: float = 7) -> bool:
+    """
+    True if the snapshot differs from the published one in anything but
+    timings, or the published one is older than `refresh_days` (so the
+    latency figures still get refreshed now and then).
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            published = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return True
+    if not published.get('updatedAt') or _material(published) != _material(snapshot):
+        return True
+    age = datetime.fromisoformat(snapshot['updatedAt']) - datetime.fromisoformat(published['updatedAt'])
+    return age.total_seconds() >= refresh_days * 86400
+
+
+def write_snapshot(snapshot: Dict[str, Any], path: Path = MONITOR_PATH) -> None:
+    """Write the snapshot compactly (atomic replace)."""
+    tmp_path = path.with_suffix('.json.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(snapshot, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, path)
+    logger.info(f"Company monitor: {len(snapshot['health'])} companies -> {path}")
+
+
+def update_company_monitor(config: Optional[Dict[str, Any]] = None, path: Path = MONITOR_PATH) -> Dict[str, Any]:
+    """
+    Probe all registry companies, persist the history and rewrite the
+    snapshot if it changed (so an uneventful night commits nothing).
+    """
+    config = config or {}
+    prober = CompanyProber.from_config(config)
+    snapshot = prober.run(get_matcher().companies())
+    prober.save()
+    refresh_days = (config.get('company_monitor', {}) or {}).get('refresh_days', 7)
+    if snapshot_changed(snapshot, path, refresh_days):
+        write_snapshot(snapshot, path)
+    else:
+        logger.info(f"Company monitor: no status or headline changes, keeping {path.name}")
+
+    stats = prober.summary(snapshot)
+    logger.info(f"  -> {stats['online']}/{stats['companies']} sites online, {stats['articles']} headlines")
+    return snapshot
+
+
+def main():
+    from src.agents.scout import load_sources_config
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    update_company_monitor(load_sources_config())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,414 @@
+"""
+Scout Daemon - Continuous feed polling with an event-driven publish queue.
+
+The nightly pipeline publishes once a day, so a story can wait up to 24
+hours to reach the dashboard. The daemon runs the feed half of the scout
+as a long-lived asyncio service instead:
+
+  * every feed (SOURCE_MAP, the sources.yaml feed groups and site
+    scrapers) has its own polling task, due on the cadence the poll
+    scheduler has learned for it, clamped to the daemon's interval range;
+  * fetches run in worker threads, at most `workers` at a time;
+  * articles not published before are scored with the transform scorer
+    and pushed onto an in-process queue;
+  * one publisher task drains the queue in short batches and runs the
+    incremental writers: curatedNews.json is re-ranked from a bounded
+    pool of scored articles and published as a new delta version (see
+    news_deltas.py), the trend cubes take just the new articles, and the
+    search index is rebuilt at most every `index_interval_minutes`.
+
+Alert searches stay in the nightly run (they are slow and rate limited).
+
+Progress is checkpointed in data/state/daemon.json after every batch: the
+links already published, the ranked pool and the index window. With
+--output-dir, that checkpoint and every other state file (poll schedule,
+host health, news versions, trend keys) go to <output-dir>/state instead,
+and the pool is only seeded from a raw_intel.json in the output directory,
+so a trial run never touches the production state. An article
+only counts as published once its batch has been written, so a crash
+re-fetches it rather than losing it. SIGINT/SIGTERM stop the pollers, let
+in-flight fetches finish, flush the queue and save the checkpoint.
+
+Usage:
+    python -m src.daemon
+    python -m src.daemon --once
+    python -m src.daemon --config stub_sources.yaml --output-dir /tmp/daemon --once
+
+To run against local stub feeds, serve a directory of feed files
+(`python -m http.server 8000`) and point a config at it with
+`daemon.include_builtin_sources: false`, then pass --output-dir.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import signal
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+from src.state import load_state, save_state, use_state_dir
+from src.sources.fetcher import Fetcher
+from src.sources.host_health import HostHealth
+from src.sources.urls import link_identity
+from src.agents.scheduler import PollScheduler
+from src.agents.scout import SOURCE_MAP, collect_sources, coalesce_sources, fetch_source, load_sources_config
+from src.transform_to_curated import (
+    CURATED_PATH,
+    MAX_CURATED,
+    PROJECT_ROOT,
+    RAW_INTEL_PATH,
+    build_curated,
+    clean_html,
+    score_articles,
+    write_curated,
+)
+from src.news_deltas import BUNDLED_VERSION_PATH, NEWS_DIR, publish_versions
+from src.search_index import SEARCH_INDEX_PATH, build_search_index
+from src.trend_aggregates import TRENDS_PATH, update_trends
+
+logger = logging.getLogger(__name__)
+
+STATE_FILE = 'daemon.json'
+
+
+def article_key(article: Dict[str, Any]) -> str:
+    """Identity of an article across sources and polls."""
+    raw = link_identity(article.get('link', ''), clean_html(article.get('title', '')))
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:16]
+
+
+@dataclass
+class Arrival:
+    """Newly seen articles from one poll, as queued for the writers."""
+    source: str
+    articles: List[Dict[str, Any]]  # Everything new (marked published)
+    accepted: List[Dict[str, Any]]  # Scored, relevance > 0 (curatedNews.json, search index, trends)
+
+
+class ScoutDaemon:
+    """Per-source pollers feeding a single publisher through an asyncio queue."""
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        output_dir: Optional[Path] = None,
+        workers: int = 8,
+        min_interval_minutes: float = 10,
+        max_interval_minutes: float = 360,
+        flush_seconds: float = 30,
+        index_interval_minutes: float = 15,
+        pool_size: int = 200,
+        include_builtin_sources: bool = True,
+        publish_command: Optional[str] = None,
+    ):
+        self.config = config
+        self.workers = workers
+        self.flush_seconds = flush_seconds
+        self.index_interval = index_interval_minutes * 60
+        self.pool_size = pool_size
+        self.include_builtin_sources = include_builtin_sources
+        self.publish_command = publish_command
+        self.max_age = timedelta(days=config.get('max_age_days', 14))
+
+        self.curated_path = output_dir / CURATED_PATH.name if output_dir else CURATED_PATH
+        self.index_path = output_dir / SEARCH_INDEX_PATH.name if output_dir else SEARCH_INDEX_PATH
+        self.trends_path = output_dir / TRENDS_PATH.name if output_dir else TRENDS_PATH
+        self.news_dir = output_dir / NEWS_DIR.name if output_dir else NEWS_DIR
+        self.bundled_version_path = output_dir / BUNDLED_VERSION_PATH.name if output_dir else BUNDLED_VERSION_PATH
+        self.raw_intel_path = output_dir / RAW_INTEL_PATH.name if output_dir else RAW_INTEL_PATH
+        if output_dir:
+            # Before any state is loaded: schedule, host health and news versions follow it too
+            use_state_dir(output_dir / 'state')
+
+        self.scheduler = PollScheduler(
+            min_interval_hours=min_interval_minutes / 60,
+            max_interval_hours=max_interval_minutes / 60,
+        )
+        # Sweeps belong to the nightly run; saving one here would postpone its next
+        self.scheduler.full_sweep = False
+        self.health = HostHealth.from_config(config)
+        # Each poll must see the live feed, not the response from the previous poll
+        self.fetcher = Fetcher(health=self.health, coalesce=False)
+
+        self.state = load_state(STATE_FILE, {'published': {}, 'pool': [], 'recent': []})
+        self.published: Dict[str, str] = self.state.setdefault('published', {})
+        self._pending: set = set()  # Queued but not yet written
+        self._index_dirty = False
+        self._index_written = 0.0
+        self.stats = {'polls': 0, 'failures': 0, 'new': 0, 'accepted': 0, 'batches': 0}
+
+        self.queue: Optional[asyncio.Queue] = None
+        self.stopping: Optional[asyncio.Event] = None
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], output_dir: Optional[Path] = None) -> 'ScoutDaemon':
+        """Build from the `daemon` section of sources.yaml."""
+        daemon_config = config.get('daemon', {}) or {}
+        return cls(
+            config,
+            output_dir=output_dir,
+            workers=daemon_config.get('workers', 8),
+            min_interval_minutes=daemon_config.get('min_interval_minutes', 10),
+            max_interval_minutes=daemon_config.get('max_interval_minutes', 360),
+            flush_seconds=daemon_config.get('flush_seconds', 30),
+            index_interval_minutes=daemon_config.get('index_interval_minutes', 15),
+            pool_size=daemon_config.get('pool_size', 200),
+            include_builtin_sources=daemon_config.get('include_builtin_sources', True),
+            publish_command=daemon_config.get('publish_command'),
+        )
+
+    def sources(self) -> List[Dict[str, Any]]:
+        sources = collect_sources(self.config)
+        if not self.include_builtin_sources:
+            builtin = {entry['url'] for entries in SOURCE_MAP.values() for entry in entries}
+            sources = [s for s in sources if s['url'] not in builtin]
+        return coalesce_sources(sources)
+
+    def seed(self) -> None:
+        """Start an empty checkpoint from the last nightly raw_intel.json."""
+        if self.state['recent'] or not self.raw_intel_path.exists():
+            return
+        with open(self.raw_intel_path, 'r', encoding='utf-8') as f:
+            articles = json.load(f).get('articles', [])
+        self._merge(articles, score_articles(articles))
+        logger.info(f"🌱 Seeded the daemon pool with {len(self.state['pool'])} articles from {self.raw_intel_path}")
+
+    # ------------------------------------------------------------------
+    # Polling
+    # ------------------------------------------------------------------
+
+    async def _wait(self, seconds: float) -> bool:
+        """Sleep unless asked to stop first. Returns True when stopping."""
+        try:
+            await asyncio.wait_for(self.stopping.wait(), timeout=max(seconds, 0))
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def _new_articles(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        new = []
+        for article in articles:
+            key = article_key(article)
+            if key in self.published or key in self._pending:
+                continue
+            self._pending.add(key)
+            new.append(article)
+        return new
+
+    async def poll_once(self, source: Dict[str, Any], slots: asyncio.Semaphore) -> bool:
+        """Fetch a source once. Returns False if the fetch failed."""
+        async with slots:
+            articles = await asyncio.to_thread(fetch_source, source, self.fetcher, self.config.get('feeds'))
+        self.stats['polls'] += 1
+        if articles is None:
+            # Not a quiet poll: leave the learned cadence alone
+            self.stats['failures'] += 1
+            return False
+
+        self.scheduler.now = datetime.now()
+        self.scheduler.record(source, articles)
+
+        new = self._new_articles(articles)
+        if not new:
+            return True
+        for article in new:
+            article['attributions'] = list(source['attributions'])
+        accepted = score_articles(new)
+        self.stats['new'] += len(new)
+        self.stats['accepted'] += len(accepted)
+        logger.info(f"  📥 {source['name']}: {len(new)} new, {len(accepted)} accepted")
+        await self.queue.put(Arrival(source['name'], new, accepted))
+        return True
+
+    async def poll_source(self, source: Dict[str, Any], slots: asyncio.Semaphore) -> None:
+        """Poll one source whenever it is due, until stopped."""
+        while not self.stopping.is_set():
+            delay = (self.scheduler.next_due(source) - datetime.now()).total_seconds()
+            if await self._wait(delay):
+                return
+            try:
+                fetched = await self.poll_once(source, slots)
+            except Exception as e:
+                logger.error(f"Poll failed for {source['name']}: {e}")
+                fetched = False
+            if not fetched:
+                # The schedule was not advanced: retry after the shortest interval, never hot-loop
+                if await self._wait(self.scheduler.min_interval.total_seconds()):
+                    return
+
+    # ------------------------------------------------------------------
+    # Publishing
+    # ------------------------------------------------------------------
+
+    def _merge(self, articles: List[Dict[str, Any]], accepted: List[Dict[str, Any]]) -> None:
+        """Add a batch to the index window and the ranked pool, and mark it published."""
+        cutoff = (datetime.now() - self.max_age).isoformat()
+        max_docs = (self.config.get('search_index', {}) or {}).get('max_docs', 5000)
+
+        recent = accepted + self.state['recent']
+        recent.sort(key=lambda a: a.get('published', ''), reverse=True)
+        self.state['recent'] = recent[:max_docs]
+
+        # Newest copy of a title wins; stale items age out of the ranking
+        pool, titles = [], set()
+        for article in accepted + self.state['pool']:
+            title = clean_html(article.get('title', '')).strip().lower()
+            if title in titles or article.get('published', '') < cutoff:
+                continue
+            titles.add(title)
+            pool.append(article)
+        pool.sort(key=lambda a: (a.get('relevance', 0), a.get('published', '')), reverse=True)
+        self.state['pool'] = pool[:self.pool_size]
+
+        now = datetime.now().isoformat(timespec='seconds')
+        for article in articles:
+            key = article_key(article)
+            self.published[key] = now
+            self._pending.discard(key)
+        self._index_dirty = True
+
+    def write_outputs(self, batch: List[Arrival], final: bool = False) -> None:
+        """Incremental writers for one batch (runs in a worker thread)."""
+        articles = [a for arrival in batch for a in arrival.articles]
+        accepted = [a for arrival in batch for a in arrival.accepted]
+        self._merge(articles, accepted)
+
+        if accepted:
+            curated = build_curated(self.state['pool'], limit=MAX_CURATED)
+            write_curated(curated, self.curated_path)
+            deltas = self.config.get('news_deltas', {}) or {}
+            if deltas.get('enabled', True):
+                publish_versions(curated, self.news_dir, deltas.get('keep_versions', 10), self.bundled_version_path)
+        if accepted and (self.config.get('trends', {}) or {}).get('enabled', True):
+            update_trends(accepted, self.config, self.trends_path)
+
+        index_options = self.config.get('search_index', {}) or {}
+        index_due = final or time.monotonic() - self._index_written >= self.index_interval
+        if self._index_dirty and index_due and index_options.get('enabled', True):
+            build_search_index(self.state['recent'], self.index_path, max_docs=index_options.get('max_docs', 5000))
+            self._index_written = time.monotonic()
+            self._index_dirty = False
+
+    def checkpoint(self) -> None:
+        """Persist progress (runs on the event loop, between batches)."""
+        cutoff = (datetime.now() - 2 * self.max_age).isoformat()
+        self.state['published'] = self.published = {k: t for k, t in self.published.items() if t >= cutoff}
+        self.state['updated_at'] = datetime.now().isoformat(timespec='seconds')
+        save_state(STATE_FILE, self.state)
+        self.scheduler.save()
+        self.health.save()
+
+    async def _publish_hook(self) -> None:
+        if not self.publish_command:
+            return
+        proc = await asyncio.create_subprocess_shell(self.publish_command, cwd=PROJECT_ROOT)
+        if await proc.wait() != 0:
+            logger.warning(f"Publish command exited with {proc.returncode}")
+
+    async def publish(self) -> None:
+        """Drain the queue in batches until the shutdown sentinel arrives."""
+        loop = asyncio.get_running_loop()
+        done = False
+        while not done:
+            first = await self.queue.get()
+            batch = [] if first is None else [first]
+            done = first is None
+
+            # Collect whatever else arrives within the flush window
+            deadline = loop.time() + self.flush_seconds
+            while not done:
+                try:
+                    item = await asyncio.wait_for(self.queue.get(), timeout=max(deadline - loop.time(), 0))
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    done = True
+                else:
+                    batch.append(item)
+
+            if batch or (done and self._index_dirty):
+                started = time.perf_counter()
+                await asyncio.to_thread(self.write_outputs, batch, done)
+                self.checkpoint()
+                self.stats['batches'] += 1
+                if batch:
+                    new = sum(len(a.articles) for a in batch)
+                    logger.info(f"📤 Published {new} new articles from {len(batch)} polls "
+                                f"in {time.perf_counter() - started:.2f}s")
+                if any(a.accepted for a in batch):
+                    await self._publish_hook()
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def stop(self) -> None:
+        if not self.stopping.is_set():
+            logger.info("🛑 Shutting down: finishing in-flight fetches and flushing the queue...")
+            self.stopping.set()
+
+    def _install_signal_handlers(self) -> None:
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self.stop)
+            except (NotImplementedError, RuntimeError):
+                # Windows: no loop signal handlers, fall back to the plain handler
+                signal.signal(sig, lambda *_: loop.call_soon_threadsafe(self.stop))
+
+    async def run(self, once: bool = False) -> Dict[str, Any]:
+        """Poll until stopped (or, with `once`, poll every source one time)."""
+        self.queue = asyncio.Queue()
+        self.stopping = asyncio.Event()
+        self._install_signal_handlers()
+
+        self.seed()
+        sources = self.sources()
+        slots = asyncio.Semaphore(self.workers)
+        logger.info(f"🛰️ Daemon polling {len(sources)} sources ({self.workers} at a time, "
+                    f"every {self.scheduler.min_interval} to {self.scheduler.max_interval})")
+
+        publisher = asyncio.create_task(self.publish())
+        if once:
+            pollers = [asyncio.create_task(self.poll_once(s, slots)) for s in sources]
+        else:
+            pollers = [asyncio.create_task(self.poll_source(s, slots)) for s in sources]
+
+        for source, result in zip(sources, await asyncio.gather(*pollers, return_exceptions=True)):
+            if isinstance(result, Exception):
+                logger.error(f"Poll failed for {source['name']}: {result}")
+        await self.queue.put(None)
+        await publisher
+
+        logger.info(f"🛰️ Daemon stopped: {self.stats['polls']} polls ({self.stats['failures']} failed), "
+                    f"{self.stats['new']} new articles, "
+                    f"{self.stats['accepted']} accepted, {self.stats['batches']} batches written")
+        return dict(self.stats)
+
+
+def main():
+    import argparse
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    arg_parser = argparse.ArgumentParser(description='Poll feeds continuously and publish new articles incrementally.')
+    arg_parser.add_argument('--config', type=Path, default=None,
+                            help='Sources config to use instead of config/sources.yaml (e.g. local stub feeds).')
+    arg_parser.add_argument('--output-dir', type=Path, default=None,
+                            help='Write the outputs here instead of src/data, and the state under <dir>/state.')
+    arg_parser.add_argument('--once', action='store_true',
+                            help='Poll every source once, publish, checkpoint and exit.')
+    args = arg_parser.parse_args()
+
+    if args.output_dir:
+        args.output_dir.mkdir(parents=True, exist_ok=True)
+    daemon = ScoutDaemon.from_config(load_sources_config(args.config), output_dir=args.output_dir)
+    asyncio.run(daemon.run(once=args.once))
+
+
+if __name__ == '__main__':
+    main()
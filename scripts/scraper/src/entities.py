@@ -0,0 +1,279 @@
+"""
+Entity Registry - Compiled matcher for tracked companies and products.
+
+config/entities.yaml is the single list of company and product names.
+compile_registry() turns it into a ready-to-load artifact
+(src/data/entityMatcher.json) holding the entity table, an alias lookup
+and two prebuilt patterns (case-insensitive and case-sensitive). Aliases
+are merged into a prefix trie so a scan rejects most positions after one
+character, longer aliases win over their prefixes, and word boundaries
+are inlined. Python
+(EntityMatcher) and TypeScript (src/utils/entityMatcher.ts) load the same
+artifact, so every consumer tags text identically. The dashboard's company
+registry (src/data/registries) takes its aliases from the artifact too.
+
+The artifact records a hash of the registry it was built from. It is
+only written here (python -m src.entities) and by the pipeline run, which
+recompiles it when the registry has changed. get_matcher() never writes:
+a stale artifact is compiled in memory with a warning, so reading entities
+in CI, the daemon or a replay cannot dirty the tree. It keeps one matcher
+per process.
+
+Usage:
+    python -m src.entities    # compile config/entities.yaml
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+from src.lazy import lazy_import
+
+yaml = lazy_import('yaml')
+
+logger = logging.getLogger(__name__)
+
+# scripts/scraper/src/entities.py -> scripts/scraper, repo root
+SCRAPER_ROOT = Path(__file__).resolve().parents[1]
+REGISTRY_PATH = SCRAPER_ROOT / 'config' / 'entities.yaml'
+ARTIFACT_PATH = SCRAPER_ROOT.parents[1] / 'src' / 'data' / 'entityMatcher.json'
+
+ARTIFACT_VERSION = 2
+
+# Curator keyword points per matched entity
+PRIORITY_POINTS = {
+    'high': 20,
+    'medium': 10,
+    'low': 5,
+}
+
+BOUNDARIES = ('word', 'substring')
+
+# Escapes that mean the same thing in Python and JavaScript regexes
+_REGEX_SPECIAL = re.compile(r'([\\^$.|?*+()\[\]{}/-])')
+
+
+def _escape(text: str) -> str:
+    return _REGEX_SPECIAL.sub(r'\\\1', text)
+
+
+def _registry_hash(registry: Dict[str, Any]) -> str:
+    # Hash the parsed content so comments and line endings don't count
+    canonical = json.dumps(registry, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:16]
+
+
+def _alias_entries(entry: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Name plus aliases, normalized to {text, case_sensitive, boundary}."""
+    aliases = []
+    for alias in [entry['name']] + list(entry.get('aliases') or []):
+        if isinstance(alias, str):
+            alias = {'text': alias}
+        boundary = alias.get('boundary', 'word')
+        if boundary not in BOUNDARIES:
+            raise ValueError(f"Alias '{alias['text']}' of '{entry['id']}': unknown boundary '{boundary}'")
+        aliases.append({
+            'text': alias['text'],
+            'case_sensitive': bool(alias.get('case_sensitive', False)),
+            'boundary': boundary,
+        })
+    return aliases
+
+
+def _trie_pattern(keys: List[str], end: str) -> str:
+    """
+    Regex matching any of `keys`, built from their prefix trie.
+
+    Child branches are tried before ending the match at a node, so the
+    longest alias wins; `end` is appended wherever an alias may stop.
+    """
+    trie: Dict[str, Any] = {}
+    for key in keys:
+        node = trie
+        for char in key:
+            node = node.setdefault(char, {})
+        node[''] = True
+
+    def build(node: Dict[str, Any]) -> str:
+        branches = [_escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if '' in node:
+            branches.append(end)
+        if len(branches) == 1:
+            return branches[0]
+        return '(?:' + '|'.join(branches) + ')'
+
+    return build(trie)
+
+
+def _pattern(aliases: List[Dict[str, Any]], word_chars: str) -> str:
+    parts = []
+    word = [a['key'] for a in aliases if a['boundary'] == 'word']
+    substring = [a['key'] for a in aliases if a['boundary'] == 'substring']
+    if word:
+        parts.append(f"(?<![{word_chars}])" + _trie_pattern(word, f"(?![{word_chars}])"))
+    if substring:
+        parts.append(_trie_pattern(substring, ''))
+    return '|'.join(parts)
+
+
+def compile_registry(registry: Dict[str, Any], source_hash: str = '') -> Dict[str, Any]:
+    """
+    Flatten the registry into the matcher artifact.
+
+    Raises:
+        ValueError: On duplicate ids or an alias claimed by two entities.
+    """
+    entities: List[Dict[str, Any]] = []
+    lookup: Dict[str, Dict[str, int]] = {'ci': {}, 'cs': {}}
+    aliases: Dict[str, List[Dict[str, Any]]] = {'ci': [], 'cs': []}
+    ids = set()
+
+    def add(entry: Dict[str, Any], entity_type: str, company: str, priority: str) -> None:
+        if entry['id'] in ids:
+            raise ValueError(f"Duplicate entity id '{entry['id']}'")
+        ids.add(entry['id'])
+        index = len(entities)
+
+        entity = {
+            'id': entry['id'],
+            'name': entry['name'],
+            'type': entity_type,
+            'company': company,
+            'priority': priority,
+        }
+        extra_aliases = [a['text'] for a in _alias_entries(entry)[1:]]
+        if extra_aliases:
+            entity['aliases'] = extra_aliases
+        if entry.get('url'):
+            entity['url'] = entry['url']
+        if entry.get('search_terms'):
+            entity['search_terms'] = entry['search_terms']
+        entities.append(entity)
+
+        for alias in _alias_entries(entry):
+            mode = 'cs' if alias['case_sensitive'] else 'ci'
+            key = alias['text'] if alias['case_sensitive'] else alias['text'].lower()
+            owner = lookup[mode].get(key)
+            if owner is not None and owner != index:
+                raise ValueError(f"Alias '{alias['text']}' is claimed by both '{entities[owner]['id']}' and '{entry['id']}'")
+            if owner is None:
+                lookup[mode][key] = index
+                aliases[mode].append({'key': key, 'boundary': alias['boundary']})
+
+    for company in registry.get('entities', []):
+        priority = company.get('priority', 'high')
+        add(company, 'company', company['id'], priority)
+        for product in company.get('products') or []:
+            add(product, 'product', company['id'], product.get('priority', priority))
+
+    return {
+        'version': ARTIFACT_VERSION,
+        'source_hash': source_hash,
+        'entities': entities,
+        'lookup': lookup,
+        'patterns': {
+            'ci': _pattern(aliases['ci'], 'a-z0-9'),
+            'cs': _pattern(aliases['cs'], 'A-Za-z0-9'),
+        },
+    }
+
+
+def _current_artifact(registry_path: Path, artifact_path: Path) -> Tuple[Dict[str, Any], str, Optional[Dict[str, Any]]]:
+    """(registry, its hash, the artifact if it was built from this registry)."""
+    with open(registry_path, 'r', encoding='utf-8') as f:
+        registry = yaml.safe_load(f)
+    source_hash = _registry_hash(registry)
+
+    if artifact_path.exists():
+        with open(artifact_path, 'r', encoding='utf-8') as f:
+            artifact = json.load(f)
+        if artifact.get('source_hash') == source_hash and artifact.get('version') == ARTIFACT_VERSION:
+            return registry, source_hash, artifact
+    return registry, source_hash, None
+
+
+def compile_entities(registry_path: Path = REGISTRY_PATH, artifact_path: Path = ARTIFACT_PATH,
+                     force: bool = False) -> Dict[str, Any]:
+    """Rebuild the artifact if the registry changed (or `force`), and return it."""
+    registry, source_hash, artifact = _current_artifact(registry_path, artifact_path)
+    if artifact is not None and not force:
+        return artifact
+
+    artifact = compile_registry(registry, source_hash)
+    tmp_path = artifact_path.with_suffix('.json.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(artifact, f, indent=1, ensure_ascii=False)
+    os.replace(tmp_path, artifact_path)
+
+    logger.info(f"Compiled {len(artifact['entities'])} entities -> {artifact_path}")
+    return artifact
+
+
+def load_entities(registry_path: Path = REGISTRY_PATH, artifact_path: Path = ARTIFACT_PATH) -> Dict[str, Any]:
+    """The artifact, compiled in memory (never written) when it is out of date."""
+    registry, source_hash, artifact = _current_artifact(registry_path, artifact_path)
+    if artifact is None:
+        logger.warning(f"{artifact_path.name} is out of date with {registry_path.name}; "
+                       f"compiling in memory (run python -m src.entities to update it)")
+        artifact = compile_registry(registry, source_hash)
+    return artifact
+
+
+class EntityMatcher:
+    """Tags text with entity ids using the precompiled artifact."""
+
+    def __init__(self, artifact: Dict[str, Any]):
+        self.entities = artifact['entities']
+        self.index = {entity['id']: i for i, entity in enumerate(self.entities)}
+        self.lookup = artifact['lookup']
+        patterns = artifact['patterns']
+        self._ci = re.compile(patterns['ci']) if patterns['ci'] else None
+        self._cs = re.compile(patterns['cs']) if patterns['cs'] else None
+
+    def _matched_indexes(self, text: str) -> List[int]:
+        found = set()
+        if self._ci:
+            found.update(self.lookup['ci'][m.group(0)] for m in self._ci.finditer(text.lower()))
+        if self._cs:
+            found.update(self.lookup['cs'][m.group(0)] for m in self._cs.finditer(text))
+        return sorted(found)
+
+    def match(self, text: str) -> List[Dict[str, Any]]:
+        """Entities (companies and products) mentioned in the text, in registry order."""
+        return [self.entities[i] for i in self._matched_indexes(text)]
+
+    def company_ids(self, text: str) -> List[str]:
+        """Companies mentioned directly or through one of their products."""
+        companies = sorted({self.index[entity['company']] for entity in self.match(text)})
+        return [self.entities[i]['id'] for i in companies]
+
+    def companies(self) -> List[Dict[str, Any]]:
+        return [entity for entity in self.entities if entity['type'] == 'company']
+
+    def aliases(self) -> Dict[str, str]:
+        """Every alias (lowercased) -> company id, for tokenizers."""
+        result = {}
+        for mode in ('ci', 'cs'):
+            for alias, index in self.lookup[mode].items():
+                result.setdefault(alias.lower(), self.entities[index]['company'])
+        return result
+
+
+@lru_cache(maxsize=None)
+def get_matcher() -> EntityMatcher:
+    """Process-wide matcher, built once from the artifact (read only)."""
+    return EntityMatcher(load_entities())
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    compile_entities(force=True)
+
+
+if __name__ == '__main__':
+    main()
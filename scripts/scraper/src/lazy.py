@@ -0,0 +1,71 @@
+"""
+Lazy Imports - Defer heavy third-party modules until first use.
+
+feedparser, requests, bs4, dateutil and yaml together account for most of
+the interpreter start-up cost of the scraper entry points, yet many runs
+(cached searches, a single pipeline stage, the benchmarks) never touch
+some of them. Modules bind these dependencies with lazy_import() instead
+of a top-level import; the real module is imported on the first attribute
+access and every later access goes straight to it.
+
+    requests = lazy_import('requests')      # nothing imported yet
+    requests.Session()                      # imports requests here
+
+Annotations that name a lazily imported type must be quoted so that
+defining a function does not trigger the import.
+"""
+
+import importlib
+import threading
+from types import ModuleType
+from typing import Any, Dict
+
+_LOCK = threading.Lock()
+_PROXIES: Dict[str, 'LazyModule'] = {}
+
+
+class LazyModule(ModuleType):
+    """Module proxy that imports its target on first attribute access."""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self._lazy_module = None
+
+    def _load(self) -> ModuleType:
+        if self._lazy_module is None:
+            # Fetch threads may hit a proxy at the same time on first use
+            with _LOCK:
+                if self._lazy_module is None:
+                    self._lazy_module = importlib.import_module(self.__name__)
+        return self._lazy_module
+
+    @property
+    def loaded(self) -> bool:
+        return self._lazy_module is not None
+
+    def __getattr__(self, attr: str) -> Any:
+        value = getattr(self._load(), attr)
+        # Later lookups find the attribute on the proxy itself
+        self.__dict__[attr] = value
+        return value
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = 'loaded' if self.loaded else 'not loaded'
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+def lazy_import(name: str) -> LazyModule:
+    """Proxy for module `name`; the same proxy is shared by every caller."""
+    with _LOCK:
+        proxy = _PROXIES.get(name)
+        if proxy is None:
+            proxy = _PROXIES[name] = LazyModule(name)
+    return proxy
+
+
+def loaded_modules() -> Dict[str, bool]:
+    """Which lazily imported modules have actually been imported so far."""
+    return {name: proxy.loaded for name, proxy in sorted(_PROXIES.items())}
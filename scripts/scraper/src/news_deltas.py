@@ -0,0 +1,180 @@
+"""
+News Deltas Module
+
+Versioned publishing of the curated news list, so clients that already
+hold a recent copy download only what changed.
+
+Every curated item has a stable, content-derived id (hash of its canonical
+URL). Each time the list changes, the version number is bumped and
+public/news/ is rewritten:
+
+    manifest.json           {version, hash, updatedAt, count, deltas}
+    v<version>.json         the full list at the current version
+    delta-<from>-<to>.json  changes from an older version to the current one:
+                            added / updated items (with their new rank),
+                            removed ids, and [id, rank] for items that only
+                            moved
+
+`deltas` in the manifest lists the older versions that have a delta, so a
+client at any of the last `keep_versions` versions needs a single small
+request; anyone older fetches the full file. The files are named by
+version, so their contents never change once written and CDN caches stay
+valid. An unchanged list writes nothing.
+
+src/data/curatedNewsVersion.json records the version and hash of the
+curatedNews.json bundled with the app, for the client's first sync.
+
+The id order and item hashes of recent versions are kept in
+data/state/news_versions.json; if the state is lost, the last published
+full list is the only base a delta is computed from.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+from src.state import load_state, save_state
+from src.sources.urls import link_identity
+
+logger = logging.getLogger(__name__)
+
+STATE_FILE = 'news_versions.json'
+
+# scripts/scraper/src/news_deltas.py -> project root
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+NEWS_DIR = PROJECT_ROOT / 'public' / 'news'
+BUNDLED_VERSION_PATH = PROJECT_ROOT / 'src' / 'data' / 'curatedNewsVersion.json'
+
+DEFAULT_KEEP_VERSIONS = 10
+
+
+def item_id(link: str, title: str = '') -> str:
+    """Stable id of a curated item: its link identity (canonical URL, or title) hashed."""
+    raw = link_identity(link, title)
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:12]
+
+
+def _item_hash(item: Dict[str, Any]) -> str:
+    return hashlib.sha1(json.dumps(item, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()[:12]
+
+
+def _snapshot(items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    hashes = {item['id']: _item_hash(item) for item in items}
+    order = [item['id'] for item in items]
+    digest = hashlib.sha1('\n'.join(f"{i}:{hashes[i]}" for i in order).encode('utf-8')).hexdigest()[:16]
+    return {'hash': digest, 'order': order, 'items': hashes}
+
+
+def compute_delta(old: Dict[str, Any], new: Dict[str, Any], items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Changes from snapshot `old` to `new` (whose items are `items`, in rank order)."""
+    old_rank = {item_id: rank for rank, item_id in enumerate(old['order'])}
+    added, updated, reranked = [], [], []
+    for rank, item in enumerate(items):
+        previous = old_rank.get(item['id'])
+        if previous is None:
+            added.append({**item, 'rank': rank})
+        elif old['items'][item['id']] != new['items'][item['id']]:
+            updated.append({**item, 'rank': rank})
+        elif previous != rank:
+            reranked.append([item['id'], rank])
+
+    return {
+        'from': old['version'],
+        'to': new['version'],
+        'hash': new['hash'],
+        'count': len(items),
+        'added': added,
+        'updated': updated,
+        'removed': [i for i in old['order'] if i not in new['items']],
+        'reranked': reranked,
+    }
+
+
+def _write_json(path: Path, data: Any) -> None:
+    tmp_path = path.with_suffix('.json.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, path)
+
+
+def _read_json(path: Path) -> Optional[Any]:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def publish_versions(
+    items: List[Dict[str, Any]],
+    news_dir: Path = NEWS_DIR,
+    keep_versions: int = DEFAULT_KEEP_VERSIONS,
+    bundled_version_path: Optional[Path] = BUNDLED_VERSION_PATH,
+) -> Dict[str, Any]:
+    """
+    Publish `items` (curatedNews.json entries, best first) as a new version if they changed.
+
+    Returns:
+        The manifest (unchanged when the list is the same as the last version).
+    """
+    news_dir.mkdir(parents=True, exist_ok=True)
+    manifest = _read_json(news_dir / 'manifest.json') or {'version': 0, 'hash': ''}
+    snapshot = _snapshot(items)
+    if snapshot['hash'] == manifest.get('hash'):
+        logger.info(f"News deltas: unchanged at version {manifest['version']}")
+        return manifest
+
+    # History per output directory (the daemon can publish to a scratch one)
+    state = load_state(STATE_FILE, {'dirs': {}})
+    dirs = state.setdefault('dirs', {})
+    key = str(news_dir.resolve())
+    history = [v for v in dirs.get(key, []) if v['version'] <= manifest['version']]
+    current = next((v for v in history if v['version'] == manifest['version']), None)
+    if manifest['version'] and (current is None or current['hash'] != manifest['hash']):
+        # State lost or out of step with the files: start from the last published full list
+        history = []
+        published = _read_json(news_dir / f"v{manifest['version']}.json")
+        if published:
+            history.append({**_snapshot(published['items']), 'version': manifest['version']})
+
+    version = manifest['version'] + 1
+    snapshot['version'] = version
+    history = sorted(history, key=lambda v: v['version'])[-(keep_versions - 1):] if keep_versions > 1 else []
+
+    written = set()
+    for old in history:
+        name = f"delta-{old['version']}-{version}.json"
+        _write_json(news_dir / name, compute_delta(old, snapshot, items))
+        written.add(name)
+
+    now = datetime.now().isoformat(timespec='seconds')
+    full_name = f"v{version}.json"
+    _write_json(news_dir / full_name, {'version': version, 'hash': snapshot['hash'], 'updatedAt': now, 'items': items})
+    written.add(full_name)
+
+    manifest = {
+        'version': version,
+        'hash': snapshot['hash'],
+        'updatedAt': now,
+        'count': len(items),
+        'deltas': [old['version'] for old in history],
+    }
+    _write_json(news_dir / 'manifest.json', manifest)
+
+    # Prune files for versions that are no longer current or in the window
+    for path in news_dir.glob('*.json'):
+        if path.name != 'manifest.json' and path.name not in written:
+            path.unlink()
+
+    if bundled_version_path:
+        _write_json(bundled_version_path, {'version': version, 'hash': snapshot['hash']})
+
+    dirs[key] = history + [snapshot]
+    save_state(STATE_FILE, state)
+
+    logger.info(f"News deltas: version {version} ({len(items)} items, deltas from {len(history)} versions) -> {news_dir}")
+    return manifest
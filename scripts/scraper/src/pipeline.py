@@ -0,0 +1,308 @@
+"""
+Pipeline Runner - scout → dedup → score → index → aggregate → curate → transform → monitor in a single process.
+
+Article records are handed from stage to stage in memory instead of being
+written to raw_intel.json and re-parsed by every later step. Any run can
+checkpoint each stage's output to disk, and a later run can resume from
+the checkpoint before a given stage.
+
+Stages run one after another; the later stages do not start on partial
+scout output. That overlap was left out on purpose: the scout merges
+duplicate links across sources only once every fetch is in, dedup needs
+the whole run to pick the first copy of a title, and the index, trend and
+news writers each rewrite a whole artifact, so feeding them per batch
+would rewrite those files many times for a few seconds of CPU saved on a
+network-bound run. Incremental publishing is the daemon's job
+(src/daemon.py).
+
+A replay (`--archive replay`, or `archive.mode: replay`) is an offline
+A/B run: its raw_intel.json, search index, trend cubes, curated news and
+news versions go to data/replay/ (or --output-dir) together with the
+state those writers keep, the entity artifact is not recompiled and the
+company sites are not probed, so nothing under src/data or public/ moves.
+Any run can be sent to a scratch directory the same way with --output-dir.
+
+Usage:
+    python -m src.pipeline
+    python -m src.pipeline --checkpoint
+    python -m src.pipeline --resume-from curate
+    python -m src.pipeline --archive replay --stop-after transform
+    python -m src.pipeline --archive replay --output-dir /tmp/replay
+"""
+
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, List, Dict, Any, Optional, Tuple
+
+from src.agents.scout import run_scout, save_raw_intel, load_sources_config
+from src.agents.curator import curate_articles
+from src.transform_to_curated import (
+    CURATED_PATH,
+    RAW_INTEL_PATH,
+    dedupe_articles,
+    score_articles,
+    build_curated,
+    write_curated,
+)
+from src.entities import compile_entities
+from src.search_index import SEARCH_INDEX_PATH, update_search_index
+from src.trend_aggregates import TRENDS_PATH, update_trends
+from src.company_monitor import MONITOR_PATH, update_company_monitor
+from src.news_deltas import BUNDLED_VERSION_PATH, NEWS_DIR, publish_versions
+from src.state import use_state_dir
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_DIR = Path(__file__).resolve().parents[1] / 'data' / 'checkpoints'
+REPLAY_DIR = Path(__file__).resolve().parents[1] / 'data' / 'replay'
+
+
+@dataclass
+class PipelineContext:
+    """Run-wide settings and metadata shared by the stages."""
+    config: Dict[str, Any]
+    full_sweep: bool = False
+    deadline_minutes: Optional[float] = None
+    archive_mode: Optional[str] = None
+    output_dir: Optional[Path] = None
+    report: Dict[str, Any] = field(default_factory=dict)
+
+    def output(self, path: Path) -> Path:
+        """Where a writer's file goes in this run (`path` unless there is an output_dir)."""
+        return self.output_dir / path.name if self.output_dir else path
+
+
+def stage_scout(ctx: PipelineContext, _articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Collect raw articles. raw_intel.json is still written for /api/news."""
+    report = run_scout(full_sweep=ctx.full_sweep, deadline_minutes=ctx.deadline_minutes,
+                       archive_mode=ctx.archive_mode)
+    save_raw_intel(report, ctx.output(RAW_INTEL_PATH))
+    ctx.report = {k: v for k, v in report.items() if k != 'articles'}
+    return report['articles']
+
+
+def stage_dedup(ctx: PipelineContext, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Drop repeated titles."""
+    unique = dedupe_articles(articles)
+    logger.info(f"Dedup: {len(unique)}/{len(articles)} unique articles")
+    return unique
+
+
+def stage_score(ctx: PipelineContext, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Tag and score; zero-relevance articles go no further, as on the dashboard."""
+    scored = score_articles(articles)
+    logger.info(f"Score: {len(scored)}/{len(articles)} articles with relevance > 0")
+    return scored
+
+
+def stage_index(ctx: PipelineContext, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Add the run's articles to the BM25 search index used by /api/chat; articles pass through."""
+    options = ctx.config.get('search_index', {}) or {}
+    if options.get('enabled', True):
+        update_search_index(articles, ctx.output(SEARCH_INDEX_PATH), max_docs=options.get('max_docs', 5000))
+    return articles
+
+
+def stage_aggregate(ctx: PipelineContext, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Add new articles to the weekly trend cubes; articles pass through."""
+    options = ctx.config.get('trends', {}) or {}
+    if options.get('enabled', True):
+        update_trends(articles, ctx.config, ctx.output(TRENDS_PATH))
+    return articles
+
+
+def stage_curate(ctx: PipelineContext, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Score with the curator when `curation.enabled` is set; otherwise pass through."""
+    curation = ctx.config.get('curation', {}) or {}
+    if not curation.get('enabled', False):
+        logger.info("Curation disabled, passing articles through")
+        return articles
+
+    return curate_articles(
+        articles,
+        min_score=curation.get('min_relevance_score', 60),
+        max_articles=curation.get('max_articles', 15),
+        summarizer=curation.get('summarizer', 'local'),
+    )
+
+
+def stage_transform(ctx: PipelineContext, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Tag, rank and publish curatedNews.json plus its versioned deltas."""
+    scored = score_articles(articles)
+    logger.info(f"Transform: {len(scored)} articles with relevance > 0")
+    curated = build_curated(scored)
+    write_curated(curated, ctx.output(CURATED_PATH))
+    deltas = ctx.config.get('news_deltas', {}) or {}
+    if deltas.get('enabled', True):
+        publish_versions(curated, ctx.output(NEWS_DIR), deltas.get('keep_versions', 10),
+                         ctx.output(BUNDLED_VERSION_PATH))
+    return curated
+
+
+def stage_monitor(ctx: PipelineContext, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Probe company sites and write the /api/company-monitor snapshot; articles pass through."""
+    options = ctx.config.get('company_monitor', {}) or {}
+    if ctx.archive_mode == 'replay':
+        logger.info("Replaying from the response archive, skipping live site probes")
+    elif options.get('enabled', True):
+        update_company_monitor(ctx.config, ctx.output(MONITOR_PATH))
+    return articles
+
+
+StageFn = Callable[[PipelineContext, List[Dict[str, Any]]], List[Dict[str, Any]]]
+
+STAGES: List[Tuple[str, StageFn]] = [
+    ('scout', stage_scout),
+    ('dedup', stage_dedup),
+    ('score', stage_score),
+    ('index', stage_index),
+    ('aggregate', stage_aggregate),
+    ('curate', stage_curate),
+    ('transform', stage_transform),
+    ('monitor', stage_monitor),
+]
+
+STAGE_NAMES = [name for name, _ in STAGES]
+
+
+def save_checkpoint(stage: str, articles: List[Dict[str, Any]], ctx: PipelineContext,
+                    checkpoint_dir: Path = CHECKPOINT_DIR) -> Path:
+    """Write a stage's output to <checkpoint_dir>/<stage>.json."""
+    checkpoint_dir.mkdir(parents=True, exist_ok=True)
+    path = checkpoint_dir / f"{stage}.json"
+    tmp_path = path.with_suffix('.json.tmp')
+
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'stage': stage,
+            'saved_at': datetime.now().isoformat(),
+            'report': ctx.report,
+            'articles': articles,
+        }, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+    logger.info(f"💾 Checkpoint: {stage} ({len(articles)} articles) -> {path}")
+    return path
+
+
+def load_checkpoint(stage: str, ctx: PipelineContext,
+                    checkpoint_dir: Path = CHECKPOINT_DIR) -> List[Dict[str, Any]]:
+    """Load a stage's checkpointed output."""
+    path = checkpoint_dir / f"{stage}.json"
+    if not path.exists():
+        raise FileNotFoundError(f"No checkpoint for stage '{stage}' at {path}")
+
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    ctx.report = data.get('report', {})
+    logger.info(f"📂 Resumed from {stage} checkpoint ({len(data['articles'])} articles, saved {data.get('saved_at')})")
+    return data['articles']
+
+
+def run_pipeline(
+    resume_from: Optional[str] = None,
+    checkpoint: bool = False,
+    checkpoint_dir: Path = CHECKPOINT_DIR,
+    stop_after: Optional[str] = None,
+    full_sweep: bool = False,
+    deadline_minutes: Optional[float] = None,
+    archive_mode: Optional[str] = None,
+    output_dir: Optional[Path] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Run the pipeline stages in order.
+
+    Args:
+        resume_from: Start at this stage, loading the previous stage's checkpoint.
+        checkpoint: Write every completed stage's output to checkpoint_dir.
+        checkpoint_dir: Where checkpoints are read and written.
+        stop_after: Stop once this stage has completed.
+        full_sweep: Passed to the scout (ignore the poll schedule).
+        deadline_minutes: Passed to the scout run budget.
+        archive_mode: Passed to the scout ('capture' or 'replay').
+        output_dir: Write the outputs, and the writers' state, here instead
+            of src/data, public/news and data/state (default for a replay: data/replay).
+
+    Returns:
+        Output of the last stage that ran.
+    """
+    config = load_sources_config()
+    archive_mode = archive_mode or (config.get('archive', {}) or {}).get('mode')
+    if archive_mode == 'replay' and output_dir is None:
+        output_dir = REPLAY_DIR
+
+    if output_dir:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        use_state_dir(output_dir / 'state')
+        logger.info(f"Writing outputs and state to {output_dir}")
+    else:
+        # Rebuild the entity matcher artifact if config/entities.yaml changed
+        compile_entities()
+
+    ctx = PipelineContext(
+        config=config,
+        full_sweep=full_sweep,
+        deadline_minutes=deadline_minutes,
+        archive_mode=archive_mode,
+        output_dir=output_dir,
+    )
+
+    start_index = STAGE_NAMES.index(resume_from) if resume_from else 0
+    articles: List[Dict[str, Any]] = []
+    if start_index > 0:
+        articles = load_checkpoint(STAGE_NAMES[start_index - 1], ctx, checkpoint_dir)
+
+    for name, stage in STAGES[start_index:]:
+        logger.info(f"▶️ Stage: {name}")
+        articles = stage(ctx, articles)
+
+        if checkpoint:
+            save_checkpoint(name, articles, ctx, checkpoint_dir)
+        if name == stop_after:
+            break
+
+    return articles
+
+
+def main():
+    """Main entry point for the pipeline runner."""
+    import argparse
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    arg_parser = argparse.ArgumentParser(description='Run scout → dedup → score → index → aggregate → curate → transform → monitor in one process.')
+    arg_parser.add_argument('--checkpoint', action='store_true',
+                            help='Write each stage output to the checkpoint directory.')
+    arg_parser.add_argument('--checkpoint-dir', type=Path, default=CHECKPOINT_DIR)
+    arg_parser.add_argument('--resume-from', choices=STAGE_NAMES[1:],
+                            help="Start at this stage using the previous stage's checkpoint.")
+    arg_parser.add_argument('--stop-after', choices=STAGE_NAMES)
+    arg_parser.add_argument('--full-sweep', action='store_true',
+                            help='Fetch every source, ignoring the adaptive poll schedule.')
+    arg_parser.add_argument('--deadline-minutes', type=float, default=None,
+                            help='Overall scout time budget.')
+    arg_parser.add_argument('--archive', choices=['capture', 'replay'], default=None,
+                            help='Archive every raw response, or re-run the scout from the archive offline.')
+    arg_parser.add_argument('--output-dir', type=Path, default=None,
+                            help='Write outputs and state here instead of src/data (a replay defaults to data/replay).')
+    args = arg_parser.parse_args()
+
+    run_pipeline(
+        resume_from=args.resume_from,
+        checkpoint=args.checkpoint,
+        checkpoint_dir=args.checkpoint_dir,
+        stop_after=args.stop_after,
+        full_sweep=args.full_sweep,
+        deadline_minutes=args.deadline_minutes,
+        archive_mode=args.archive,
+        output_dir=args.output_dir,
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,225 @@
+"""
+Search Index Builder - BM25 index over article titles and summaries.
+
+Builds a small static artifact (src/data/searchIndex.json) that the chat
+edge function loads once and queries for top-k grounding passages (see
+src/utils/searchIndex.ts). Per-posting BM25 weights are computed here and
+quantized to 1..255, so a query is just a sum of integers per document.
+Only scored articles (relevance > 0) are indexed, the same corpus the
+dashboard ranks, so chat answers are not grounded in off-topic items.
+
+The tokenizer folds tracked company and product names (entity registry
+aliases) into one token per company, so "Ground Truth Ag" is a single term and a
+question about FOSS also finds EyeFoss articles. The phrase table ships
+inside the artifact so the TypeScript tokenizer produces identical terms.
+Both sides use Unicode word characters (Python's `\w`, `[\p{L}\p{N}_]` in
+TypeScript), so names like "Bühler" stay one term.
+
+The nightly run indexes a rolling window, not just its own articles:
+update_search_index() reads the documents already in the committed
+artifact back and merges the new articles in, keeping the newest
+`max_docs` (the daemon keeps the same window in its checkpoint).
+
+Usage:
+    python -m src.search_index
+"""
+
+import json
+import logging
+import math
+import os
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Dict, Any, Tuple
+
+from src.entities import get_matcher
+from src.transform_to_curated import RAW_INTEL_PATH, PROJECT_ROOT, clean_summary, clean_html, dedupe_articles, score_articles
+
+logger = logging.getLogger(__name__)
+
+SEARCH_INDEX_PATH = PROJECT_ROOT / 'src' / 'data' / 'searchIndex.json'
+
+INDEX_VERSION = 1
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+# Weights are stored as integers in 1..QUANT_LEVELS
+QUANT_LEVELS = 255
+
+MAX_PASSAGE_CHARS = 300
+
+STOPWORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'has', 'have',
+    'in', 'is', 'it', 'its', 'of', 'on', 'or', 'that', 'the', 'this', 'to', 'was',
+    'were', 'will', 'with', 'what', 'which', 'who', 'how', 'about', 'into', 'their',
+    'they', 'we', 'our', 'you', 'your', 'can', 'do', 'does', 'new', 'not', 'but',
+}
+
+TOKEN_RE = re.compile(r'\w+')
+
+
+def company_phrases() -> List[Tuple[str, str]]:
+    """(lowercase alias, company id) pairs, longest alias first."""
+    phrases = get_matcher().aliases()
+    return sorted(phrases.items(), key=lambda p: (-len(p[0]), p[0]))
+
+
+def _phrase_pattern(phrases: List[Tuple[str, str]]) -> re.Pattern:
+    # Lookarounds rather than \b, so aliases ending in punctuation match the same way in searchIndex.ts
+    return re.compile(r'(?<!\w)(?:' + '|'.join(re.escape(alias) for alias, _ in phrases) + r')(?!\w)')
+
+
+@lru_cache(maxsize=1)
+def phrase_table() -> Tuple[List[Tuple[str, str]], re.Pattern, Dict[str, str], frozenset]:
+    """(phrases, phrase pattern, alias -> company id, company ids), built on first tokenize()."""
+    phrases = company_phrases()
+    tokens = dict(phrases)
+    return phrases, _phrase_pattern(phrases), tokens, frozenset(tokens.values())
+
+
+def _stem(token: str) -> str:
+    """Plural folding only; mirrored exactly in searchIndex.ts."""
+    if len(token) > 4 and token.endswith('ies'):
+        return token[:-3] + 'y'
+    if len(token) > 3 and token.endswith('s') and not token.endswith('ss'):
+        return token[:-1]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase terms with company names folded into their company id."""
+    _, phrase_re, phrase_tokens, company_tokens = phrase_table()
+    text = phrase_re.sub(lambda m: ' ' + phrase_tokens[m.group(0)] + ' ', text.lower())
+    tokens = []
+    for token in TOKEN_RE.findall(text):
+        if token in STOPWORDS or len(token) < 2:
+            continue
+        tokens.append(token if token in company_tokens else _stem(token))
+    return tokens
+
+
+def _document(article: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'title': clean_html(article.get('title', 'Untitled')).strip(),
+        'source': article.get('source', ''),
+        'date': (article.get('published') or '')[:10],
+        'url': article.get('link', ''),
+        'text': clean_summary(article.get('summary', ''))[:MAX_PASSAGE_CHARS],
+    }
+
+
+def _article(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """An indexed document in the article form build_index() takes."""
+    return {
+        'title': doc['title'],
+        'source': doc['source'],
+        'published': doc['date'],
+        'link': doc['url'],
+        'summary': doc['text'],
+    }
+
+
+def indexed_articles(path: Path = SEARCH_INDEX_PATH) -> List[Dict[str, Any]]:
+    """Articles in an existing index artifact (empty if there is none)."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            docs = json.load(f).get('docs', [])
+    except (OSError, json.JSONDecodeError):
+        return []
+    return [_article(doc) for doc in docs]
+
+
+def build_index(articles: List[Dict[str, Any]], max_docs: int = 5000) -> Dict[str, Any]:
+    """
+    Build the quantized BM25 artifact.
+
+    Postings are stored per term as a flat list of [doc gap, weight, ...]
+    pairs with delta-encoded document numbers. The output carries no
+    timestamp, so an unchanged corpus produces a byte-identical file.
+    """
+    articles = sorted(articles, key=lambda a: a.get('published', ''), reverse=True)[:max_docs]
+    docs = [_document(a) for a in articles]
+
+    # Title terms count twice: titles are short and name the subject
+    doc_terms = [tokenize(f"{d['title']} {d['title']} {d['text']}") for d in docs]
+    avgdl = sum(len(t) for t in doc_terms) / len(doc_terms) if doc_terms else 0.0
+
+    term_freqs: Dict[str, Dict[int, int]] = {}
+    for doc_id, terms in enumerate(doc_terms):
+        for term in terms:
+            postings = term_freqs.setdefault(term, {})
+            postings[doc_id] = postings.get(doc_id, 0) + 1
+
+    n_docs = len(docs)
+    weights: Dict[str, List[Tuple[int, float]]] = {}
+    max_weight = 0.0
+    for term, postings in term_freqs.items():
+        idf = math.log(1 + (n_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+        entries = []
+        for doc_id, tf in sorted(postings.items()):
+            norm = 1 - B + B * len(doc_terms[doc_id]) / avgdl
+            weight = idf * tf * (K1 + 1) / (tf + K1 * norm)
+            entries.append((doc_id, weight))
+            max_weight = max(max_weight, weight)
+        weights[term] = entries
+
+    scale = max_weight / QUANT_LEVELS if max_weight else 1.0
+    terms = sorted(weights)
+    postings_out = []
+    for term in terms:
+        flat = []
+        previous = 0
+        for doc_id, weight in weights[term]:
+            flat.extend([doc_id - previous, max(1, round(weight / scale))])
+            previous = doc_id
+        postings_out.append(flat)
+
+    return {
+        'version': INDEX_VERSION,
+        'scale': scale,
+        'phrases': [list(p) for p in phrase_table()[0]],
+        'stopwords': sorted(STOPWORDS),
+        'terms': terms,
+        'postings': postings_out,
+        'docs': docs,
+    }
+
+
+def write_index(index: Dict[str, Any], path: Path = SEARCH_INDEX_PATH) -> None:
+    """Write the artifact compactly (atomic replace)."""
+    tmp_path = path.with_suffix('.json.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, path)
+    logger.info(f"Search index: {len(index['docs'])} docs, {len(index['terms'])} terms -> {path}")
+
+
+def build_search_index(articles: List[Dict[str, Any]], path: Path = SEARCH_INDEX_PATH,
+                       max_docs: int = 5000) -> Dict[str, Any]:
+    """Build and write the index for the given articles."""
+    index = build_index(articles, max_docs)
+    write_index(index, path)
+    return index
+
+
+def update_search_index(articles: List[Dict[str, Any]], path: Path = SEARCH_INDEX_PATH,
+                        max_docs: int = 5000) -> Dict[str, Any]:
+    """Merge new articles into the window already indexed at `path` and rewrite it."""
+    # New copies come first, so they replace indexed ones with the same title
+    window = dedupe_articles(articles + indexed_articles(path))
+    return build_search_index(window, path, max_docs)
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    with open(RAW_INTEL_PATH, 'r', encoding='utf-8') as f:
+        articles = json.load(f).get('articles', [])
+    build_search_index(score_articles(dedupe_articles(articles)))
+
+
+if __name__ == '__main__':
+    main()
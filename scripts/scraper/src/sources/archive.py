@@ -0,0 +1,183 @@
+"""
+Response Archive Module
+
+Optional record of every raw HTTP response the Fetcher receives, so
+extraction changes (page parsing, site-scraper selectors, feed truncation)
+can be re-run against exactly the same inputs without the network.
+
+Bodies are gzip-compressed and content-addressed by their SHA-256
+(blobs/ab/abcd....gz): capturing an unchanged page again writes nothing
+but one index line. The index (index.jsonl) is append-only; each line
+maps a request (method, canonical URL, form data) to a body hash plus the
+status, encoding and headers the parsers need.
+
+Modes:
+    capture   fetch from the network and archive every response
+    replay    serve responses from the archive only; misses fail like
+              network errors and nothing is sent
+
+Replay uses the newest capture of each request, optionally limited to
+the captures of one run (run_id).
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Iterator, Optional
+from urllib.parse import urlencode
+
+from src.sources.urls import canonicalize_url
+
+logger = logging.getLogger(__name__)
+
+# scripts/scraper/src/sources/archive.py -> scripts/scraper/data/archive
+ARCHIVE_DIR = Path(__file__).resolve().parents[2] / 'data' / 'archive'
+
+MODE_OFF = 'off'
+MODE_CAPTURE = 'capture'
+MODE_REPLAY = 'replay'
+MODES = (MODE_OFF, MODE_CAPTURE, MODE_REPLAY)
+
+# Response headers kept in the index (what parsers and feedparser look at)
+KEPT_HEADERS = ('content-type', 'content-encoding', 'content-language', 'last-modified', 'etag', 'date')
+
+
+def request_key(method: str, url: str, data: Optional[Dict[str, Any]] = None) -> str:
+    """Identity of a request: method, canonical URL and sorted form data."""
+    key = f"{method.upper()} {canonicalize_url(url)}"
+    if data:
+        key += ' ' + urlencode(sorted(data.items()))
+    return key
+
+
+class ArchivedResponse:
+    """A stored response with the parts of requests.Response the Fetcher uses."""
+
+    def __init__(self, record: Dict[str, Any], body: bytes):
+        self.url = record['url']
+        self.status_code = record['status']
+        self.headers = record.get('headers', {})
+        self.encoding = record.get('encoding')
+        self.content = body
+        self.ok = self.status_code < 400
+
+    def iter_content(self, chunk_size: int) -> Iterator[bytes]:
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start:start + chunk_size]
+
+    def close(self) -> None:
+        pass
+
+
+class ResponseArchive:
+    """Content-addressed store of raw response bodies plus a request index."""
+
+    def __init__(self, mode: str = MODE_CAPTURE, root: Path = ARCHIVE_DIR, run_id: Optional[str] = None):
+        if mode not in MODES:
+            raise ValueError(f"Unknown archive mode '{mode}', expected one of {MODES}")
+        self.mode = mode
+        self.root = Path(root)
+        # Captures are tagged with the run; replay defaults to the newest capture of every run
+        self.run_id = run_id or (None if mode == MODE_REPLAY else datetime.now().strftime('%Y-%m-%d'))
+        self.index_path = self.root / 'index.jsonl'
+        self._lock = threading.Lock()
+        self.stats = {'captured': 0, 'new_blobs': 0, 'bytes_written': 0, 'replayed': 0, 'missing': 0}
+
+        # request key -> newest record (replay only)
+        self._records: Dict[str, Dict[str, Any]] = {}
+        if mode == MODE_REPLAY:
+            self._load_index()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], mode: Optional[str] = None,
+                    run_id: Optional[str] = None) -> Optional['ResponseArchive']:
+        """Archive from the `archive` section of sources.yaml (None when off); `mode` overrides it."""
+        archive_config = config.get('archive', {}) or {}
+        mode = mode or archive_config.get('mode', MODE_OFF)
+        if mode == MODE_OFF:
+            return None
+        root = archive_config.get('path')
+        return cls(
+            mode=mode,
+            root=Path(__file__).resolve().parents[2] / root if root else ARCHIVE_DIR,
+            run_id=run_id or archive_config.get('run_id'),
+        )
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == MODE_REPLAY
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.root / 'blobs' / digest[:2] / f"{digest}.gz"
+
+    def _load_index(self) -> None:
+        if not self.index_path.exists():
+            logger.warning(f"Response archive index not found: {self.index_path}")
+            return
+        with open(self.index_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Torn write from an interrupted capture
+                if self.run_id and record.get('run_id') != self.run_id:
+                    continue
+                self._records[record['key']] = record
+        logger.info(f"📼 Replaying {len(self._records)} archived responses from {self.root} (run {self.run_id or 'latest'})")
+
+    def store(self, method: str, url: str, data: Optional[Dict[str, Any]], response: Any,
+              body: bytes, truncated: bool = False, encoding: Optional[str] = None) -> str:
+        """Archive one response body; returns its content hash."""
+        digest = hashlib.sha256(body).hexdigest()
+        path = self._blob_path(digest)
+        record = {
+            'key': request_key(method, url, data),
+            'url': response.url,
+            'status': response.status_code,
+            'encoding': encoding or getattr(response, 'encoding', None),
+            'headers': {k.lower(): v for k, v in response.headers.items() if k.lower() in KEPT_HEADERS},
+            'sha256': digest,
+            'size': len(body),
+            'truncated': truncated,
+            'run_id': self.run_id,
+            'fetched_at': datetime.now().isoformat(timespec='seconds'),
+        }
+
+        with self._lock:
+            if not path.exists():
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_suffix('.gz.tmp')
+                # mtime=0: the same body always compresses to the same bytes
+                with gzip.GzipFile(tmp_path, 'wb', compresslevel=6, mtime=0) as f:
+                    f.write(body)
+                os.replace(tmp_path, path)
+                self.stats['new_blobs'] += 1
+                self.stats['bytes_written'] += path.stat().st_size
+
+            self.root.mkdir(parents=True, exist_ok=True)
+            with open(self.index_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+            self.stats['captured'] += 1
+        return digest
+
+    def lookup(self, method: str, url: str, data: Optional[Dict[str, Any]] = None) -> Optional[ArchivedResponse]:
+        """Newest archived response for a request, or None."""
+        record = self._records.get(request_key(method, url, data))
+        path = self._blob_path(record['sha256']) if record else None
+        if path is None or not path.exists():
+            self.stats['missing'] += 1
+            logger.info(f"  📼 Not in archive: {method} {url}")
+            return None
+
+        with gzip.open(path, 'rb') as f:
+            body = f.read()
+        self.stats['replayed'] += 1
+        return ArchivedResponse(record, body)
+
+    def summary(self) -> Dict[str, Any]:
+        return {'mode': self.mode, 'run_id': self.run_id, **self.stats}
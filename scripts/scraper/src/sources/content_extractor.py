@@ -0,0 +1,250 @@
+"""
+Content Extractor Module
+
+Single-pass page reader for enrichment. An html.parser event handler walks
+the document once, without building a tree, and collects:
+
+  * the title (first <h1>, else <title>), the meta/OpenGraph description
+    and the published-time meta tag, and
+  * text blocks, each with its link-text share and the chain of
+    enclosing containers.
+
+Boilerplate is dropped while streaming: script/style/nav/header/footer/
+aside/form subtrees, and any element whose class or id looks like a
+cookie banner, menu, share bar, newsletter box and so on. Each remaining
+block with enough text and low link density scores its container (and,
+at half weight, the container's parent); the lead paragraphs of the best
+scoring container are the article body.
+"""
+
+import re
+from dataclasses import dataclass
+from html.parser import HTMLParser
+from typing import List, Dict, Any, Optional, Tuple, Union
+
+# Subtrees that never hold article text
+SKIP_TAGS = {
+    'script', 'style', 'noscript', 'template', 'svg', 'iframe', 'canvas',
+    'nav', 'header', 'footer', 'aside', 'form', 'button', 'select', 'textarea',
+}
+
+# Elements tracked on the container stack (they can hold text blocks)
+CONTAINER_TAGS = {
+    'body', 'main', 'article', 'section', 'div', 'td', 'figure', 'ul', 'ol', 'table', 'blockquote',
+}
+
+# Tags whose start or end finishes the current text block
+BLOCK_TAGS = CONTAINER_TAGS | SKIP_TAGS | {
+    'p', 'li', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'pre', 'tr', 'dd', 'dt', 'figcaption', 'br', 'hr',
+}
+
+VOID_TAGS = {'br', 'hr', 'img', 'input', 'meta', 'link', 'area', 'base', 'col', 'embed', 'source', 'track', 'wbr'}
+
+BOILERPLATE_RE = re.compile(
+    r'cookie|consent|gdpr|banner|breadcrumb|\bnav|menu|masthead|footer|sidebar|widget|'
+    r'share|social|newsletter|subscribe|signup|promo|advert|\bads?\b|sponsor|related|'
+    r'comment|popup|modal|disclaimer|skip-link',
+    re.IGNORECASE,
+)
+
+# ...unless the same class/id also names the content ("post-sidebar-wrap" vs "entry-content")
+CONTENT_RE = re.compile(r'article|body|content|entry|main|post|story|text', re.IGNORECASE)
+
+# Page-level wrappers are never treated as boilerplate, whatever their class
+NEVER_SKIPPED = {'body', 'main', 'article'}
+
+# Containers that usually wrap the article body
+CONTAINER_BONUS = {'article': 5.0, 'main': 3.0}
+
+MIN_BLOCK_CHARS = 40
+MAX_LINK_DENSITY = 0.33
+
+CHARSET_RE = re.compile(rb'<meta[^>]+charset=["\']?([\w-]+)', re.IGNORECASE)
+
+
+@dataclass
+class TextBlock:
+    """Text between two block boundaries."""
+    text: str
+    link_chars: int
+    containers: Tuple[int, ...]  # Enclosing container ids, outermost first
+
+    @property
+    def link_density(self) -> float:
+        return self.link_chars / len(self.text) if self.text else 1.0
+
+
+class _PageParser(HTMLParser):
+    """Collects head metadata and scored text blocks in one pass."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.meta: Dict[str, str] = {}
+        self.title = ''
+        self.h1 = ''
+        self.blocks: List[TextBlock] = []
+        self.container_tags: List[str] = []  # Container id -> tag
+
+        # Open tracked elements: (tag, container id or None, skipped)
+        self._stack: List[Tuple[str, Optional[int], bool]] = []
+        self._skip_depth = 0
+        self._link_depth = 0
+        self._capture: Optional[str] = None  # 'title' or 'h1' while inside one
+        self._captured: List[str] = []
+        self._parts: List[str] = []
+        self._link_chars = 0
+
+    def _containers(self) -> Tuple[int, ...]:
+        return tuple(cid for _, cid, _ in self._stack if cid is not None)
+
+    def _flush(self) -> None:
+        text = ' '.join(''.join(self._parts).split())
+        if text:
+            self.blocks.append(TextBlock(text, min(self._link_chars, len(text)), self._containers()))
+        self._parts = []
+        self._link_chars = 0
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if tag == 'meta':
+            attr = dict(attrs)
+            key = (attr.get('name') or attr.get('property') or '').lower()
+            if key and key not in self.meta and attr.get('content'):
+                self.meta[key] = attr['content']
+            return
+
+        if tag in BLOCK_TAGS:
+            self._flush()
+        if tag in VOID_TAGS:
+            return
+
+        if tag == 'title' and not self.title:
+            self._capture, self._captured = 'title', []
+        elif tag == 'h1' and not self.h1:
+            self._capture, self._captured = 'h1', []
+        elif tag == 'a':
+            self._link_depth += 1
+
+        if tag in SKIP_TAGS or tag in CONTAINER_TAGS:
+            attr = dict(attrs)
+            marker = f"{attr.get('class') or ''} {attr.get('id') or ''} {attr.get('role') or ''}"
+            skipped = tag in SKIP_TAGS or (
+                tag not in NEVER_SKIPPED and bool(BOILERPLATE_RE.search(marker)) and not CONTENT_RE.search(marker)
+            )
+            cid = None
+            if not skipped:
+                cid = len(self.container_tags)
+                self.container_tags.append(tag)
+            self._stack.append((tag, cid, skipped))
+            self._skip_depth += skipped
+
+    def handle_startendtag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        # <br/>, <meta ... />: never opened, so never closed
+        if tag == 'meta' or tag in BLOCK_TAGS:
+            self.handle_starttag(tag, attrs)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in BLOCK_TAGS:
+            self._flush()
+
+        if self._capture == tag:
+            text = ' '.join(''.join(self._captured).split())
+            setattr(self, self._capture, text)
+            self._capture = None
+        elif tag == 'a':
+            self._link_depth = max(0, self._link_depth - 1)
+
+        if tag in SKIP_TAGS or tag in CONTAINER_TAGS:
+            # Tolerate unclosed children: pop back to the matching open tag
+            for i in range(len(self._stack) - 1, -1, -1):
+                if self._stack[i][0] == tag:
+                    for _, _, skipped in self._stack[i:]:
+                        self._skip_depth -= skipped
+                    del self._stack[i:]
+                    break
+
+    def handle_data(self, data: str) -> None:
+        if self._capture:
+            self._captured.append(data)
+        if self._skip_depth or self._capture == 'title':
+            return
+        self._parts.append(data)
+        if self._link_depth:
+            self._link_chars += len(data.strip())
+
+    def close(self) -> None:
+        super().close()
+        self._flush()
+
+
+def _decode(content: Union[bytes, str], encoding: Optional[str]) -> str:
+    if isinstance(content, str):
+        return content
+    if not encoding:
+        m = CHARSET_RE.search(content[:4096])
+        encoding = m.group(1).decode('ascii') if m else 'utf-8'
+    try:
+        return content.decode(encoding, errors='replace')
+    except LookupError:
+        return content.decode('utf-8', errors='replace')
+
+
+def _block_score(block: TextBlock) -> float:
+    """Longer, comma-rich, sentence-like text scores higher (capped per block)."""
+    return 1 + min(len(block.text) / 100, 3) + min(block.text.count(','), 3) + (0.5 if block.text[-1] in '.!?"”' else 0)
+
+
+def _lead_paragraphs(parser: _PageParser, target_chars: int = 300, max_chars: int = 1000) -> str:
+    """First body paragraphs of the best scoring container."""
+    good = [b for b in parser.blocks if len(b.text) >= MIN_BLOCK_CHARS and b.link_density <= MAX_LINK_DENSITY]
+    if not good:
+        return ''
+
+    scores: Dict[int, float] = {}
+    for block in good:
+        if not block.containers:
+            continue
+        score = _block_score(block)
+        parent = block.containers[-2] if len(block.containers) > 1 else None
+        scores[block.containers[-1]] = scores.get(block.containers[-1], 0) + score
+        if parent is not None:
+            scores[parent] = scores.get(parent, 0) + score / 2
+
+    if scores:
+        for cid in scores:
+            scores[cid] += CONTAINER_BONUS.get(parser.container_tags[cid], 0)
+        best = max(scores, key=lambda cid: (scores[cid], -cid))
+        body = [b for b in good if best in b.containers]
+    else:
+        body = good
+
+    lead = []
+    length = 0
+    for block in body:
+        if lead and length + len(block.text) > max_chars:
+            break
+        lead.append(block.text)
+        length += len(block.text) + 1
+        if length >= target_chars:
+            break
+    return ' '.join(lead)[:max_chars]
+
+
+def extract_page(content: Union[bytes, str], encoding: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Read a page in one pass.
+
+    Returns:
+        {'title', 'description', 'published', 'body'}: empty strings when
+        absent. 'body' is the lead of the main content.
+    """
+    parser = _PageParser()
+    parser.feed(_decode(content, encoding))
+    parser.close()
+
+    meta = parser.meta
+    return {
+        'title': parser.h1 or parser.title,
+        'description': (meta.get('description') or meta.get('og:description') or '').strip(),
+        'published': meta.get('article:published_time') or meta.get('date') or '',
+        'body': _lead_paragraphs(parser),
+    }
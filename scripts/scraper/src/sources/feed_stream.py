@@ -0,0 +1,120 @@
+"""
+Incremental Feed Parser Module
+
+Parses RSS/Atom feeds entry by entry with an XML pull parser fed from the
+network stream. Each <item>/<entry> is turned into a small dict with its
+fields truncated as they are read, then detached from the tree, so the
+parsed entries never pile up. The raw body is still buffered, capped at the
+fetcher's `max_bytes`, so memory per feed is bounded by that ceiling. The
+caller decides when to stop (age cutoff, item cap); unread bytes are never
+downloaded.
+
+Feeds that are not well-formed XML (HTML entities, broken markup) raise
+xml.etree.ElementTree.ParseError so the caller can fall back to feedparser.
+"""
+
+import logging
+import xml.etree.ElementTree as ET
+from typing import Dict, Iterable, Iterator
+
+logger = logging.getLogger(__name__)
+
+ENTRY_TAGS = {'item', 'entry'}
+
+# Candidate child elements for each field, in order of preference
+TITLE_TAGS = ('title',)
+SUMMARY_TAGS = ('summary', 'description', 'content', 'encoded')
+DATE_TAGS = ('published', 'pubDate', 'updated', 'date', 'issued', 'modified')
+
+
+def _local(tag: str) -> str:
+    """Strip the namespace: '{http://www.w3.org/2005/Atom}entry' -> 'entry'."""
+    return tag.rsplit('}', 1)[-1]
+
+
+def _text(elem: ET.Element, max_chars: int) -> str:
+    """Element text including nested (xhtml) children, truncated."""
+    parts = []
+    size = 0
+    for piece in elem.itertext():
+        parts.append(piece)
+        size += len(piece)
+        if size >= max_chars:
+            break
+    return ''.join(parts)[:max_chars].strip()
+
+
+def _entry_link(entry: ET.Element) -> str:
+    """RSS <link>url</link> or the Atom <link rel="alternate" href=...>."""
+    fallback = ''
+    for child in entry:
+        if _local(child.tag) != 'link':
+            continue
+        href = child.get('href')
+        if href is None:
+            if child.text and child.text.strip():
+                return child.text.strip()
+            continue
+        if child.get('rel', 'alternate') == 'alternate':
+            return href
+        fallback = fallback or href
+    return fallback
+
+
+def _extract_entry(entry: ET.Element, max_chars: int) -> Dict[str, str]:
+    children: Dict[str, ET.Element] = {}
+    for child in entry:
+        children.setdefault(_local(child.tag), child)
+
+    def first(tags, limit) -> str:
+        for tag in tags:
+            if tag in children:
+                value = _text(children[tag], limit)
+                if value:
+                    return value
+        return ''
+
+    return {
+        'title': first(TITLE_TAGS, max_chars),
+        'link': _entry_link(entry),
+        'summary': first(SUMMARY_TAGS, max_chars),
+        'published': first(DATE_TAGS, 100),
+    }
+
+
+def iter_feed_entries(chunks: Iterable[bytes], max_field_chars: int = 500) -> Iterator[Dict[str, str]]:
+    """
+    Yield {title, link, summary, published} for each feed entry as it completes.
+
+    Args:
+        chunks: Raw body chunks (e.g. a Fetcher ResponseStream).
+        max_field_chars: Text fields are cut to this length while parsing.
+    """
+    parser = ET.XMLPullParser(events=('start', 'end'))
+    stack = []
+
+    def drain() -> Iterator[Dict[str, str]]:
+        for event, elem in parser.read_events():
+            if event == 'start':
+                stack.append(elem)
+                continue
+
+            stack.pop()
+            if _local(elem.tag) in ENTRY_TAGS:
+                entry = _extract_entry(elem, max_field_chars)
+                # Detach the finished entry so the tree never grows
+                elem.clear()
+                if stack:
+                    stack[-1].remove(elem)
+                yield entry
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from drain()
+
+    try:
+        parser.close()
+    except ET.ParseError as e:
+        # A body cut off at the byte ceiling ends mid-document; keep what parsed
+        logger.debug(f"Feed ended early: {e}")
+    yield from drain()
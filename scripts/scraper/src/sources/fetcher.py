@@ -0,0 +1,332 @@
+"""
+Fetcher Module
+
+Single entry point for outgoing HTTP requests. Applies the host circuit
+breaker and adaptive timeouts, and records the outcome of every request.
+GET requests are coalesced per run: each canonical URL is downloaded once
+and the result is shared with every caller that asks for it. stream()
+hands out a body chunk by chunk under a byte ceiling for incremental parsers.
+With a ResponseArchive, every response is captured to disk, or (replay)
+served from the archive without touching the network.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Any, Iterator, List, Optional, Tuple
+
+from src.sources.archive import ResponseArchive
+from src.sources.host_health import HostHealth
+from src.sources.urls import canonicalize_url
+from src.lazy import lazy_import
+
+requests = lazy_import('requests')
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+}
+
+
+@dataclass
+class FetchResult:
+    """Raw response body and the metadata parsers need."""
+    url: str
+    status_code: int
+    content: bytes
+    headers: Dict[str, str] = field(default_factory=dict)
+    encoding: Optional[str] = None
+    elapsed: float = 0.0
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or 'utf-8', errors='replace')
+
+
+class ResponseStream:
+    """
+    Body of a streamed response, yielded in chunks up to a byte ceiling.
+
+    Chunks already read are kept (at most `max_bytes`) so a caller whose
+    incremental parse fails can fall back to parsing the whole body.
+    With `on_complete`, the rest of the (capped) body is read when the
+    stream is closed and handed over with the truncation flag, even if
+    the caller stopped early; the response archive uses this.
+    """
+
+    def __init__(
+        self,
+        response: 'requests.Response',
+        max_bytes: int,
+        chunk_size: int = 16384,
+        on_complete: Optional[Callable[[bytes, bool], None]] = None,
+    ):
+        self.response = response
+        self.url = response.url
+        self.headers = dict(response.headers)
+        self.max_bytes = max_bytes
+        self.chunk_size = chunk_size
+        self.buffer = bytearray()
+        self.truncated = False
+        self.on_complete = on_complete
+        self._source = response.iter_content(chunk_size)
+        self._finished = False
+        self._chunks = self._iter_chunks()
+
+    def _take(self, chunk: bytes) -> bytes:
+        """Buffer a chunk, cutting it at the byte ceiling."""
+        room = self.max_bytes - len(self.buffer)
+        if len(chunk) > room:
+            chunk = chunk[:room]
+            self.truncated = True
+            logger.warning(f"Response from {self.url} exceeded {self.max_bytes} bytes, truncated")
+        self.buffer.extend(chunk)
+        return chunk
+
+    def _iter_chunks(self) -> Iterator[bytes]:
+        try:
+            for chunk in self._source:
+                chunk = self._take(chunk)
+                if chunk:
+                    yield chunk
+                if self.truncated:
+                    break
+        finally:
+            self._finish()
+
+    def _finish(self) -> None:
+        if self._finished:
+            return
+        self._finished = True
+        try:
+            if self.on_complete:
+                for chunk in self._source:
+                    if self.truncated:
+                        break
+                    self._take(chunk)
+                self.on_complete(bytes(self.buffer), self.truncated)
+        finally:
+            self.response.close()
+
+    def __iter__(self) -> Iterator[bytes]:
+        return self._chunks
+
+    def read_all(self) -> bytes:
+        """Drain the rest of the stream (still capped) and return the whole body."""
+        for _ in self._chunks:
+            pass
+        return bytes(self.buffer)
+
+    def close(self) -> None:
+        self._finish()
+
+
+class Fetcher:
+    """HTTP client shared by the feed, search and page scrapers."""
+
+    def __init__(
+        self,
+        health: Optional[HostHealth] = None,
+        timeout: float = 15,
+        headers: Optional[Dict[str, str]] = None,
+        coalesce: bool = True,
+        max_cached_responses: int = 256,
+        archive: Optional[ResponseArchive] = None,
+    ):
+        self.health = health
+        self.archive = archive
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update(headers or DEFAULT_HEADERS)
+
+        self.coalesce = coalesce
+        self.max_cached_responses = max_cached_responses
+        self._lock = threading.Lock()
+        self._responses: 'OrderedDict[str, Optional[FetchResult]]' = OrderedDict()
+        self._inflight: Dict[str, Future] = {}
+        # canonical URL -> callers that asked for it
+        self.attributions: Dict[str, List[str]] = {}
+        self.coalesced = 0
+
+    @property
+    def offline(self) -> bool:
+        """Replaying from the archive: no request reaches the network."""
+        return bool(self.archive and self.archive.replaying)
+
+    def fetch(
+        self,
+        url: str,
+        method: str = 'GET',
+        data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        requested_by: Optional[str] = None,
+    ) -> Optional[FetchResult]:
+        """
+        Perform a request, reusing this run's response for repeated GETs.
+
+        Args:
+            requested_by: Optional label (source/query) recorded as an
+                attribution for the canonical URL.
+
+        Returns:
+            FetchResult for 2xx responses, None if the host's circuit is open
+            or the request failed.
+        """
+        if not self.coalesce or method != 'GET' or data:
+            return self._request(url, method, data, headers, timeout)
+
+        key = canonicalize_url(url)
+        with self._lock:
+            if requested_by:
+                requesters = self.attributions.setdefault(key, [])
+                if requested_by not in requesters:
+                    requesters.append(requested_by)
+
+            if key in self._responses:
+                self.coalesced += 1
+                self._responses.move_to_end(key)
+                return self._responses[key]
+
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+            else:
+                self.coalesced += 1
+
+        if not owner:
+            return future.result()
+
+        result = None
+        try:
+            result = self._request(url, method, data, headers, timeout)
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+                self._responses[key] = result
+                while len(self._responses) > self.max_cached_responses:
+                    self._responses.popitem(last=False)
+            future.set_result(result)
+        return result
+
+    def stream(
+        self,
+        url: str,
+        max_bytes: int,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Optional[ResponseStream]:
+        """
+        Start a GET and return its body as a capped chunk stream.
+
+        Streams are not coalesced; the caller consumes the body once.
+        """
+        if self.offline:
+            archived = self.archive.lookup('GET', url)
+            return ResponseStream(archived, max_bytes) if archived and archived.ok else None
+
+        sent = self._send(url, 'GET', None, headers, timeout, stream=True)
+        if sent is None:
+            return None
+        response = sent[0]
+
+        def archive_body(body: bytes, truncated: bool) -> None:
+            self.archive.store('GET', url, None, response, body, truncated)
+        return ResponseStream(response, max_bytes, on_complete=archive_body if self.archive else None)
+
+    def _send(
+        self,
+        url: str,
+        method: str,
+        data: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        timeout: Optional[float],
+        stream: bool = False,
+    ) -> Optional[Tuple['requests.Response', float]]:
+        """
+        Issue the request through the circuit breaker.
+
+        Returns:
+            (response, elapsed seconds) for 2xx responses, otherwise None.
+            For streamed requests elapsed is the time to headers.
+        """
+        if self.health and not self.health.allow(url):
+            logger.info(f"  ⏭️ Circuit open, skipping {url}")
+            return None
+
+        default_timeout = timeout or self.timeout
+        if self.health:
+            default_timeout = self.health.timeout_for(url, default_timeout)
+
+        start = time.monotonic()
+        try:
+            response = self.session.request(method, url, data=data, headers=headers,
+                                            timeout=default_timeout, stream=stream)
+        except requests.exceptions.RequestException as e:
+            if self.health:
+                self.health.record_failure(url, f"{type(e).__name__}: {e}")
+            logger.error(f"Request failed for {url}: {e}")
+            return None
+        elapsed = time.monotonic() - start
+
+        # Server-side trouble counts against the host; a 404 on one page does not
+        if response.status_code >= 500 or response.status_code == 429:
+            if self.health:
+                self.health.record_failure(url, f"HTTP {response.status_code}")
+            logger.error(f"HTTP {response.status_code} for {url}")
+            response.close()
+            return None
+
+        if self.health:
+            self.health.record_success(url, elapsed)
+
+        if not response.ok:
+            logger.error(f"HTTP {response.status_code} for {url}")
+            response.close()
+            return None
+
+        return response, elapsed
+
+    def _request(
+        self,
+        url: str,
+        method: str,
+        data: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        timeout: Optional[float],
+    ) -> Optional[FetchResult]:
+        if self.offline:
+            archived = self.archive.lookup(method, url, data)
+            if archived is None or not archived.ok:
+                return None
+            return FetchResult(
+                url=archived.url,
+                status_code=archived.status_code,
+                content=archived.content,
+                headers=dict(archived.headers),
+                encoding=archived.encoding,
+            )
+
+        sent = self._send(url, method, data, headers, timeout)
+        if sent is None:
+            return None
+        response, elapsed = sent
+
+        result = FetchResult(
+            url=response.url,
+            status_code=response.status_code,
+            content=response.content,
+            headers=dict(response.headers),
+            encoding=response.encoding or response.apparent_encoding,
+            elapsed=elapsed,
+        )
+        if self.archive:
+            self.archive.store(method, url, data, response, result.content, encoding=result.encoding)
+        return result
@@ -0,0 +1,175 @@
+"""
+Host Health Module
+
+Remembers how each host behaved on previous runs and acts as a circuit
+breaker: after repeated failures a host is skipped for an exponentially
+growing window, then a single half-open probe decides whether it has
+recovered. Observed latencies drive per-host adaptive timeouts.
+
+State is kept in data/state/host_health.json.
+"""
+
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Any, Optional, Set
+from urllib.parse import urlparse
+
+from src.state import load_state, save_state
+
+logger = logging.getLogger(__name__)
+
+STATE_FILE = 'host_health.json'
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+# Number of recent latency samples kept per host
+LATENCY_WINDOW = 20
+
+# Samples needed before the adaptive timeout replaces the caller's default
+MIN_LATENCY_SAMPLES = 5
+
+
+def host_of(url: str) -> str:
+    """Lowercased host name of a URL."""
+    try:
+        return urlparse(url).netloc.lower()
+    except Exception:
+        return url
+
+
+def _percentile(values, pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class HostHealth:
+    """Persistent per-host health record with a circuit breaker."""
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        base_backoff_hours: float = 6,
+        max_backoff_hours: float = 24 * 14,
+        min_timeout: float = 5,
+        max_timeout: float = 30,
+        timeout_multiplier: float = 2.0,
+        now: Optional[datetime] = None,
+    ):
+        self.failure_threshold = failure_threshold
+        self.base_backoff = timedelta(hours=base_backoff_hours)
+        self.max_backoff = timedelta(hours=max_backoff_hours)
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.timeout_multiplier = timeout_multiplier
+        self.now = now or datetime.now()
+
+        self.state = load_state(STATE_FILE, {'hosts': {}})
+        self.state.setdefault('hosts', {})
+
+        # Hosts with a half-open probe already in flight during this run
+        self._probing: Set[str] = set()
+        # Enrichment downloads run on several threads
+        self._lock = threading.RLock()
+        self.skipped: Dict[str, int] = {}
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'HostHealth':
+        """Build from the `health` section of sources.yaml."""
+        health_config = config.get('health', {}) or {}
+        return cls(
+            failure_threshold=health_config.get('failure_threshold', 3),
+            base_backoff_hours=health_config.get('base_backoff_hours', 6),
+            max_backoff_hours=health_config.get('max_backoff_hours', 24 * 14),
+            min_timeout=health_config.get('min_timeout', 5),
+            max_timeout=health_config.get('max_timeout', 30),
+        )
+
+    def _record(self, host: str) -> Dict[str, Any]:
+        return self.state['hosts'].setdefault(host, {
+            'state': CLOSED,
+            'failures': 0,
+            'trips': 0,
+            'open_until': None,
+            'latencies': [],
+            'last_error': None,
+        })
+
+    def allow(self, url: str) -> bool:
+        """
+        Whether a request to this URL's host should be attempted.
+
+        An open circuit whose backoff has expired moves to half-open and
+        lets exactly one probe through.
+        """
+        host = host_of(url)
+        with self._lock:
+            record = self.state['hosts'].get(host)
+            if not record or record['state'] == CLOSED:
+                return True
+
+            if record['state'] == OPEN:
+                if self.now < datetime.fromisoformat(record['open_until']):
+                    self.skipped[host] = self.skipped.get(host, 0) + 1
+                    return False
+                record['state'] = HALF_OPEN
+
+            # Half-open: one probe per run until it succeeds
+            if host in self._probing:
+                self.skipped[host] = self.skipped.get(host, 0) + 1
+                return False
+            self._probing.add(host)
+        logger.info(f"  🩺 Probing recovering host: {host}")
+        return True
+
+    def timeout_for(self, url: str, default: float) -> float:
+        """Adaptive timeout from the host's observed latency distribution."""
+        record = self.state['hosts'].get(host_of(url))
+        if not record or len(record.get('latencies', [])) < MIN_LATENCY_SAMPLES:
+            return default
+
+        p95 = _percentile(record['latencies'], 95)
+        return max(self.min_timeout, min(p95 * self.timeout_multiplier + 1, self.max_timeout))
+
+    def record_success(self, url: str, latency: float) -> None:
+        """Close the circuit and add a latency sample."""
+        host = host_of(url)
+        with self._lock:
+            record = self._record(host)
+
+            if record['state'] != CLOSED:
+                logger.info(f"  ✅ Host recovered: {host}")
+            record.update({'state': CLOSED, 'failures': 0, 'trips': 0, 'open_until': None})
+            record['latencies'] = (record.get('latencies', []) + [round(latency, 3)])[-LATENCY_WINDOW:]
+            self._probing.discard(host)
+
+    def record_failure(self, url: str, error: str) -> None:
+        """Count a failure and trip the circuit once the threshold is reached."""
+        host = host_of(url)
+        with self._lock:
+            record = self._record(host)
+            record['failures'] += 1
+            record['last_error'] = error[:200]
+
+            if record['state'] == HALF_OPEN or record['failures'] >= self.failure_threshold:
+                backoff = min(self.base_backoff * (2 ** record['trips']), self.max_backoff)
+                record['trips'] += 1
+                record['state'] = OPEN
+                record['open_until'] = (self.now + backoff).isoformat()
+                logger.warning(f"  ⛔ Circuit open for {host} until {record['open_until'][:16]} ({error[:80]})")
+
+            self._probing.discard(host)
+
+    def save(self) -> None:
+        """Persist the health record."""
+        save_state(STATE_FILE, self.state)
+
+    def summary(self) -> Dict[str, Any]:
+        """Open circuits and skipped request counts for the run report."""
+        return {
+            'open_hosts': sorted(h for h, r in self.state['hosts'].items() if r['state'] != CLOSED),
+            'skipped_requests': dict(self.skipped),
+        }
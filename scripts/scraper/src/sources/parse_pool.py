@@ -0,0 +1,119 @@
+"""
+Parse Pool Module
+
+Splits page scraping into network I/O and HTML parsing. A small thread pool
+downloads raw bytes while a process pool parses them on every available
+core. Parse submissions go through a bounded semaphore, so downloaders
+block (backpressure) when the parsers fall behind instead of piling raw
+pages up in memory.
+
+Parser processes are started with forkserver (spawn on Windows), never
+fork: the scout forks from a process that already runs fetcher threads,
+and a forked child can inherit a lock held by one of them.
+"""
+
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Iterable, List, Any, Optional, TypeVar
+
+from src.sources.fetcher import FetchResult
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+
+class ParsePool:
+    """Process pool for CPU-bound parsing with a bounded backlog."""
+
+    def __init__(self, workers: Optional[int] = None, max_pending: int = 32):
+        """
+        Args:
+            workers: Parser processes (None = one per CPU, 0 = parse inline).
+            max_pending: Parse jobs allowed in flight before submitters block.
+        """
+        self.executor = None
+        if workers != 0:
+            self.executor = ProcessPoolExecutor(max_workers=workers,
+                                                mp_context=multiprocessing.get_context(START_METHOD))
+        self._slots = threading.BoundedSemaphore(max_pending)
+
+    def submit(self, fn: Callable[..., T], *args: Any) -> 'Future[T]':
+        """Queue a parse job, blocking while the backlog is full."""
+        if self.executor is None:
+            future: Future = Future()
+            try:
+                future.set_result(fn(*args))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+
+        self._slots.acquire()
+        try:
+            future = self.executor.submit(fn, *args)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def close(self) -> None:
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+
+    def __enter__(self) -> 'ParsePool':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def fetch_and_parse(
+    items: Iterable[T],
+    fetch: Callable[[T], Optional[FetchResult]],
+    parse: Callable[[bytes, Optional[str], str], Any],
+    pool: ParsePool,
+    io_workers: int = 8,
+) -> List[Any]:
+    """
+    Download every item on I/O threads and parse the bodies in the pool.
+
+    Args:
+        items: Work items (passed to `fetch`).
+        fetch: Returns the raw response for an item, or None to skip it.
+        parse: Top-level (picklable) function called as parse(content, encoding, url).
+        pool: ParsePool the parse jobs run in.
+        io_workers: Concurrent downloads.
+
+    Returns:
+        One parse result (or None on failure) per item, in input order.
+    """
+    def download(item: T) -> Optional['Future[Any]']:
+        try:
+            fetched = fetch(item)
+        except Exception as e:
+            logger.error(f"Fetch failed: {e}")
+            return None
+        if fetched is None:
+            return None
+        # Hands the bytes to a parser and moves straight on to the next download
+        return pool.submit(parse, fetched.content, fetched.encoding, fetched.url)
+
+    with ThreadPoolExecutor(max_workers=io_workers) as io_pool:
+        parse_futures = list(io_pool.map(download, items))
+
+    results = []
+    for future in parse_futures:
+        if future is None:
+            results.append(None)
+            continue
+        try:
+            results.append(future.result())
+        except Exception as e:
+            logger.error(f"Parse failed: {e}")
+            results.append(None)
+    return results
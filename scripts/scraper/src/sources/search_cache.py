@@ -0,0 +1,190 @@
+"""
+Search Cache Module
+
+Persistent cache of search-engine result pages, keyed by normalized query
+and region (kl). An entry remembers the largest result count fetched for
+its query and answers any request up to that count with a slice, so
+alerts asking for different counts share one fetch. Entries are fresh for a per-query TTL
+(shorter for news-heavy queries, and for queries whose results keep
+changing), then stale for a grace window in which they are still served
+while the query is queued for revalidation. The cache is bounded: least
+recently used entries are evicted beyond max_entries.
+
+State is kept in data/state/search_cache.json.
+"""
+
+import logging
+import re
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, Optional, Tuple
+
+from src.state import load_state, save_state
+
+logger = logging.getLogger(__name__)
+
+STATE_FILE = 'search_cache.json'
+
+STATUS_FRESH = 'fresh'
+STATUS_STALE = 'stale'
+STATUS_MISS = 'miss'
+
+DEFAULT_NEWS_KEYWORDS = [
+    'news', 'announce', 'launch', 'funding', 'raises', 'acquire', 'acquisition',
+    'partnership', 'harvest', 'report', 'price', 'market',
+]
+
+# Weight given to the newest observation in the result-change average
+CHANGE_SMOOTHING = 0.5
+
+# Queries whose results change more than this (0-1) are treated as news-heavy
+VOLATILE_CHANGE_RATE = 0.5
+
+
+def normalize_query(query: str) -> str:
+    """Case- and whitespace-insensitive form of a query."""
+    return ' '.join(query.lower().split())
+
+
+def cache_key(query: str, region: str) -> str:
+    return f"{region}|{normalize_query(query)}"
+
+
+def _change_fraction(old: List[Dict[str, Any]], new: List[Dict[str, Any]]) -> float:
+    """Share of new result links that were not in the previous results."""
+    if not new:
+        return 0.0
+    old_links = {r.get('link') for r in old}
+    return sum(1 for r in new if r.get('link') not in old_links) / len(new)
+
+
+class SearchCache:
+    """TTL + stale-while-revalidate cache for search results."""
+
+    def __init__(
+        self,
+        ttl_hours: float = 72,
+        news_ttl_hours: float = 12,
+        stale_hours: float = 72,
+        max_entries: int = 500,
+        news_keywords: Optional[List[str]] = None,
+        enabled: bool = True,
+        now: Optional[datetime] = None,
+    ):
+        self.ttl = timedelta(hours=ttl_hours)
+        self.news_ttl = timedelta(hours=news_ttl_hours)
+        self.stale = timedelta(hours=stale_hours)
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self.now = now or datetime.now()
+
+        keywords = news_keywords if news_keywords is not None else DEFAULT_NEWS_KEYWORDS
+        self._news_re = re.compile(r'\b(?:' + '|'.join(re.escape(k.lower()) for k in keywords) + r')') if keywords else None
+
+        self.state = load_state(STATE_FILE, {'entries': {}})
+        self.entries: Dict[str, Dict[str, Any]] = self.state.setdefault('entries', {})
+        self.stats = {STATUS_FRESH: 0, STATUS_STALE: 0, STATUS_MISS: 0, 'stored': 0}
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'SearchCache':
+        """Build a cache from the `search_cache` section of sources.yaml."""
+        cache_config = config.get('search_cache', {}) or {}
+        return cls(
+            ttl_hours=cache_config.get('ttl_hours', 72),
+            news_ttl_hours=cache_config.get('news_ttl_hours', 12),
+            stale_hours=cache_config.get('stale_hours', 72),
+            max_entries=cache_config.get('max_entries', 500),
+            news_keywords=cache_config.get('news_keywords'),
+            enabled=cache_config.get('enabled', True),
+        )
+
+    def ttl_for(self, query: str, entry: Optional[Dict[str, Any]] = None) -> timedelta:
+        """News-heavy (by wording or by observed churn) queries expire sooner."""
+        if self._news_re and self._news_re.search(normalize_query(query)):
+            return self.news_ttl
+        if entry and entry.get('change_rate', 0) > VOLATILE_CHANGE_RATE:
+            return self.news_ttl
+        return self.ttl
+
+    def lookup(self, query: str, region: str, num_results: int) -> Tuple[str, Optional[List[Dict[str, Any]]]]:
+        """
+        Returns:
+            (status, results): fresh and stale hits carry the first
+            `num_results` cached results; a miss (no entry, one fetched with
+            fewer results, or one past its stale window) carries None.
+        """
+        if not self.enabled:
+            return STATUS_MISS, None
+
+        entry = self.entries.get(cache_key(query, region))
+        if entry is None or entry.get('num_results', 0) < num_results:
+            self.stats[STATUS_MISS] += 1
+            return STATUS_MISS, None
+
+        age = self.now - datetime.fromisoformat(entry['fetched_at'])
+        ttl = self.ttl_for(query, entry)
+        if age < ttl:
+            status = STATUS_FRESH
+        elif age < ttl + self.stale:
+            status = STATUS_STALE
+        else:
+            self.stats[STATUS_MISS] += 1
+            return STATUS_MISS, None
+
+        self.stats[status] += 1
+        entry['last_used'] = self.now.isoformat()
+        return status, [dict(r) for r in entry['results'][:num_results]]
+
+    def store(self, query: str, region: str, num_results: int, results: List[Dict[str, Any]]) -> None:
+        """
+        Record fresh results and how much they differ from the last fetch.
+
+        A smaller fetch than the stored one keeps the stored tail after the
+        fresh results, so the entry still answers the larger count.
+        """
+        if not self.enabled:
+            return
+
+        key = cache_key(query, region)
+        previous = self.entries.get(key)
+        change_rate = 0.0  # Unknown until the second fetch
+        if previous is not None:
+            change = _change_fraction(previous['results'][:num_results], results)
+            change_rate = CHANGE_SMOOTHING * change + (1 - CHANGE_SMOOTHING) * previous.get('change_rate', change)
+
+            if previous.get('num_results', 0) > num_results:
+                links = {r.get('link') for r in results}
+                tail = [r for r in previous['results'] if r.get('link') not in links]
+                num_results = previous['num_results']
+                results = (results + tail)[:num_results]
+
+        self.entries[key] = {
+            'query': query,
+            'num_results': num_results,
+            'fetched_at': self.now.isoformat(),
+            'last_used': self.now.isoformat(),
+            'change_rate': round(change_rate, 3),
+            'results': results,
+        }
+        self.stats['stored'] += 1
+
+    def _evict(self) -> None:
+        """Drop entries past their stale window, then the least recently used."""
+        for key, entry in list(self.entries.items()):
+            age = self.now - datetime.fromisoformat(entry['fetched_at'])
+            if age >= self.ttl_for(entry['query'], entry) + self.stale:
+                del self.entries[key]
+
+        overflow = len(self.entries) - self.max_entries
+        if overflow > 0:
+            by_use = sorted(self.entries, key=lambda k: self.entries[k]['last_used'])
+            for key in by_use[:overflow]:
+                del self.entries[key]
+
+    def save(self) -> None:
+        if not self.enabled:
+            return
+        self._evict()
+        save_state(STATE_FILE, self.state)
+
+    def summary(self) -> Dict[str, Any]:
+        return {'entries': len(self.entries), **self.stats}
@@ -2,37 +2,107 @@
 Search Scraper Module
 
 Leverages DuckDuckGo HTML version to perform search queries without external dependencies.
+Result pages can be served from a SearchCache so unchanged standing queries
+don't spend the search host's rate limit every run.
 """
 
 import logging
 import time
-import requests
-from bs4 import BeautifulSoup
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Union
+
+from src.sources.fetcher import Fetcher
+from src.sources.search_cache import SearchCache, STATUS_MISS
+from src.sources.urls import resolve_result_url
+from src.lazy import lazy_import
+
+bs4 = lazy_import('bs4')
 
 logger = logging.getLogger(__name__)
 
+
+def parse_search_results(content: Union[bytes, str], encoding: Optional[str], num_results: int = 5) -> List[Dict[str, Any]]:
+    """
+    Extract result records from a DuckDuckGo HTML results page.
+
+    Module-level so it can run in a parser process.
+    """
+    results = []
+    if isinstance(content, bytes):
+        soup = bs4.BeautifulSoup(content, 'html.parser', from_encoding=encoding)
+    else:
+        soup = bs4.BeautifulSoup(content, 'html.parser')
+
+    # Parse results
+    # DDG HTML structure often has 'div.result' or similar. 
+    # Current structure typically: .result__body with .result__title and .result__snippet
+
+    # Select result blocks
+    result_blocks = soup.select('.result')
+
+    count = 0
+    for block in result_blocks:
+        if count >= num_results:
+            break
+
+        title_tag = block.select_one('.result__title a')
+        snippet_tag = block.select_one('.result__snippet')
+
+        if title_tag:
+            # Result hrefs are usually //duckduckgo.com/l/?uddg=... wrappers
+            link = resolve_result_url(title_tag.get('href', ''))
+            title = title_tag.get_text(strip=True)
+            snippet = snippet_tag.get_text(strip=True) if snippet_tag else ""
+
+            # Filter out ads or weird links
+            if 'duckduckgo.com' in link:
+                continue 
+
+            results.append({
+                'title': title,
+                'link': link,
+                'summary': snippet,
+                'published': datetime.now().isoformat(),
+                'source': 'DuckDuckGo Search',
+                'category': 'search_result'
+            })
+            count += 1
+
+    return results
+
+
 class SearchScraper:
     """Handles search interactions using html.duckduckgo.com."""
     
-    def __init__(self, max_retries: int = 3, delay: int = 2):
+    def __init__(
+        self,
+        max_retries: int = 3,
+        delay: int = 2,
+        fetcher: Optional[Fetcher] = None,
+        cache: Optional[SearchCache] = None,
+        region: str = 'ca-en',  # kl=ca-en for Canada English
+    ):
         self.max_retries = max_retries
         self.delay = delay
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.fetcher = fetcher or Fetcher()
+        self.cache = cache
+        self.region = region
+        # Cache status of the most recent search(): fresh, stale or miss
+        self.last_status = STATUS_MISS
+        self.headers = {
              'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
              'Referer': 'https://duckduckgo.com/',
              'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8'
-        })
+        }
 
-    def search(self, query: str, num_results: int = 5) -> List[Dict[str, Any]]:
+    def search(self, query: str, num_results: int = 5, refresh: bool = False) -> List[Dict[str, Any]]:
         """
         Execute a search query against html.duckduckgo.com.
         
         Args:
             query: The search query string.
             num_results: Max number of results to return.
+            refresh: Skip the cache lookup (revalidating a stale entry).
             
         Returns:
             List of dictionaries containing title, link, and summary.
@@ -40,6 +110,13 @@ class SearchScraper:
         results = []
         url = "https://html.duckduckgo.com/html/"
         
+        self.last_status = STATUS_MISS
+        if self.cache and not refresh:
+            status, cached = self.cache.lookup(query, self.region, num_results)
+            if cached is not None:
+                self.last_status = status
+                return cached
+        
         try:
             # Polite delay
             time.sleep(self.delay)
@@ -47,49 +124,19 @@ class SearchScraper:
             logger.info(f"Searching (HTML): {query[:50]}...")
             
             # Using POST for html.duckduckgo.com is standard
-            payload = {'q': query, 'kl': 'ca-en'} # kl=ca-en for Canada English
+            payload = {'q': query, 'kl': self.region}
             
-            resp = self.session.post(url, data=payload, timeout=10)
+            resp = self.fetcher.fetch(url, method='POST', data=payload, headers=self.headers, timeout=10)
             
-            if resp.status_code != 200:
-                logger.error(f"Search error: Status {resp.status_code}")
+            if resp is None:
+                logger.error("Search error: no response")
                 return []
                 
-            soup = BeautifulSoup(resp.text, 'html.parser')
-            
-            # Parse results
-            # DDG HTML structure often has 'div.result' or similar. 
-            # Current structure typically: .result__body with .result__title and .result__snippet
+            results = parse_search_results(resp.content, resp.encoding, num_results)
             
-            # Select result blocks
-            result_blocks = soup.select('.result')
-            
-            count = 0
-            for block in result_blocks:
-                if count >= num_results:
-                    break
-                    
-                title_tag = block.select_one('.result__title a')
-                snippet_tag = block.select_one('.result__snippet')
-                
-                if title_tag:
-                    link = title_tag.get('href', '')
-                    title = title_tag.get_text(strip=True)
-                    snippet = snippet_tag.get_text(strip=True) if snippet_tag else ""
-                    
-                    # Filter out ads or weird links
-                    if 'duckduckgo.com' in link:
-                        continue 
-                        
-                    results.append({
-                        'title': title,
-                        'link': link,
-                        'summary': snippet,
-                        'published': datetime.now().isoformat(),
-                        'source': 'DuckDuckGo Search',
-                        'category': 'search_result'
-                    })
-                    count += 1
+            # An empty page is more often a block than a real zero-hit query
+            if self.cache and results:
+                self.cache.store(query, self.region, num_results, results)
                 
         except Exception as e:
             logger.error(f"Search failed for query '{query}': {e}")
@@ -0,0 +1,155 @@
+"""
+Site Scraper Module
+
+Config-driven scrapers for company news pages without a feed. Each site is
+declared in sources.yaml under `site_scrapers` with CSS selectors for the
+news items and their title/link/date. Selectors are compiled once, and
+parsing is restricted to the elements the item selector can match so
+BeautifulSoup never builds the rest of the page.
+"""
+
+import logging
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import List, Dict, Any, Optional
+from urllib.parse import urljoin
+
+from src.sources.fetcher import Fetcher
+from src.lazy import lazy_import
+
+bs4 = lazy_import('bs4')
+soupsieve = lazy_import('soupsieve')
+
+logger = logging.getLogger(__name__)
+
+# Leading tag name of a compound selector ("article.news-item" -> "article")
+_LEADING_TAG = re.compile(r'^([a-zA-Z][\w-]*)')
+
+
+@dataclass
+class SiteScraperSpec:
+    """Declarative description of one scraped news page."""
+    name: str
+    url: str
+    item_selector: str
+    title_selector: str
+    link_selector: str = 'a'
+    date_selector: Optional[str] = None
+    summary_selector: Optional[str] = None
+    limit: int = 5
+    base_url: Optional[str] = None
+    category: str = 'company'
+    require_link: bool = False
+    # Tag name(s) to parse, overriding the ones derived from item_selector
+    scope: Optional[List[str]] = None
+
+    @classmethod
+    def from_config(cls, entry: Dict[str, Any]) -> 'SiteScraperSpec':
+        scope = entry.get('scope')
+        return cls(
+            name=entry['name'],
+            url=entry['url'],
+            item_selector=entry['item_selector'],
+            title_selector=entry['title_selector'],
+            link_selector=entry.get('link_selector', 'a'),
+            date_selector=entry.get('date_selector'),
+            summary_selector=entry.get('summary_selector'),
+            limit=entry.get('limit', 5),
+            base_url=entry.get('base_url'),
+            category=entry.get('category', 'company'),
+            require_link=entry.get('require_link', False),
+            scope=[scope] if isinstance(scope, str) else scope,
+        )
+
+
+@lru_cache(maxsize=None)
+def compile_selector(selector: str) -> 'soupsieve.SoupSieve':
+    """Compile a CSS selector once per process."""
+    return soupsieve.compile(selector)
+
+
+@lru_cache(maxsize=None)
+def _strainer_for(item_selector: str, scope: Optional[tuple]) -> Optional['bs4.SoupStrainer']:
+    """
+    Build a SoupStrainer that keeps only the subtrees items can live in.
+
+    Every comma-separated part of the item selector must start with a tag
+    name; otherwise (e.g. ".news-item") the whole page has to be parsed.
+    """
+    if scope:
+        return bs4.SoupStrainer(list(scope))
+
+    names = set()
+    for part in item_selector.split(','):
+        match = _LEADING_TAG.match(part.strip())
+        if not match:
+            return None
+        names.add(match.group(1).lower())
+
+    return bs4.SoupStrainer(sorted(names))
+
+
+def parse_listing(spec: SiteScraperSpec, html: str) -> List[Dict[str, Any]]:
+    """Extract article records from a fetched listing page."""
+    strainer = _strainer_for(spec.item_selector, tuple(spec.scope) if spec.scope else None)
+    soup = bs4.BeautifulSoup(html, 'html.parser', parse_only=strainer)
+
+    title_sel = compile_selector(spec.title_selector)
+    link_sel = compile_selector(spec.link_selector)
+    date_sel = compile_selector(spec.date_selector) if spec.date_selector else None
+    summary_sel = compile_selector(spec.summary_selector) if spec.summary_selector else None
+
+    base_url = spec.base_url or spec.url
+    articles = []
+
+    for item in compile_selector(spec.item_selector).select(soup, limit=spec.limit):
+        title_elem = title_sel.select_one(item)
+        link_elem = item if link_sel.match(item) else link_sel.select_one(item)
+
+        if not title_elem or (spec.require_link and not link_elem):
+            continue
+
+        link = link_elem.get('href', '') if link_elem else ''
+        if link and not link.startswith('http'):
+            link = urljoin(base_url, link)
+
+        published = datetime.now()
+        date_elem = date_sel.select_one(item) if date_sel else None
+        if date_elem:
+            try:
+                from dateutil import parser as date_parser
+                published = date_parser.parse(date_elem.get('datetime') or date_elem.get_text(strip=True))
+            except Exception:
+                pass
+
+        summary_elem = summary_sel.select_one(item) if summary_sel else None
+
+        articles.append({
+            'title': title_elem.get_text(strip=True),
+            'link': link,
+            'summary': summary_elem.get_text(' ', strip=True)[:500] if summary_elem else '',
+            'published': published.isoformat(),
+            'source': spec.name,
+            'category': spec.category,
+        })
+
+    return articles
+
+
+def scrape_site(spec: SiteScraperSpec, fetcher: Optional[Fetcher] = None) -> Optional[List[Dict[str, Any]]]:
+    """Fetch and parse one declared site. Returns None if the page could not be fetched."""
+    try:
+        logger.info(f"Scraping: {spec.name} ({spec.url})")
+        response = (fetcher or Fetcher()).fetch(spec.url)
+        if response is None:
+            return None
+
+        articles = parse_listing(spec, response.text)
+        logger.info(f"  -> Found {len(articles)} items from {spec.name}")
+        return articles
+
+    except Exception as e:
+        logger.error(f"Error scraping {spec.name}: {e}")
+        return None
@@ -0,0 +1,199 @@
+"""
+URL Utilities
+
+Canonical URL keys used to recognise the same resource requested under
+slightly different URLs (scheme, www., tracking parameters, trailing
+slashes, fragments). Canonical keys identify resources; the original URL
+is still what gets fetched. Search-engine redirect wrappers can be
+unwrapped offline so results point straight at their target.
+"""
+
+import base64
+import binascii
+from typing import Dict, Any, List, Optional
+from urllib.parse import SplitResult, urlsplit, urlunsplit, parse_qs, parse_qsl, urlencode
+
+# Query parameters that never change the resource being served
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'mc_cid', 'mc_eid', 'ocid',
+    'cmpid', 'mkt_tok', '_hsenc', '_hsmi', 'igshid', 'ref_src', 'spm',
+}
+TRACKING_PREFIXES = ('utm_',)
+
+DEFAULT_PORTS = {'http': '80', 'https': '443'}
+
+# Redirect wrappers: (host suffix, path prefix, query parameters holding the target)
+REDIRECT_WRAPPERS = [
+    ('duckduckgo.com', '/l/', ('uddg',)),
+    ('google.com', '/url', ('url', 'q')),
+    ('bing.com', '/ck/a', ('u',)),
+]
+
+# Wrappers nested inside wrappers are unwrapped up to this depth
+MAX_REDIRECT_DEPTH = 3
+
+
+def is_tracking_param(name: str) -> bool:
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def _split(url: str) -> Optional[SplitResult]:
+    """urlsplit(), or None for a URL it rejects or whose port is malformed."""
+    try:
+        parts = urlsplit(url)
+        parts.port  # Only validated when read
+    except ValueError:
+        return None
+    return parts
+
+
+def strip_tracking_params(url: str) -> str:
+    """Remove tracking query parameters, leaving everything else untouched."""
+    parts = _split(url)
+    if parts is None:
+        return url
+    if not parts.query:
+        return url
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if not is_tracking_param(k)]
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), parts.fragment))
+
+
+def _decode_bing_target(value: str) -> Optional[str]:
+    """Bing stores the target as 'a1' + unpadded urlsafe base64."""
+    if not value.startswith('a1'):
+        return None
+    encoded = value[2:]
+    try:
+        return base64.urlsafe_b64decode(encoded + '=' * (-len(encoded) % 4)).decode('utf-8')
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        return None
+
+
+def unwrap_redirect(url: str) -> str:
+    """
+    Return the target of a known search-engine redirect link.
+
+    Works offline from the query string; unknown URLs are returned unchanged.
+    """
+    for _ in range(MAX_REDIRECT_DEPTH):
+        candidate = 'https:' + url if url.startswith('//') else url
+        try:
+            parts = urlsplit(candidate)
+        except ValueError:
+            return url
+        host = (parts.hostname or '').lower()
+
+        target = None
+        for suffix, path_prefix, params in REDIRECT_WRAPPERS:
+            if (host == suffix or host.endswith('.' + suffix)) and parts.path.startswith(path_prefix):
+                query = parse_qs(parts.query)
+                for param in params:
+                    if query.get(param):
+                        value = query[param][0]
+                        target = _decode_bing_target(value) if suffix == 'bing.com' else value
+                        break
+                break
+
+        if not target or not target.startswith(('http://', 'https://')):
+            return url
+        url = target
+
+    return url
+
+
+def resolve_result_url(url: str) -> str:
+    """Unwrap redirect wrappers and drop tracking parameters from a result link."""
+    return strip_tracking_params(unwrap_redirect(url))
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Canonical identity key for a URL.
+
+    http/https and a leading www. are treated as the same site, default
+    ports, fragments, tracking parameters and trailing slashes are dropped,
+    and remaining query parameters are sorted.
+    """
+    url = (url or '').strip()
+    if not url:
+        return ''
+    if url.startswith('//'):
+        url = 'https:' + url
+
+    parts = _split(url)
+    if parts is None:
+        return url
+
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    if host.startswith('www.'):
+        host = host[4:]
+
+    netloc = host
+    if parts.port is not None and str(parts.port) != DEFAULT_PORTS.get(scheme):
+        netloc = f"{host}:{parts.port}"
+
+    path = parts.path or '/'
+    if len(path) > 1 and path.endswith('/'):
+        path = path.rstrip('/')
+
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if not is_tracking_param(k))
+
+    if scheme in ('http', 'https'):
+        scheme = 'https'
+    return urlunsplit((scheme, netloc, path, urlencode(query), ''))
+
+
+def link_identity(link: str, title: str = '') -> str:
+    """
+    Identity key of an article: its canonical link, or its title without one.
+
+    canonicalize_url() drops fragments, but single-page sources link their
+    items as anchors on one page (https://groundtruth.ag#benchtopmvnirs).
+    A fragment on a bare site page (no path or query) is kept, since it is
+    all that tells those items apart; an anchor into any other page adds
+    the title to the key instead.
+    """
+    normalized_title = ' '.join(title.lower().split())
+    key = canonicalize_url(link)
+    if not key:
+        return normalized_title
+
+    parts = _split(link.strip())
+    if parts is None or not parts.fragment:
+        return key
+    if urlsplit(key).path == '/' and not urlsplit(key).query:
+        return f"{key}#{parts.fragment}"
+    return f"{key} {normalized_title}" if normalized_title else key
+
+
+def merge_duplicate_articles(articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Collapse articles that point at the same link (see link_identity).
+
+    The first copy is kept; every copy's source and category are recorded
+    in its `attributions` list so nothing is lost about who reported it.
+    """
+    merged: Dict[str, Dict[str, Any]] = {}
+    result = []
+
+    for article in articles:
+        attributions = article.get('attributions') or [
+            {'source': article.get('source', ''), 'category': article.get('category', '')}
+        ]
+        key = link_identity(article.get('link', ''), article.get('title', '')) if article.get('link') else ''
+
+        if key and key in merged:
+            existing = merged[key]['attributions']
+            for attribution in attributions:
+                if attribution not in existing:
+                    existing.append(attribution)
+            continue
+
+        article['attributions'] = list(attributions)
+        if key:
+            merged[key] = article
+        result.append(article)
+
+    return result
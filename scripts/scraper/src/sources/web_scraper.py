@@ -1,98 +1,111 @@
 """
 Generic Web Scraper Module
 
-Fetches and extracts content from direct URLs using BeautifulSoup.
+Fetches and extracts content from direct URLs (see content_extractor).
+Parsing lives in the module-level parse_article_page() so it can run in a
+parser process (see parse_pool) separately from the download.
 """
 
 import logging
-import requests
-from bs4 import BeautifulSoup
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
+
+from src.sources.fetcher import Fetcher, FetchResult
+from src.sources.content_extractor import extract_page
 
 logger = logging.getLogger(__name__)
 
+
+def parse_article_page(content: Union[bytes, str], encoding: Optional[str], url: str) -> Dict[str, Any]:
+    """
+    Extract title, summary and publish date from a downloaded page.
+
+    Args:
+        content: Raw response body.
+        encoding: Encoding reported by the server, if any.
+        url: Final URL of the page.
+
+    Returns:
+        Article dictionary.
+    """
+    page = extract_page(content, encoding)
+    title = page['title'] or "No Title"
+
+    # Meta description, else the lead of the main content (boilerplate removed)
+    summary = page['description'] or page['body']
+
+    # Simplistic Date Extraction (Meta tags first)
+    published = datetime.now() # Default
+    if page['published']:
+        try:
+            date_str = page['published']
+            # Attempt parse (very basic)
+            if date_str:
+                 # Use dateutil if available, otherwise ignore complex parsing for this MVP
+                 from dateutil import parser
+                 published = parser.parse(date_str)
+        except Exception:
+            pass
+
+    return {
+        'title': title,
+        'link': url,
+        'summary': summary,
+        'published': published.isoformat(),
+        'source': _get_domain(url),
+        'category': 'scraped_web'
+    }
+
+
+def _get_domain(url: str) -> str:
+    from urllib.parse import urlparse
+    try:
+        return urlparse(url).netloc
+    except:
+        return "Unknown"
+
+
 class WebScraper:
-    """Generic web scraper using BeautifulSoup."""
-    
-    def __init__(self, timeout: int = 15):
+    """Generic web scraper for direct article URLs."""
+
+    def __init__(self, timeout: int = 15, fetcher: Optional[Fetcher] = None):
         self.timeout = timeout
+        self.fetcher = fetcher or Fetcher(timeout=timeout)
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5'
         }
 
+    def fetch(self, url: str, requested_by: Optional[str] = None) -> Optional[FetchResult]:
+        """Download a page without parsing it."""
+        logger.info(f"Scraping direct URL: {url}")
+        return self.fetcher.fetch(url, headers=self.headers, timeout=self.timeout, requested_by=requested_by)
+
     def scrape_url(self, url: str) -> Optional[Dict[str, Any]]:
         """
         Fetch and parse a single URL.
-        
+
         Args:
             url: The URL to scrape.
-            
+
         Returns:
             Dictionary with title, summary, etc., or None if failed.
         """
         try:
-            logger.info(f"Scraping direct URL: {url}")
-            response = requests.get(url, headers=self.headers, timeout=self.timeout)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Extract Title
-            title_tag = soup.find('h1') or soup.find('title')
-            title = title_tag.get_text(strip=True) if title_tag else "No Title"
-            
-            # Extract Meta Description or First Paragraph for Summary
-            summary = ""
-            meta_desc = soup.find('meta', attrs={'name': 'description'}) or soup.find('meta', attrs={'property': 'og:description'})
-            if meta_desc:
-                summary = meta_desc.get('content', '').strip()
-            
-            if not summary:
-                # Fallback to first decent paragraph
-                paragraphs = soup.find_all('p')
-                for p in paragraphs:
-                    text = p.get_text(strip=True)
-                    if len(text) > 100:
-                        summary = text
-                        break
-                        
-            # Simplistic Date Extraction (Meta tags first)
-            published = datetime.now() # Default
-            date_meta = soup.find('meta', attrs={'property': 'article:published_time'}) or \
-                        soup.find('meta', attrs={'name': 'date'})
-            if date_meta:
-                try:
-                    date_str = date_meta.get('content', '')
-                    # Attempt parse (very basic)
-                    if date_str:
-                         # Use dateutil if available, otherwise ignore complex parsing for this MVP
-                         from dateutil import parser
-                         published = parser.parse(date_str)
-                except Exception:
-                    pass
-
-            return {
-                'title': title,
-                'link': url,
-                'summary': summary,
-                'published': published.isoformat(),
-                'source': self._get_domain(url),
-                'category': 'scraped_web'
-            }
+            response = self.fetch(url)
+            if response is None:
+                return None
+
+            # Keep the requested URL as the link, as before
+            return parse_article_page(response.content, response.encoding, url)
 
         except Exception as e:
             logger.error(f"Failed to scrape {url}: {e}")
             return None
 
     def _get_domain(self, url: str) -> str:
-        from urllib.parse import urlparse
-        try:
-            return urlparse(url).netloc
-        except:
-            return "Unknown"
+        return _get_domain(url)
 
 if __name__ == "__main__":
     # Test
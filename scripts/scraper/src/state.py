@@ -0,0 +1,67 @@
+"""
+State Store Module
+
+Small JSON files that let the scraper remember things between runs
+(poll schedules, host health, caches). Everything lives under
+scripts/scraper/data/state/ so the nightly job can cache the directory.
+
+The CI cache can be evicted, so nothing here may be the only copy of
+published history. Losing the directory costs one slower run: the
+scheduler does a full sweep, host health starts over, news deltas
+restart from the committed public/news version and the trend cubes are
+read from the committed src/data/trendCubes.json.
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# scripts/scraper/src/state.py -> scripts/scraper/data/state
+STATE_DIR = Path(__file__).resolve().parents[1] / 'data' / 'state'
+
+
+def use_state_dir(path: Path) -> None:
+    """Keep this process's state somewhere else (e.g. a scratch daemon run)."""
+    global STATE_DIR
+    STATE_DIR = Path(path)
+
+
+def state_path(name: str) -> Path:
+    """Resolve a state file name to its full path."""
+    return STATE_DIR / name
+
+
+def load_state(name: str, default: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Load a JSON state file.
+
+    Missing or corrupt files fall back to `default` so a bad state file
+    can never stop a run.
+    """
+    path = state_path(name)
+    if not path.exists():
+        return dict(default or {})
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable state file {path}: {e}")
+        return dict(default or {})
+
+
+def save_state(name: str, data: Dict[str, Any]) -> Path:
+    """Atomically write a JSON state file (write to temp, then rename)."""
+    path = state_path(name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+    return path
@@ -0,0 +1,249 @@
+"""
+Extractive Summarizer Module
+
+Local, offline alternative to the Gemini summary: picks the one or two
+sentences of each article that best represent it, so the dashboard gets
+whole-sentence summaries instead of text cut off at 200 characters, and
+curation does not need an LLM call per article to get them.
+
+Articles are summarized in batches with NumPy. Every sentence (and every
+title) becomes a sparse TF-IDF vector, held as (row, term, weight)
+triples, and each sentence is scored on:
+
+  * centrality: cosine similarity to its article's centroid,
+  * title similarity: cosine similarity to the article title,
+  * domain keywords: weighted hits of the caller's keyword lists, and
+  * position: a small bonus for lead sentences.
+
+The similarities are computed with unique/bincount over the triples, so
+the cost is linear in the batch's token count and no dense term matrix is
+built. Texts that already fit (at most `max_sentences` sentences within
+`max_chars`) are returned as they are.
+
+Usage:
+    summarizer = ExtractiveSummarizer(keywords={'grain grading': 3, 'wheat': 1})
+    summaries = summarizer.summarize_articles(articles)
+"""
+
+import html
+import re
+from itertools import chain
+from typing import List, Dict, Any, Optional
+
+from src.lazy import lazy_import
+
+np = lazy_import('numpy')
+
+# Paragraph breaks in feed HTML ("</p><p>", "<br>") always end a sentence
+BLOCK_TAG_RE = re.compile(r'</?(?:p|div|br|li|ul|ol|h[1-6]|blockquote|tr)\b[^>]*>', re.IGNORECASE)
+TAG_RE = re.compile(r'<[^>]+>')
+
+SENTENCE_END_RE = re.compile(r'(?<=[.!?])["”’)\]]*\s+(?=["“‘(\[]?[A-Z0-9])')
+
+# A period after these does not end a sentence ("Dr. Smith", "U.S. wheat")
+ABBREVIATIONS = {
+    'mr', 'mrs', 'ms', 'dr', 'prof', 'st', 'mt', 'inc', 'corp', 'co', 'ltd', 'no', 'vs', 'approx',
+    'e.g', 'i.e', 'u.s', 'u.k', 'u.n', 'jan', 'feb', 'mar', 'apr', 'jun', 'jul', 'aug', 'sep',
+    'sept', 'oct', 'nov', 'dec',
+}
+
+# Feed furniture that is never a summary
+BOILERPLATE_SENTENCE_RE = re.compile(
+    r'^(?:the post .* appeared first on|read more|continue reading|click here|subscribe|'
+    r'this article (?:was|first) (?:originally )?(?:published|appeared))',
+    re.IGNORECASE,
+)
+
+TOKEN_RE = re.compile(r"[a-z0-9](?:[a-z0-9'-]*[a-z0-9])?")
+
+STOPWORDS = [
+    'a', 'about', 'after', 'all', 'also', 'an', 'and', 'any', 'are', 'as', 'at', 'be', 'been',
+    'but', 'by', 'can', 'could', 'did', 'do', 'does', 'for', 'from', 'had', 'has', 'have', 'he',
+    'her', 'his', 'how', 'i', 'if', 'in', 'into', 'is', 'it', "it's", 'its', 'more', 'most', 'new',
+    'not', 'of', 'on', 'one', 'or', 'other', 'our', 'over', 'said', 'says', 'she', 'so', 'some',
+    'such', 'than', 'that', 'the', 'their', 'them', 'there', 'these', 'they', 'this', 'those',
+    'to', 'up', 'was', 'we', 'were', 'what', 'when', 'which', 'while', 'who', 'will', 'with',
+    'would', 'you', 'your',
+]
+
+# Score weights (centrality is in 0..1 and carries weight 1)
+TITLE_WEIGHT = 0.5
+KEYWORD_WEIGHT = 0.5
+LEAD_WEIGHT = 0.3
+SHORT_PENALTY = 1.0   # Fragments ("Photo: supplied.") rarely summarize anything
+LONG_PENALTY = 0.25   # Sentences over max_chars have to be cut
+
+MIN_SENTENCE_CHARS = 30
+
+
+def _ends_with_abbreviation(sentence: str) -> bool:
+    last = sentence.rsplit(' ', 1)[-1].rstrip('.').lower()
+    return last in ABBREVIATIONS or (len(last) == 1 and last.isalpha())
+
+
+def split_sentences(text: str) -> List[str]:
+    """Plain-text sentences of an HTML or text snippet, feed boilerplate removed."""
+    text = html.unescape(TAG_RE.sub(' ', BLOCK_TAG_RE.sub('\n', text)))
+    sentences: List[str] = []
+    for paragraph in text.split('\n'):
+        paragraph = ' '.join(paragraph.split())
+        if not paragraph:
+            continue
+        start = len(sentences)
+        for part in SENTENCE_END_RE.split(paragraph):
+            if len(sentences) > start and _ends_with_abbreviation(sentences[-1]):
+                sentences[-1] += ' ' + part
+            else:
+                sentences.append(part)
+    return [s for s in sentences if not BOILERPLATE_SENTENCE_RE.match(s)]
+
+
+def _truncate(text: str, max_chars: int) -> str:
+    """Cut at a word boundary, with an ellipsis."""
+    if len(text) <= max_chars:
+        return text
+    cut = text[:max_chars - 1].rsplit(' ', 1)[0].rstrip(' ,;:-')
+    return cut + '…'
+
+
+class ExtractiveSummarizer:
+    """Batched sentence ranking; see the module docstring for the score."""
+
+    def __init__(
+        self,
+        keywords: Optional[Dict[str, float]] = None,
+        max_sentences: int = 2,
+        max_chars: int = 200,
+        batch_size: int = 512,
+    ):
+        self.keywords = {k.lower(): w for k, w in (keywords or {}).items()}
+        self.max_sentences = max_sentences
+        self.max_chars = max_chars
+        self.batch_size = batch_size
+
+        # One alternation, longest phrases first so "grain quality" beats "grain"
+        phrases = sorted(self.keywords, key=len, reverse=True)
+        self._keyword_re = re.compile(
+            r'\b(?:' + '|'.join(re.escape(p) for p in phrases) + r')\b'
+        ) if phrases else None
+
+    def summarize(self, texts: List[str], titles: Optional[List[str]] = None) -> List[str]:
+        """One summary per text (empty string for empty texts)."""
+        titles = titles or [''] * len(texts)
+        summaries: List[str] = []
+        for start in range(0, len(texts), self.batch_size):
+            end = start + self.batch_size
+            summaries.extend(self._summarize_batch(texts[start:end], titles[start:end]))
+        return summaries
+
+    def summarize_articles(self, articles: List[Dict[str, Any]]) -> List[str]:
+        """Summaries of scout-format articles (their `summary` text, ranked against `title`)."""
+        return self.summarize(
+            [a.get('summary') or '' for a in articles],
+            [TAG_RE.sub(' ', a.get('title') or '') for a in articles],
+        )
+
+    def _summarize_batch(self, texts: List[str], titles: List[str]) -> List[str]:
+        docs = [split_sentences(text) for text in texts]
+        summaries = [''] * len(docs)
+
+        # Rows: the sentences of articles that need ranking, then every title
+        rows: List[str] = []
+        article_of: List[int] = []
+        position: List[int] = []
+        for a, sentences in enumerate(docs):
+            if len(sentences) <= self.max_sentences and len(' '.join(sentences)) <= self.max_chars:
+                summaries[a] = ' '.join(sentences)
+                continue
+            rows.extend(sentences)
+            article_of.extend([a] * len(sentences))
+            position.extend(range(len(sentences)))
+        if not rows:
+            return summaries
+
+        score = self._score(rows, [t.lower() for t in titles],
+                            np.array(article_of), np.array(position))
+
+        # Best first within each article
+        article_arr = np.array(article_of)
+        order = np.lexsort((-score, article_arr))
+        bounds = np.flatnonzero(np.diff(article_arr[order])) + 1
+        for group in np.split(order, bounds):
+            summaries[article_of[group[0]]] = self._compose([int(i) for i in group], rows, position)
+        return summaries
+
+    def _score(self, rows: List[str], titles: List[str], article_of: 'np.ndarray',
+               position: 'np.ndarray') -> 'np.ndarray':
+        n = len(rows)
+        lowered = [row.lower() for row in rows]
+        all_rows = lowered + titles
+        total = len(all_rows)
+
+        # Tokens -> (row, term) pairs, stopwords dropped
+        per_row = [TOKEN_RE.findall(row) for row in all_rows]
+        row_of = np.repeat(np.arange(total), [len(tokens) for tokens in per_row])
+        tokens = np.array(list(chain.from_iterable(per_row)) or [''])
+        vocab, term = np.unique(tokens, return_inverse=True)
+        keep = ~np.isin(vocab, STOPWORDS)[term]
+        if not len(row_of) or not keep.any():
+            centrality = title_sim = np.zeros(n)
+        else:
+            row_of, term = row_of[keep], term[keep]
+            size = len(vocab)
+
+            # TF-IDF, L2-normalised per row
+            pairs, tf = np.unique(row_of * size + term, return_counts=True)
+            r, t = np.divmod(pairs, size)
+            idf = np.log((1 + total) / (1 + np.bincount(t, minlength=size))) + 1
+            w = (1 + np.log(tf)) * idf[t]
+            w /= np.sqrt(np.bincount(r, w * w, minlength=total))[r]
+
+            sentence = r < n
+            sr, st, sw = r[sentence], t[sentence], w[sentence]
+
+            # Centrality: cosine to the article centroid (sum of its sentence vectors)
+            keys = article_of[sr] * size + st
+            centroid_keys, slot = np.unique(keys, return_inverse=True)
+            centroid = np.bincount(slot, sw)
+            owner = centroid_keys // size
+            centroid /= np.sqrt(np.bincount(owner, centroid * centroid))[owner]
+            centrality = np.bincount(sr, sw * centroid[slot], minlength=n)
+
+            # Title similarity: the title's weight for each sentence term
+            title_keys = (r[~sentence] - n) * size + t[~sentence]
+            title_w = w[~sentence]
+            if len(title_keys):
+                idx = np.minimum(np.searchsorted(title_keys, keys), len(title_keys) - 1)
+                matched = np.where(title_keys[idx] == keys, title_w[idx], 0.0)
+                title_sim = np.bincount(sr, sw * matched, minlength=n)
+            else:
+                title_sim = np.zeros(n)
+
+        if self._keyword_re:
+            hits = np.array([sum(self.keywords[k] for k in self._keyword_re.findall(row)) for row in lowered])
+            keyword = 1 - np.exp(-hits / 3)
+        else:
+            keyword = np.zeros(n)
+
+        lengths = np.array([len(row) for row in rows])
+        return (
+            centrality
+            + TITLE_WEIGHT * title_sim
+            + KEYWORD_WEIGHT * keyword
+            + LEAD_WEIGHT / (1 + position)
+            - SHORT_PENALTY * (lengths < MIN_SENTENCE_CHARS)
+            - LONG_PENALTY * (lengths > self.max_chars)
+        )
+
+    def _compose(self, ranked: List[int], rows: List[str], position: List[int]) -> str:
+        """Best sentence, plus the next best that still fit, in reading order."""
+        chosen = [ranked[0]]
+        length = len(rows[ranked[0]])
+        for i in ranked[1:]:
+            if len(chosen) >= self.max_sentences:
+                break
+            if length + 1 + len(rows[i]) <= self.max_chars:
+                chosen.append(i)
+                length += 1 + len(rows[i])
+        chosen.sort(key=lambda i: position[i])
+        return _truncate(' '.join(rows[i] for i in chosen), self.max_chars)
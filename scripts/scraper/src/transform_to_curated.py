@@ -7,40 +7,19 @@ It tags articles with matched company/product names and sorts by relevance.
 
 import json
 import re
+import sys
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
+from typing import Any, Dict, Optional
 
-# ============================================================================
-# COMPANY & PRODUCT LOOKUP
-# Derived from the tracked companies in src/data/registries/companies.ts
-# and products in src/data/grainTechEntities.ts
-# ============================================================================
-
-COMPANY_KEYWORDS = {
-    "cgrain": {"names": ["Cgrain", "Cgrain Value", "Cgrain Value Pro"], "id": "cgrain"},
-    "foss": {"names": ["FOSS", "EyeFoss", "FOSS Analytics"], "id": "foss"},
-    "grainsense": {"names": ["GrainSense"], "id": "grainsense"},
-    "videometer": {"names": ["Videometer", "SeedLab", "SeedSorter"], "id": "videometer"},
-    "zeutec": {"names": ["Zeutec", "SpectraAlyzer", "Grain Vision AI"], "id": "zeutec"},
-    "zoomagri": {"names": ["ZoomAgri", "ZoomBarley"], "id": "zoomagri"},
-    "qualysense": {"names": ["QualySense", "QSorter"], "id": "qualysense"},
-    "gomicro": {"names": ["GoMicro"], "id": "gomicro"},
-    "agsure": {"names": ["AgSure", "Aqsure"], "id": "agsure"},
-    "nebulaa": {"names": ["Nebulaa", "MATT Grain Analyser", "MATT Automatic"], "id": "nebulaa"},
-    "supergeo": {"names": ["SuperGeo", "SuperGeo AI"], "id": "supergeo"},
-    "inarix": {"names": ["Inarix", "PocketLab"], "id": "inarix"},
-    "vibe": {"names": ["Vibe Imaging", "Vibe Imaging Analytics", "QM3i"], "id": "vibe"},
-    "easyodm": {"names": ["EasyODM"], "id": "easyodm"},
-    "cropify": {"names": ["Cropify", "Opal"], "id": "cropify"},
-    "deimos": {"names": ["Deimos Laboratory", "Deimos"], "id": "deimos"},
-    "ground_truth": {"names": ["Ground Truth Ag", "Ground Truth"], "id": "ground_truth"},
-    "upjao": {"names": ["Upjao"], "id": "upjao"},
-    "grainkart": {"names": ["Grainkart", "GrainScope AI", "GrainScope"], "id": "grainkart"},
-    "keyetech": {"names": ["Keyetech"], "id": "keyetech"},
-    "grain_discovery": {"names": ["Grain Discovery"], "id": "grain_discovery"},
-    "platypus": {"names": ["Platypus Vision", "Indyn"], "id": "platypus_vision"},
-    "hongsheng": {"names": ["Shandong Hongsheng", "Hongsheng"], "id": "hongsheng"},
-}
+if __package__ in (None, ''):
+    # Run as a script (python src/transform_to_curated.py): make `src` importable
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.entities import get_matcher
+from src.news_deltas import item_id, publish_versions
+from src.summarizer import ExtractiveSummarizer
 
 # Technology terms that indicate grain-tech relevance
 # Negative keywords — articles about these topics are not relevant to grain-tech
@@ -85,16 +64,8 @@ GRAIN_INDUSTRY_KEYWORDS = [
 
 
 def find_company_tags(text: str) -> list:
-    """Find which tracked companies are mentioned in the text."""
-    tags = []
-    text_lower = text.lower()
-    for key, info in COMPANY_KEYWORDS.items():
-        for name in info["names"]:
-            if name.lower() in text_lower:
-                if info["id"] not in tags:
-                    tags.append(info["id"])
-                break
-    return tags
+    """Find which tracked companies (or their products) are mentioned in the text."""
+    return get_matcher().company_ids(text)
 
 
 def clean_html(text: str) -> str:
@@ -106,15 +77,14 @@ def calculate_relevance(article: dict) -> int:
     """Calculate a relevance score for sorting. Higher = more relevant."""
     score = 0
     raw_text = f"{article.get('title', '')} {article.get('summary', '')}"
-    text = clean_html(raw_text).lower()
-    source = article.get('source', '').lower()
+    clean_text = clean_html(raw_text)
+    text = clean_text.lower()
+    source_name = article.get('source', '')
+    source = source_name.lower()
+    matcher = get_matcher()
 
-    # Company name match: +50
-    for key, info in COMPANY_KEYWORDS.items():
-        for name in info["names"]:
-            if name.lower() in text:
-                score += 50
-                break
+    # Company name match: +50 per company
+    score += 50 * len(matcher.company_ids(clean_text))
 
     # Technology keyword match: +20 each (cap at 60)
     tech_score = 0
@@ -147,11 +117,7 @@ def calculate_relevance(article: dict) -> int:
             break
 
     # Source bonus: direct company feeds
-    for key, info in COMPANY_KEYWORDS.items():
-        for name in info["names"]:
-            if name.lower() in source:
-                score += 30
-                break
+    score += 30 * len(matcher.company_ids(source_name))
 
     # Negative keywords: penalize clearly irrelevant content
     for neg in NEGATIVE_KEYWORDS:
@@ -172,28 +138,28 @@ def clean_summary(summary: str) -> str:
     return clean.strip()
 
 
-def transform():
-    # Paths - script is at scripts/scraper/src/transform_to_curated.py
-    # Project root is at ../../.. from this file
-    script_dir = Path(__file__).resolve().parent  # src/
-    project_root = script_dir.parent.parent.parent  # graintech-dashboard/
-    raw_intel_path = project_root / 'src' / 'data' / 'raw_intel.json'
-    curated_path = project_root / 'src' / 'data' / 'curatedNews.json'
-    
-    print(f"Reading from: {raw_intel_path}")
-    print(f"Writing to: {curated_path}")
-    
-    if not raw_intel_path.exists():
-        print("No raw_intel.json found, skipping transform")
-        return
-        
-    with open(raw_intel_path, 'r', encoding='utf-8') as f:
-        raw_data = json.load(f)
-    
-    articles = raw_data.get('articles', [])
-    print(f"Total raw articles: {len(articles)}")
-    
-    # Deduplicate by normalized title
+# Project root: script is at scripts/scraper/src/transform_to_curated.py
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+RAW_INTEL_PATH = PROJECT_ROOT / 'src' / 'data' / 'raw_intel.json'
+CURATED_PATH = PROJECT_ROOT / 'src' / 'data' / 'curatedNews.json'
+
+# Number of articles published to the dashboard
+MAX_CURATED = 25
+
+# Longest summary shown on a dashboard card
+SUMMARY_CHARS = 200
+
+
+@lru_cache(maxsize=1)
+def get_summarizer() -> ExtractiveSummarizer:
+    """Extractive summarizer biased towards grain-tech and grain industry terms."""
+    keywords = {k: 1 for k in GRAIN_INDUSTRY_KEYWORDS}
+    keywords.update({k: 3 for k in TECH_KEYWORDS})
+    return ExtractiveSummarizer(keywords, max_chars=SUMMARY_CHARS)
+
+
+def dedupe_articles(articles: list) -> list:
+    """Deduplicate by normalized title, keeping the first occurrence."""
     seen_titles = set()
     unique_articles = []
     for article in articles:
@@ -201,10 +167,11 @@ def transform():
         if title_norm and title_norm not in seen_titles:
             seen_titles.add(title_norm)
             unique_articles.append(article)
-    print(f"After dedup: {len(unique_articles)} unique articles (removed {len(articles) - len(unique_articles)} duplicates)")
-    articles = unique_articles
-    
-    # Tag and score each article
+    return unique_articles
+
+
+def score_articles(articles: list) -> list:
+    """Tag, score, drop zero-relevance articles and sort best-first."""
     scored = []
     for article in articles:
         text = clean_html(f"{article.get('title', '')} {article.get('summary', '')}")
@@ -219,44 +186,95 @@ def transform():
     
     # Filter out zero-relevance articles (clearly irrelevant)
     scored = [a for a in scored if a.get('relevance', 0) > 0]
-    print(f"After relevance filter: {len(scored)} articles (removed {len(articles) - len(scored)} with score 0)")
     
     # Sort by relevance (descending), then by date (newest first)
     scored.sort(key=lambda x: (
         x.get('relevance', 0),
         x.get('published', ''),
     ), reverse=True)
+    return scored
+
+
+def build_curated(scored: list, limit: int = MAX_CURATED) -> list:
+    """Convert scored articles to the curatedNews.json item format."""
+    top = scored[:limit]
+    # Prefer the curator's summary when the curate stage ran; extract the rest in one batch
+    pending = [a for a in top if not a.get('curated_summary')]
+    extracted = dict(zip(map(id, pending), get_summarizer().summarize_articles(pending)))
     
-    # Log top articles for debugging
-    print(f"\nTop 10 by relevance:")
-    for i, a in enumerate(scored[:10]):
-        print(f"  {i+1}. [{a['relevance']}] {clean_html(a.get('title', ''))[:60]}... tags={a['company_tags']}")
-    
-    # Transform to curatedNews format (limit to 25)
     curated = []
-    for i, article in enumerate(scored[:25]):
-        summary = article.get('summary', '')
+    for article in top:
+        summary = article.get('curated_summary') or extracted[id(article)]
         summary = clean_summary(summary)
         
         curated.append({
-            "id": str(i + 1),
+            # Content-derived, so an item keeps its id when the ranking changes
+            "id": item_id(article.get('link', ''), clean_html(article.get('title', ''))),
             "title": clean_html(article.get('title', 'Untitled')),
             "source": article.get('source', 'Unknown'),
             "date": article.get('published', datetime.now().isoformat())[:10],  # YYYY-MM-DD
-            "summary": summary[:200],
+            "summary": summary[:SUMMARY_CHARS],
             "url": article.get('link', ''),
             "category": article.get('category', 'industry'),
             "companyTags": article.get('company_tags', []),
         })
-    
-    # Write curated news
+    return curated
+
+
+def write_curated(curated: list, curated_path: Path = CURATED_PATH) -> None:
+    """Write the curated news file and print tagging stats."""
     with open(curated_path, 'w', encoding='utf-8') as f:
         json.dump(curated, f, indent=2, ensure_ascii=False)
     
     # Stats
     tagged = sum(1 for a in curated if a.get('companyTags'))
-    print(f"\nTransformed {len(curated)} articles to curatedNews.json")
+    print(f"\nTransformed {len(curated)} articles to {curated_path.name}")
     print(f"  Company-tagged articles: {tagged}/{len(curated)}")
 
+
+def transform_articles(articles: list, curated_path: Path = CURATED_PATH) -> list:
+    """Dedupe, score and publish already-loaded raw articles."""
+    print(f"Total raw articles: {len(articles)}")
+    
+    unique_articles = dedupe_articles(articles)
+    print(f"After dedup: {len(unique_articles)} unique articles (removed {len(articles) - len(unique_articles)} duplicates)")
+    articles = unique_articles
+    
+    scored = score_articles(articles)
+    print(f"After relevance filter: {len(scored)} articles (removed {len(articles) - len(scored)} with score 0)")
+    
+    # Log top articles for debugging
+    print("\nTop 10 by relevance:")
+    for i, a in enumerate(scored[:10]):
+        print(f"  {i+1}. [{a['relevance']}] {clean_html(a.get('title', ''))[:60]}... tags={a['company_tags']}")
+    
+    curated = build_curated(scored)
+    write_curated(curated, curated_path)
+    return curated
+
+
+def transform(config: Optional[Dict[str, Any]] = None):
+    """Rebuild curatedNews.json from raw_intel.json; `config` is sources.yaml (for `news_deltas`)."""
+    raw_intel_path = RAW_INTEL_PATH
+    curated_path = CURATED_PATH
+    
+    print(f"Reading from: {raw_intel_path}")
+    print(f"Writing to: {curated_path}")
+    
+    if not raw_intel_path.exists():
+        print("No raw_intel.json found, skipping transform")
+        return
+        
+    with open(raw_intel_path, 'r', encoding='utf-8') as f:
+        raw_data = json.load(f)
+    
+    curated = transform_articles(raw_data.get('articles', []), curated_path)
+
+    deltas = (config or {}).get('news_deltas', {}) or {}
+    if deltas.get('enabled', True):
+        publish_versions(curated, keep_versions=deltas.get('keep_versions', 10))
+
 if __name__ == '__main__':
-    transform()
+    from src.agents.scout import load_sources_config
+
+    transform(load_sources_config())
@@ -0,0 +1,267 @@
+"""
+Trend Aggregates - Rolling weekly mention counts from the intel history.
+
+Keeps time-series cubes of article mentions per week, broken down by
+tracked company, category, source and technology/industry term, over the
+scored articles (relevance > 0) the dashboard ranks. Each run only adds
+articles it has not counted before (keyed by link identity), so the cubes
+grow by the nightly delta instead of being recomputed from the archive. Weeks older than the retention window are pruned.
+
+The cubes are committed next to the export, in src/data/trendCubes.json,
+so their history does not depend on the CI state cache and a local
+backfill reaches the nightly run once it is pushed. That file also keeps
+the keys of recently counted articles (`seen_weeks`), enough to avoid
+counting a feed item twice after the cache is lost; the full key map is
+cached in data/state/trend_aggregates.json. With no committed cubes the
+store starts from an older local state file, or else from the committed
+export (top keys only).
+
+The dashboard reads a columnar export (src/data/trendAggregates.json):
+one shared list of week start dates plus, per dimension, a list of keys
+and one count array per key aligned to those weeks.
+
+Usage:
+    python -m src.trend_aggregates            # add raw_intel.json, export
+"""
+
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime, timedelta, date
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+from src.state import load_state, save_state
+from src.sources.urls import link_identity
+from src.transform_to_curated import (
+    PROJECT_ROOT,
+    RAW_INTEL_PATH,
+    TECH_KEYWORDS,
+    GRAIN_INDUSTRY_KEYWORDS,
+    clean_html,
+    find_company_tags,
+    score_articles,
+)
+
+logger = logging.getLogger(__name__)
+
+STATE_FILE = 'trend_aggregates.json'
+TRENDS_PATH = PROJECT_ROOT / 'src' / 'data' / 'trendAggregates.json'
+CUBES_FILENAME = 'trendCubes.json'
+
+DIMENSIONS = ('company', 'category', 'source', 'term')
+
+TREND_TERMS = TECH_KEYWORDS + GRAIN_INDUSTRY_KEYWORDS
+
+
+def week_start(published: Optional[str], fallback: date) -> str:
+    """Monday (ISO date) of the week an article was published in."""
+    try:
+        day = datetime.fromisoformat(published).date() if published else fallback
+    except ValueError:
+        day = fallback
+    return (day - timedelta(days=day.weekday())).isoformat()
+
+
+def _article_key(article: Dict[str, Any]) -> str:
+    raw = link_identity(article.get('link', ''), clean_html(article.get('title', '')))
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:16]
+
+
+def article_dimensions(article: Dict[str, Any]) -> Dict[str, List[str]]:
+    """Keys an article counts towards in each dimension."""
+    text = clean_html(f"{article.get('title', '')} {article.get('summary', '')}")
+    text_lower = text.lower()
+    companies = article.get('company_tags')
+    if companies is None:
+        companies = find_company_tags(text)
+    return {
+        'company': list(companies),
+        'category': [article.get('category') or 'uncategorized'],
+        'source': [article.get('source') or 'Unknown'],
+        'term': [term.lower() for term in TREND_TERMS if term.lower() in text_lower],
+    }
+
+
+def _read_json(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def _write_json(path: Path, data: Dict[str, Any]) -> None:
+    tmp_path = path.with_suffix('.json.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, path)
+
+
+def cubes_from_export(export: Dict[str, Any]) -> Dict[str, Any]:
+    """Rebuild totals and cubes from a columnar export (its top keys and weeks only)."""
+    weeks = export.get('weeks', [])
+
+    def series(counts: List[int]) -> Dict[str, int]:
+        return {w: c for w, c in zip(weeks, counts) if c}
+
+    return {
+        'totals': series(export.get('totals', [])),
+        'cubes': {
+            dimension: {name: series(counts) for name, counts in
+                        zip(export.get(dimension, {}).get('keys', []), export.get(dimension, {}).get('counts', []))}
+            for dimension in DIMENSIONS
+        },
+    }
+
+
+class TrendAggregator:
+    """Incrementally maintained weekly cubes, one per dimension."""
+
+    def __init__(self, retention_weeks: int = 156, seen_weeks: int = 4, today: Optional[date] = None,
+                 export_path: Path = TRENDS_PATH):
+        self.retention_weeks = retention_weeks
+        self.seen_weeks = seen_weeks
+        self.today = today or date.today()
+        self.cubes_path = export_path.with_name(CUBES_FILENAME)
+
+        local = load_state(STATE_FILE, {'seen': {}})
+        store = _read_json(self.cubes_path)
+        if store is None:
+            if local.get('cubes'):
+                # State written before the cubes were committed
+                store = {'totals': local.get('totals', {}), 'cubes': local['cubes']}
+            else:
+                export = _read_json(export_path)
+                store = cubes_from_export(export) if export else {}
+                if export:
+                    logger.warning(f"⚠️ No {CUBES_FILENAME}: rebuilt the trend cubes from {export_path.name} (top keys only)")
+
+        self.state = {
+            'seen': {**store.get('seen', {}), **local.get('seen', {})},
+            'totals': store.get('totals', {}),
+            'cubes': store.get('cubes', {}),
+        }
+        for dimension in DIMENSIONS:
+            self.state['cubes'].setdefault(dimension, {})
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], export_path: Path = TRENDS_PATH) -> 'TrendAggregator':
+        """Build an aggregator from the `trends` section of sources.yaml."""
+        trends_config = config.get('trends', {}) or {}
+        return cls(
+            retention_weeks=trends_config.get('retention_weeks', 156),
+            seen_weeks=trends_config.get('seen_weeks', 4),
+            export_path=export_path,
+        )
+
+    def add(self, articles: List[Dict[str, Any]]) -> int:
+        """Count articles not seen before. Returns how many were added."""
+        seen = self.state['seen']
+        cubes = self.state['cubes']
+        totals = self.state['totals']
+        added = 0
+
+        for article in articles:
+            key = _article_key(article)
+            if key in seen:
+                continue
+            week = week_start(article.get('published'), self.today)
+            seen[key] = week
+            totals[week] = totals.get(week, 0) + 1
+
+            for dimension, keys in article_dimensions(article).items():
+                for name in keys:
+                    series = cubes[dimension].setdefault(name, {})
+                    series[week] = series.get(week, 0) + 1
+            added += 1
+
+        logger.info(f"📈 Trend aggregates: +{added} new articles ({len(articles) - added} already counted)")
+        return added
+
+    def prune(self) -> None:
+        """Drop weeks (and seen keys) older than the retention window."""
+        cutoff = week_start(None, self.today - timedelta(weeks=self.retention_weeks))
+
+        self.state['seen'] = {k: w for k, w in self.state['seen'].items() if w >= cutoff}
+        self.state['totals'] = {w: c for w, c in self.state['totals'].items() if w >= cutoff}
+        for dimension, cube in self.state['cubes'].items():
+            for name in list(cube):
+                cube[name] = {w: c for w, c in cube[name].items() if w >= cutoff}
+                if not cube[name]:
+                    del cube[name]
+
+    def save(self) -> None:
+        """Write the committed cube store (with recent keys) and cache the full key map."""
+        self.prune()
+        save_state(STATE_FILE, {'seen': self.state['seen']})
+
+        recent = week_start(None, self.today - timedelta(weeks=self.seen_weeks))
+        _write_json(self.cubes_path, {
+            'totals': self.state['totals'],
+            'cubes': self.state['cubes'],
+            'seen': {k: w for k, w in self.state['seen'].items() if w >= recent},
+        })
+
+    def export(self, weeks: int = 52, top_n: int = 30) -> Dict[str, Any]:
+        """
+        Columnar view of the last `weeks` weeks.
+
+        Every dimension keeps at most `top_n` keys, ranked by mentions in
+        the window; count arrays are aligned with `weeks`.
+        """
+        last = date.fromisoformat(week_start(None, self.today))
+        week_list = [(last - timedelta(weeks=i)).isoformat() for i in range(weeks - 1, -1, -1)]
+
+        def column(series: Dict[str, int]) -> List[int]:
+            return [series.get(w, 0) for w in week_list]
+
+        export: Dict[str, Any] = {
+            'updated': self.today.isoformat(),
+            'weeks': week_list,
+            'totals': column(self.state['totals']),
+        }
+        for dimension in DIMENSIONS:
+            columns = {name: column(series) for name, series in self.state['cubes'][dimension].items()}
+            ranked = sorted((name for name in columns if any(columns[name])),
+                            key=lambda name: (-sum(columns[name]), name))[:top_n]
+            export[dimension] = {
+                'keys': ranked,
+                'counts': [columns[name] for name in ranked],
+            }
+        return export
+
+
+def write_trends(export: Dict[str, Any], path: Path = TRENDS_PATH) -> None:
+    """Write the export compactly (atomic replace)."""
+    _write_json(path, export)
+    logger.info(f"Trend aggregates: {len(export['weeks'])} weeks -> {path}")
+
+
+def update_trends(articles: List[Dict[str, Any]], config: Optional[Dict[str, Any]] = None,
+                  path: Path = TRENDS_PATH) -> Dict[str, Any]:
+    """Add a batch of articles to the cubes, persist them and rewrite the export."""
+    trends_config = (config or {}).get('trends', {}) or {}
+    aggregator = TrendAggregator.from_config(config or {}, export_path=path)
+    aggregator.add(articles)
+    aggregator.save()
+
+    export = aggregator.export(
+        weeks=trends_config.get('export_weeks', 52),
+        top_n=trends_config.get('top_n', 30),
+    )
+    write_trends(export, path)
+    return export
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    with open(RAW_INTEL_PATH, 'r', encoding='utf-8') as f:
+        articles = json.load(f).get('articles', [])
+    update_trends(score_articles(articles))
+
+
+if __name__ == '__main__':
+    main()
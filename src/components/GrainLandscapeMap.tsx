@@ -91,7 +91,7 @@ function getHealthDot(health: CompanyMonitorData['health'], companyName: string)
       : 'Offline';
   return (
     <span
-      title={`${label} (${h.responseMs}ms)`}
+      title={`${label} (${h.responseMs}ms${h.p95Ms ? `, p95 ${h.p95Ms}ms` : ''})`}
       className={`inline-block w-2 h-2 rounded-full ${color} shrink-0`}
     />
   );
@@ -289,7 +289,8 @@ export const GrainLandscapeMap = function GrainLandscapeMap({
       results = results.filter(
         (solution) =>
           solution.company.toLowerCase().includes(term) ||
-          solution.productName.toLowerCase().includes(term)
+          solution.productName.toLowerCase().includes(term) ||
+          (solution.aliases || []).some((alias) => alias.toLowerCase().includes(term))
       );
     }
 
@@ -10,6 +10,8 @@ import {
   Trash2,
 } from 'lucide-react';
 import curatedNews from '../data/curatedNews.json';
+import curatedNewsVersion from '../data/curatedNewsVersion.json';
+import { syncNews } from '../utils/newsSync';
 import { useSavedArticles } from '../hooks/useSavedArticles';
 
 interface NewsItem {
@@ -56,6 +58,27 @@ export const NewsFeed = memo(function NewsFeed() {
     return () => clearTimeout(timer);
   }, []);
 
+  // Catch up with anything published since this build: usually just a
+  // revalidated manifest, otherwise a small delta or the full list
+  useEffect(() => {
+    if (!curatedNewsVersion.version) return;
+    let cancelled = false;
+
+    syncNews({ ...curatedNewsVersion, items: curatedNews as NewsItem[] })
+      .then(({ snapshot, transfer }) => {
+        if (cancelled || transfer === 'none') return;
+        setNews(snapshot.items);
+        setLastUpdated(new Date().toISOString());
+      })
+      .catch(() => {
+        // Keep the bundled list
+      });
+
+    return () => {
+      cancelled = true;
+    };
+  }, []);
+
   // Extract unique categories
   const categories = useMemo(() => {
     const cats = new Set<string>();
@@ -49,6 +49,8 @@ export interface GrainSolution {
   id: string;
   company: string;
   productName: string;
+  /** Other names of the company and product (from the entity registry) */
+  aliases?: string[];
   regions: Region[];
   formFactors: FormFactor[];
   sensingTech: SensingTech[];
@@ -1,11 +1,14 @@
 import { Company } from "../../types/grainDataTypes";
+import { entityMatcher } from "../../utils/entityMatcher";
 
-export const companies: Company[] = [
+// Company profiles. Names and aliases are maintained once, in
+// scripts/scraper/config/entities.yaml (same ids); aliases come from its
+// compiled artifact.
+const profiles: Company[] = [
     {
         id: "agsure",
         displayName: "AgSure",
         legalName: "AgSure Innovations Private Limited",
-        aliases: ["Aqsure"],
         country: "India",
         region: "Asia",
         segments: ["grain grading"],
@@ -54,7 +57,6 @@ export const companies: Company[] = [
     {
         id: "platypus_vision",
         displayName: "Platypus Vision",
-        aliases: ["Indyn"],
         country: "Australia",
         region: "Oceania",
         segments: ["grain grading"],
@@ -333,6 +335,11 @@ export const companies: Company[] = [
     }
 ];
 
+export const companies: Company[] = profiles.map((company) => ({
+    ...company,
+    aliases: entityMatcher.get(company.id)?.aliases,
+}));
+
 export const companiesById: Record<string, Company> = companies.reduce((acc, company) => {
     acc[company.id] = company;
     return acc;
@@ -6,6 +6,12 @@ export interface HealthResult {
     status: number | null;
     responseMs: number;
     online: boolean;
+    // Latency history from the scraper's monitor stage
+    p50Ms?: number | null;
+    p95Ms?: number | null;
+    uptime?: number;
+    samples?: number;
+    lastChange?: string | null;
 }
 
 export interface NewsArticle {
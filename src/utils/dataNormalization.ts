@@ -1,6 +1,7 @@
 import { companiesById } from "../data/registries/companies";
 import { products } from "../data/registries/products";
 import { linksById } from "../data/registries/links";
+import { entityMatcher } from "./entityMatcher";
 import type { GrainSolution, MaturityLevel, Region, SensingTech, FormFactor, UseCase, UserSegment } from "../data/grainTechEntities";
 
 
@@ -17,6 +18,7 @@ export const getDenormalizedSolutions = (): GrainSolution[] => {
         .map((product): GrainSolution => {
             const company = companiesById[product.companyId];
             // company is guaranteed to exist due to filter above
+            const productEntity = entityMatcher.get(product.id);
 
             const primaryLink = product.primaryLinkId ? linksById[product.primaryLinkId] :
                 (company.primaryLinkId ? linksById[company.primaryLinkId] : undefined);
@@ -34,6 +36,10 @@ export const getDenormalizedSolutions = (): GrainSolution[] => {
                 id: product.id,
                 company: company.displayName,
                 productName: product.name,
+                aliases: [
+                    ...(company.aliases || []),
+                    ...(productEntity ? [productEntity.name, ...(productEntity.aliases || [])] : []),
+                ],
 
                 // Legacy/Compatibility fields
                 regions: (product.regions || (company.region ? [company.region as Region] : [])) as Region[],
@@ -0,0 +1,42 @@
+import { describe, it, expect } from 'vitest';
+import { entityMatcher, loadEntityMatcher, type EntityMatcherData } from './entityMatcher';
+import entityMatcherData from '../data/entityMatcher.json';
+import { companies, companiesById } from '../data/registries/companies';
+
+const matcher = loadEntityMatcher(entityMatcherData as EntityMatcherData);
+
+describe('loadEntityMatcher', () => {
+    it('should tag the parent company of a matched product', () => {
+        expect(matcher.match('EyeFoss launches').map((e) => e.id)).toEqual(['foss-eyefoss-product']);
+        expect(matcher.companyIds('EyeFoss launches')).toEqual(['foss']);
+    });
+
+    it('should respect word boundaries', () => {
+        expect(matcher.companyIds('fossil fuels')).toEqual([]);
+        expect(matcher.companyIds('FOSS Analytics reports')).toEqual(['foss']);
+    });
+
+    it('should only match case-sensitive aliases in their exact case', () => {
+        expect(matcher.companyIds('the ground truth data')).toEqual([]);
+        expect(matcher.companyIds('Ground Truth Ag and Cropify Opal')).toEqual(['cropify', 'ground_truth']);
+    });
+
+    it('should list monitored companies with their urls', () => {
+        const foss = matcher.companies.find((c) => c.id === 'foss');
+        expect(foss?.url).toBe('https://www.fossanalytics.com');
+    });
+});
+
+describe('entity registry', () => {
+    it('should give every registry company a matching entity', () => {
+        for (const company of companies) {
+            expect(entityMatcher.get(company.id)?.name, company.id).toBe(company.displayName);
+        }
+        const registryIds = new Set(companies.map((c) => c.id));
+        expect(entityMatcher.companies.filter((c) => !registryIds.has(c.id))).toEqual([]);
+    });
+
+    it('should take company aliases from the compiled registry', () => {
+        expect(companiesById['agsure'].aliases).toEqual(['Aqsure']);
+    });
+});
@@ -0,0 +1,83 @@
+/**
+ * Loader for the compiled entity registry (src/data/entityMatcher.json).
+ *
+ * The artifact is built from scripts/scraper/config/entities.yaml by
+ * `python -m src.entities`; its patterns already carry the alias order and
+ * word-boundary rules, so this module only compiles two RegExps once and
+ * maps matches back to entities.
+ *
+ * `entityMatcher` is the shared instance for the dashboard and the API.
+ */
+
+import entityMatcherData from "../data/entityMatcher.json";
+
+export interface Entity {
+  id: string;
+  name: string;
+  type: "company" | "product";
+  company: string;
+  priority: "high" | "medium" | "low";
+  aliases?: string[];
+  url?: string;
+  search_terms?: string;
+}
+
+export interface EntityMatcherData {
+  version: number;
+  source_hash: string;
+  entities: Entity[];
+  lookup: { ci: Record<string, number>; cs: Record<string, number> };
+  patterns: { ci: string; cs: string };
+}
+
+export interface EntityMatcher {
+  entities: Entity[];
+  companies: Entity[];
+  get: (id: string) => Entity | undefined;
+  match: (text: string) => Entity[];
+  companyIds: (text: string) => string[];
+}
+
+export function loadEntityMatcher(data: EntityMatcherData): EntityMatcher {
+  const ci = data.patterns.ci ? new RegExp(data.patterns.ci, "g") : null;
+  const cs = data.patterns.cs ? new RegExp(data.patterns.cs, "g") : null;
+  const indexById = new Map(data.entities.map((entity, i) => [entity.id, i]));
+
+  const matchedIndexes = (text: string): number[] => {
+    const found = new Set<number>();
+    if (ci) {
+      for (const m of text.toLowerCase().matchAll(ci)) {
+        found.add(data.lookup.ci[m[0]]);
+      }
+    }
+    if (cs) {
+      for (const m of text.matchAll(cs)) {
+        found.add(data.lookup.cs[m[0]]);
+      }
+    }
+    return [...found].sort((a, b) => a - b);
+  };
+
+  const match = (text: string) => matchedIndexes(text).map((i) => data.entities[i]);
+
+  const companyIds = (text: string) => {
+    const companies = new Set(match(text).map((entity) => indexById.get(entity.company) ?? -1));
+    return [...companies]
+      .filter((i) => i >= 0)
+      .sort((a, b) => a - b)
+      .map((i) => data.entities[i].id);
+  };
+
+  return {
+    entities: data.entities,
+    companies: data.entities.filter((entity) => entity.type === "company"),
+    get: (id: string) => {
+      const i = indexById.get(id);
+      return i === undefined ? undefined : data.entities[i];
+    },
+    match,
+    companyIds,
+  };
+}
+
+export const entityMatcher = loadEntityMatcher(entityMatcherData as EntityMatcherData);
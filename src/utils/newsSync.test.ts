@@ -0,0 +1,95 @@
+import { describe, it, expect } from 'vitest';
+import {
+    applyDelta,
+    syncNews,
+    type CuratedNewsItem,
+    type FetchJson,
+    type NewsDelta,
+    type NewsSnapshot,
+} from './newsSync';
+
+const item = (id: string, summary = 'text'): CuratedNewsItem => ({
+    id,
+    title: `Title ${id}`,
+    source: 'Test',
+    date: '2025-01-01',
+    summary,
+    url: `https://example.com/${id}`,
+});
+
+const v1: NewsSnapshot = { version: 1, hash: 'h1', items: [item('a'), item('b'), item('c')] };
+
+// v1 -> v2: b removed, a updated and moved down, c moved up, d added at the end
+const delta: NewsDelta = {
+    from: 1,
+    to: 2,
+    hash: 'h2',
+    count: 3,
+    added: [{ ...item('d'), rank: 2 }],
+    updated: [{ ...item('a', 'changed'), rank: 1 }],
+    removed: ['b'],
+    reranked: [['c', 0]],
+};
+
+const serve = (files: Record<string, unknown>, requested: string[] = []): FetchJson =>
+    async <T,>(path: string): Promise<T> => {
+        requested.push(path);
+        if (!(path in files)) {
+            throw new Error(`404 ${path}`);
+        }
+        return files[path] as T;
+    };
+
+describe('applyDelta', () => {
+    it('should apply removals, updates, additions and moves', () => {
+        const next = applyDelta(v1, delta);
+        expect(next.version).toBe(2);
+        expect(next.hash).toBe('h2');
+        expect(next.items.map((i) => i.id)).toEqual(['c', 'a', 'd']);
+        expect(next.items[1].summary).toBe('changed');
+        expect(next.items[2]).not.toHaveProperty('rank');
+    });
+
+    it('should reject a delta for another version', () => {
+        expect(() => applyDelta({ ...v1, version: 3 }, delta)).toThrow();
+    });
+
+    it('should reject a delta that leaves gaps in the ranking', () => {
+        expect(() => applyDelta(v1, { ...delta, reranked: [] })).toThrow();
+    });
+});
+
+describe('syncNews', () => {
+    const manifest = { version: 2, hash: 'h2', updatedAt: '2025-01-02T00:00:00', count: 3, deltas: [1] };
+    const full = { version: 2, hash: 'h2', updatedAt: manifest.updatedAt, items: [item('c'), item('a', 'changed'), item('d')] };
+
+    it('should only read the manifest when already current', async () => {
+        const requested: string[] = [];
+        const current = { version: 2, hash: 'h2', items: full.items };
+        const result = await syncNews(current, serve({ '/news/manifest.json': manifest }, requested));
+        expect(result.transfer).toBe('none');
+        expect(requested).toEqual(['/news/manifest.json']);
+    });
+
+    it('should apply the delta when one exists for the held version', async () => {
+        const requested: string[] = [];
+        const files = { '/news/manifest.json': manifest, '/news/delta-1-2.json': delta, '/news/v2.json': full };
+        const result = await syncNews(v1, serve(files, requested));
+        expect(result.transfer).toBe('delta');
+        expect(result.snapshot.items.map((i) => i.id)).toEqual(['c', 'a', 'd']);
+        expect(requested).not.toContain('/news/v2.json');
+    });
+
+    it('should fetch the full list when the held version is too old', async () => {
+        const files = { '/news/manifest.json': manifest, '/news/v2.json': full };
+        const result = await syncNews({ ...v1, version: 0 }, serve(files));
+        expect(result.transfer).toBe('full');
+        expect(result.snapshot).toEqual({ version: 2, hash: 'h2', items: full.items });
+    });
+
+    it('should fall back to the full list when the delta is missing', async () => {
+        const files = { '/news/manifest.json': manifest, '/news/v2.json': full };
+        const result = await syncNews(v1, serve(files));
+        expect(result.transfer).toBe('full');
+    });
+});
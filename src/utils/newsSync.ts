@@ -0,0 +1,140 @@
+/**
+ * Client side of the versioned curated news feed written by
+ * scripts/scraper/src/news_deltas.py.
+ *
+ * public/news/manifest.json names the current version. A client holding an
+ * older version that is still listed in the manifest's `deltas` downloads
+ * only delta-<from>-<to>.json and applies it; anyone else downloads the full
+ * v<version>.json. A client already at the current version only revalidates
+ * the manifest.
+ */
+
+export interface CuratedNewsItem {
+  id: string;
+  title: string;
+  source: string;
+  date: string;
+  summary: string;
+  url: string;
+  category?: string;
+  companyTags?: string[];
+}
+
+export type RankedNewsItem = CuratedNewsItem & { rank: number };
+
+export interface NewsManifest {
+  version: number;
+  hash: string;
+  updatedAt: string;
+  count: number;
+  deltas: number[];
+}
+
+export interface NewsDelta {
+  from: number;
+  to: number;
+  hash: string;
+  count: number;
+  added: RankedNewsItem[];
+  updated: RankedNewsItem[];
+  removed: string[];
+  reranked: [string, number][];
+}
+
+export interface NewsSnapshot {
+  version: number;
+  hash: string;
+  items: CuratedNewsItem[];
+}
+
+export type SyncTransfer = "none" | "delta" | "full";
+
+export interface SyncResult {
+  snapshot: NewsSnapshot;
+  transfer: SyncTransfer;
+}
+
+export type FetchJson = <T>(path: string) => Promise<T>;
+
+export const NEWS_BASE_URL = "/news";
+
+export const fetchJson: FetchJson = async <T>(path: string): Promise<T> => {
+  // Revalidate with the CDN: an unchanged file comes back as a 304
+  const response = await fetch(path, { cache: "no-cache" });
+  if (!response.ok) {
+    throw new Error(`HTTP ${response.status} for ${path}`);
+  }
+  return (await response.json()) as T;
+};
+
+function unrank(ranked: RankedNewsItem): { item: CuratedNewsItem; rank: number } {
+  const { rank, ...item } = ranked;
+  return { item, rank };
+}
+
+/**
+ * Apply a delta to the snapshot it was computed from. Throws when the
+ * delta is for another version or the result does not line up.
+ */
+export function applyDelta(snapshot: NewsSnapshot, delta: NewsDelta): NewsSnapshot {
+  if (delta.from !== snapshot.version) {
+    throw new Error(`Delta from version ${delta.from} does not apply to version ${snapshot.version}`);
+  }
+
+  const entries = new Map<string, { item: CuratedNewsItem; rank: number }>();
+  snapshot.items.forEach((item, rank) => entries.set(item.id, { item, rank }));
+
+  for (const id of delta.removed) {
+    entries.delete(id);
+  }
+  for (const [id, rank] of delta.reranked) {
+    const entry = entries.get(id);
+    if (!entry) {
+      throw new Error(`Delta moves unknown item ${id}`);
+    }
+    entries.set(id, { item: entry.item, rank });
+  }
+  for (const ranked of [...delta.added, ...delta.updated]) {
+    entries.set(ranked.id, unrank(ranked));
+  }
+
+  const sorted = [...entries.values()].sort((a, b) => a.rank - b.rank);
+  if (sorted.length !== delta.count || sorted.some((entry, i) => entry.rank !== i)) {
+    throw new Error(`Delta ${delta.from}-${delta.to} did not produce a complete ranking`);
+  }
+
+  return { version: delta.to, hash: delta.hash, items: sorted.map((entry) => entry.item) };
+}
+
+/**
+ * Bring `current` up to the published version with the smallest download.
+ */
+export async function syncNews(
+  current: NewsSnapshot | null,
+  fetcher: FetchJson = fetchJson,
+  baseUrl: string = NEWS_BASE_URL
+): Promise<SyncResult> {
+  const manifest = await fetcher<NewsManifest>(`${baseUrl}/manifest.json`);
+
+  if (current && current.version === manifest.version && current.hash === manifest.hash) {
+    return { snapshot: current, transfer: "none" };
+  }
+
+  if (current && manifest.deltas.includes(current.version)) {
+    try {
+      const delta = await fetcher<NewsDelta>(`${baseUrl}/delta-${current.version}-${manifest.version}.json`);
+      const snapshot = applyDelta(current, delta);
+      if (snapshot.hash === manifest.hash) {
+        return { snapshot, transfer: "delta" };
+      }
+    } catch {
+      // Fall back to the full list
+    }
+  }
+
+  const full = await fetcher<NewsSnapshot>(`${baseUrl}/v${manifest.version}.json`);
+  return {
+    snapshot: { version: full.version, hash: full.hash, items: full.items },
+    transfer: "full",
+  };
+}
@@ -0,0 +1,53 @@
+import { describe, it, expect } from 'vitest';
+import { createTokenizer, loadSearchIndex, type SearchIndexData } from './searchIndex';
+
+const phrases: [string, string][] = [
+    ['ground truth ag', 'ground_truth'],
+    ['eyefoss', 'foss'],
+    ['foss', 'foss'],
+];
+
+const doc = (title: string) => ({ title, source: 'Test', date: '2025-01-01', url: `https://example.com/${title}`, text: '' });
+
+const index: SearchIndexData = {
+    version: 1,
+    scale: 0.01,
+    phrases,
+    stopwords: ['the', 'of'],
+    terms: ['foss', 'ground_truth', 'wheat'],
+    // doc gaps and weights: foss -> docs 0, 2; ground_truth -> doc 1; wheat -> docs 1, 2
+    postings: [[0, 200, 2, 50], [1, 255], [1, 10, 1, 100]],
+    docs: [doc('a'), doc('b'), doc('c')],
+};
+
+describe('createTokenizer', () => {
+    const tokenize = createTokenizer(phrases, ['the', 'of']);
+
+    it('should fold company and product names into the company token', () => {
+        expect(tokenize('Ground Truth Ag and the EyeFoss')).toEqual(['ground_truth', 'and', 'foss']);
+    });
+
+    it('should fold plurals like the Python tokenizer', () => {
+        expect(tokenize('analyzers studies grass')).toEqual(['analyzer', 'study', 'grass']);
+    });
+
+    it('should treat accented letters as word characters like the Python tokenizer', () => {
+        expect(tokenize('Bühler sorters in São Paulo')).toEqual(['bühler', 'sorter', 'in', 'são', 'paulo']);
+        expect(tokenize('ÉyeFoss and eyefossé')).toEqual(['éyefoss', 'and', 'eyefossé']);
+    });
+});
+
+describe('loadSearchIndex', () => {
+    const { search } = loadSearchIndex(index);
+
+    it('should rank documents by summed quantized weights', () => {
+        const hits = search('foss wheat');
+        expect(hits.map((h) => h.doc.title)).toEqual(['a', 'c', 'b']);
+        expect(hits[1].score).toBeCloseTo(1.5);
+    });
+
+    it('should limit results to k and ignore unknown terms', () => {
+        expect(search('ground truth ag wheat', 1).map((h) => h.doc.title)).toEqual(['b']);
+        expect(search('unknownterm')).toEqual([]);
+    });
+});
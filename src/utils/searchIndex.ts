@@ -0,0 +1,127 @@
+/**
+ * Query side of the BM25 search index built by scripts/scraper/src/search_index.py.
+ *
+ * The artifact stores pre-quantized BM25 weights per posting, so scoring a
+ * query is an integer sum per document. The tokenizer must stay in step with
+ * the Python one; the company phrase table and stopwords come from the
+ * artifact itself. Word characters are Unicode letters, numbers and "_"
+ * (Python's `\w`), and lengths count code points as Python's len() does.
+ */
+
+export interface SearchDoc {
+  title: string;
+  source: string;
+  date: string;
+  url: string;
+  text: string;
+}
+
+export interface SearchIndexData {
+  version: number;
+  scale: number;
+  phrases: [string, string][];
+  stopwords: string[];
+  terms: string[];
+  postings: number[][];
+  docs: SearchDoc[];
+}
+
+export interface SearchHit {
+  doc: SearchDoc;
+  score: number;
+}
+
+export interface SearchIndex {
+  tokenize: (text: string) => string[];
+  search: (query: string, k?: number) => SearchHit[];
+}
+
+const TOKEN_RE = /[\p{L}\p{N}_]+/gu;
+
+// Phrase boundaries, as (?<!\w) and (?!\w) in the Python tokenizer
+const NOT_WORD_BEFORE = "(?<![\\p{L}\\p{N}_])";
+const NOT_WORD_AFTER = "(?![\\p{L}\\p{N}_])";
+
+function escapeRegExp(value: string): string {
+  return value.replace(/[.*+?^${}()|[\]\\]/g, "\\$&");
+}
+
+function codePoints(token: string): number {
+  return [...token].length;
+}
+
+function stem(token: string): string {
+  const length = codePoints(token);
+  if (length > 4 && token.endsWith("ies")) {
+    return `${token.slice(0, -3)}y`;
+  }
+  if (length > 3 && token.endsWith("s") && !token.endsWith("ss")) {
+    return token.slice(0, -1);
+  }
+  return token;
+}
+
+export function createTokenizer(
+  phrases: [string, string][],
+  stopwords: string[]
+): (text: string) => string[] {
+  const phraseTokens = new Map(phrases);
+  const companyTokens = new Set(phraseTokens.values());
+  const stop = new Set(stopwords);
+  const phraseRe = phrases.length
+    ? new RegExp(
+        `${NOT_WORD_BEFORE}(?:${phrases.map(([alias]) => escapeRegExp(alias)).join("|")})${NOT_WORD_AFTER}`,
+        "gu"
+      )
+    : null;
+
+  return (text: string) => {
+    let lower = text.toLowerCase();
+    if (phraseRe) {
+      lower = lower.replace(phraseRe, (match) => ` ${phraseTokens.get(match)} `);
+    }
+    const tokens: string[] = [];
+    for (const token of lower.match(TOKEN_RE) ?? []) {
+      if (stop.has(token) || codePoints(token) < 2) {
+        continue;
+      }
+      tokens.push(companyTokens.has(token) ? token : stem(token));
+    }
+    return tokens;
+  };
+}
+
+export function loadSearchIndex(data: SearchIndexData): SearchIndex {
+  const tokenize = createTokenizer(data.phrases, data.stopwords);
+  const termIds = new Map(data.terms.map((term, i) => [term, i]));
+
+  const search = (query: string, k = 5): SearchHit[] => {
+    const scores = new Map<number, number>();
+    for (const term of new Set(tokenize(query))) {
+      const termId = termIds.get(term);
+      if (termId === undefined) {
+        continue;
+      }
+      // Postings are [doc gap, weight, doc gap, weight, ...]
+      const postings = data.postings[termId];
+      let docId = 0;
+      for (let i = 0; i < postings.length; i += 2) {
+        docId += postings[i];
+        scores.set(docId, (scores.get(docId) ?? 0) + postings[i + 1]);
+      }
+    }
+
+    return [...scores.entries()]
+      .sort((a, b) => b[1] - a[1] || a[0] - b[0])
+      .slice(0, k)
+      .map(([docId, score]) => ({ doc: data.docs[docId], score: score * data.scale }));
+  };
+
+  return { tokenize, search };
+}
+
+export function formatPassages(hits: SearchHit[]): string {
+  return hits
+    .map(({ doc }, i) => `[${i + 1}] ${doc.title} (${doc.source}, ${doc.date})\n${doc.text}\n${doc.url}`)
+    .join("\n\n");
+}
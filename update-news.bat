@@ -14,22 +14,13 @@ if exist "scripts\scraper\venv\Scripts\activate.bat" (
     call scripts\scraper\venv\Scripts\activate.bat
 )
 
-REM Run the scout agent to fetch news
+REM Run scout, dedup, curation and transform in one process
 echo.
-echo [1/2] Running Scout Agent...
+echo Running news pipeline...
 cd scripts\scraper
-python -m src.agents.scout
+python -m src.pipeline
 if %ERRORLEVEL% NEQ 0 (
-    echo ERROR: Scout agent failed
-    exit /b 1
-)
-
-REM Transform to curated format
-echo.
-echo [2/2] Transforming to curated format...
-python src\transform_to_curated.py
-if %ERRORLEVEL% NEQ 0 (
-    echo ERROR: Transform failed
+    echo ERROR: News pipeline failed
     exit /b 1
 )
 